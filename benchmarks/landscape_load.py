@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import argparse
+import os
+import tempfile
+import time
+
+## third party modules
+import ruamel.yaml
+
+from lfx_landscape_tools.landscapedocument import LandscapeDocument
+
+#
+# Compares the read-only ( safe ) and round-trip loads of a large synthetic landscape.yml
+#
+# Run with 'python -m benchmarks.landscape_load' from the top of the repo; install ruamel.yaml.clib to have the
+# read-only load use libyaml.
+#
+
+def generate(filename, items: int, categories: int):
+    subcategoriesPerCategory = 5
+    landscape = {'landscape': []}
+    for c in range(categories):
+        category = {'category': None, 'name': 'Category {}'.format(c), 'subcategories': []}
+        for s in range(subcategoriesPerCategory):
+            category['subcategories'].append({'subcategory': None, 'name': 'Subcategory {}'.format(s), 'items': []})
+        landscape['landscape'].append(category)
+    for i in range(items):
+        category = landscape['landscape'][i % categories]
+        category['subcategories'][( i // categories ) % subcategoriesPerCategory]['items'].append({
+            'item': None,
+            'name': 'Project {}'.format(i),
+            'description': 'Synthetic project {} for benchmarking the landscape load, with a description about as long as a real one.'.format(i),
+            'homepage_url': 'https://project-{}.example.org'.format(i),
+            'repo_url': 'https://github.com/example/project-{}'.format(i),
+            'logo': 'project-{}.svg'.format(i),
+            'crunchbase': 'https://www.crunchbase.com/organization/linux-foundation',
+            'twitter': 'https://twitter.com/project{}'.format(i),
+            'second_path': ['PMO Managed / All', 'SIG / Category {}'.format(i % 7)],
+            'extra': {
+                'accepted': '2020-01-01',
+                'lfx_slug': 'project-{}'.format(i),
+                'annotations': {'chair': 'Jane Doe'},
+                'other_links': [{'name': 'Calendar', 'url': 'https://zoom-lfx.platform.linuxfoundation.org/meetings/project-{}'.format(i)}],
+            },
+        })
+    ryaml = ruamel.yaml.YAML()
+    ryaml.indent(mapping=2, sequence=4, offset=2)
+    ryaml.width = 1000000
+    with open(filename, 'w', encoding="utf8") as fileobject:
+        ryaml.dump(landscape, fileobject)
+
+def timeLoad(filename, roundTrip: bool, repeat: int):
+    times = []
+    for i in range(repeat):
+        LandscapeDocument.clear()
+        start = time.perf_counter()
+        LandscapeDocument.load(filename, roundTrip=roundTrip)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the read-only and round-trip loads of a large landscape.yml")
+    parser.add_argument("-i", "--items", type=int, default=10000, help="Number of items in the generated landscape")
+    parser.add_argument("-c", "--categories", type=int, default=10, help="Number of categories in the generated landscape")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of times to time each load; the fastest is reported")
+    parser.add_argument("-f", "--file", help="Existing landscape file to load instead of generating one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = args.file
+        if not filename:
+            filename = os.path.join(tmpdir, 'landscape.yml')
+            generate(filename, args.items, args.categories)
+        print("Landscape file '{}' is {:.1f} MB".format(filename, os.path.getsize(filename) / 1048576))
+        print("Read-only load uses the {} parser".format('libyaml' if LandscapeDocument.hasCParser() else 'pure Python'))
+        roundTrip = timeLoad(filename, True, args.repeat)
+        readOnly = timeLoad(filename, False, args.repeat)
+        print("Round-trip load: {:.2f} seconds".format(roundTrip))
+        print("Read-only load:  {:.2f} seconds ({:.1f}x faster)".format(readOnly, roundTrip / readOnly if readOnly else 0))
+
+if __name__ == '__main__':
+    main()
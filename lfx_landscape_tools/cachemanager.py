@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import copy
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+## third party modules
+import requests
+import requests_cache
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.lfxmembers import LFXMembers
+from lfx_landscape_tools.lfxprojects import LFXProjects
+from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+
+#
+# Operations for managing the HTTP cache outside of a build; warming it for a config, reporting what is in it,
+# pruning it, and moving it between machines as a bundle ( a standalone SQLite cache file ).
+#
+class CacheManager:
+
+    def __init__(self, config: Config, session: HTTPSession = None):
+        self.config = config
+        self._session = session
+
+    @property
+    def session(self):
+        if not self._session:
+            self._session = HTTPSession.shared()
+
+        return self._session
+
+    def warm(self):
+        '''
+        Fetch everything a build with this config will need into the cache; member and project listings, parent
+        projects, TAC committees, logos and GitHub orgs. Each source is loaded in parallel.
+        '''
+        logger = logging.getLogger()
+        # items reused from the prior run make no requests for their logos or GitHub orgs, so every item is built
+        config = copy.copy(self.config)
+        config.incrementalSync = False
+        loaders = {
+            'LFX project directory': config.projectDirectory.load,
+            'LFX Members': lambda: LFXMembers(config=config),
+            'LFX Projects': lambda: LFXProjects(config=config),
+        }
+        if config.tacAgendaProjectUrl:
+            loaders['TAC Agenda Project'] = lambda: TACAgendaProject(config=config)
+
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = {name: executor.submit(loader) for name, loader in loaders.items()}
+        warmed = []
+        for name, future in futures.items():
+            try:
+                future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error("Couldn't warm the HTTP cache with {} - error message '{}'".format(name,e))
+            else:
+                logger.info("Warmed the HTTP cache with {}".format(name))
+                warmed.append(name)
+
+        return warmed
+
+    def stats(self):
+        '''
+        Returns the number of entries, their size in bytes and the cache hit ratio for each endpoint in the cache
+        '''
+        stats = {}
+        for key, response in self.session.cache.responses.items():
+            endpoint = stats.setdefault(HTTPSession.endpoint(response.url),{'entries': 0, 'size': 0, 'hits': 0, 'misses': 0, 'hitRatio': None})
+            endpoint['entries'] += 1
+            endpoint['size'] += response.size
+        for name, counts in self.session.endpointStats().items():
+            endpoint = stats.setdefault(name,{'entries': 0, 'size': 0, 'hits': 0, 'misses': 0, 'hitRatio': None})
+            endpoint['hits'] = counts.get('hits',0)
+            endpoint['misses'] = counts.get('misses',0)
+            if endpoint['hits'] + endpoint['misses'] > 0:
+                endpoint['hitRatio'] = endpoint['hits'] / ( endpoint['hits'] + endpoint['misses'] )
+
+        return dict(sorted(stats.items()))
+
+    def prune(self, maxSize: int = None):
+        '''
+        Remove expired responses, and the least recently used until the cache is under maxSize bytes; returns the
+        size of the cache afterwards
+        '''
+        maxSize = maxSize if maxSize else self.config.httpCacheMaxSize
+        if maxSize:
+            return self.session.prune(maxSize)
+
+        self.session.cache.delete(expired=True)
+        return sum(response.size for response in self.session.cache.responses.values())
+
+    def exportBundle(self, filename):
+        '''
+        Write every unexpired response in the cache to a bundle at filename, replacing any existing bundle
+        '''
+        bundle = requests_cache.SQLiteCache(filename)
+        bundle.clear()
+        count = 0
+        for key, response in self.session.cache.responses.items():
+            if response.is_expired:
+                continue
+            bundle.save_response(response, key, response.expires)
+            count += 1
+        bundle.close()
+        logging.getLogger().info("Exported {} responses to '{}'".format(count,filename))
+
+        return count
+
+    def importBundle(self, filename):
+        '''
+        Add the unexpired responses in the bundle at filename to the cache, replacing any already there
+        '''
+        if not os.path.isfile(filename):
+            raise ValueError("Cache bundle '{}' not found".format(filename))
+        bundle = requests_cache.SQLiteCache(filename)
+        count = 0
+        for response in bundle.responses.values():
+            if response.is_expired:
+                continue
+            # keys depend on the backend serializer, so make them for this cache rather than using the bundle's
+            self.session.cache.save_response(response, self.session.cache.create_key(response.request), response.expires)
+            count += 1
+        bundle.close()
+        logging.getLogger().info("Imported {} responses from '{}'".format(count,filename))
+
+        return count
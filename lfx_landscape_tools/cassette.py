@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import base64
+import gzip
+import json
+import logging
+import threading
+from collections import deque
+
+## third party modules
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from lfx_landscape_tools.httpsession import HTTPSession
+
+#
+# Records every HTTP request and response made during a run to a file ( gzipped if the name ends in '.gz' ), or
+# replays them from that file without touching the network. Requests are intercepted at the transport adapter, so
+# it covers the shared HTTPSession as well as any other requests session. A cached response never reaches the adapter,
+# so while recording the shared session's cache has to be disabled ( as the CLI does ); GitHub lookups go through the
+# shared session for that reason.
+#
+# In replay, a request is matched by method, URL and body; repeated requests get the recorded responses in order,
+# with the last one reused once they run out. A request that wasn't recorded fails with a ConnectionError.
+#
+class Cassette:
+
+    version = 1
+    # headers describing the encoding of the body on the wire, which doesn't apply to the decoded body recorded
+    skipHeaders = ['Content-Encoding', 'Content-Length', 'Transfer-Encoding']
+
+    _originalSend = None
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.recording = False
+        self.interactions = []
+        self._replays = {}
+        self._lock = threading.Lock()
+
+    def record(self):
+        '''
+        Start recording requests made through requests
+        '''
+        self.recording = True
+        self.interactions = []
+        self._patch(self._recordSend)
+        logging.getLogger().info("Recording HTTP requests to '{}'".format(self.filename))
+
+    def replay(self):
+        '''
+        Start answering requests made through requests from the recording
+        '''
+        self.recording = False
+        self.load()
+        self._patch(self._replaySend)
+        logging.getLogger().info("Replaying {} HTTP requests from '{}'".format(len(self.interactions),self.filename))
+
+    def stop(self):
+        '''
+        Stop intercepting requests, saving the recording if recording
+        '''
+        if Cassette._originalSend is not None:
+            HTTPAdapter.send = Cassette._originalSend
+            Cassette._originalSend = None
+        if self.recording:
+            self.save()
+            self.recording = False
+
+    def load(self):
+        with self._open('rt') as fileobject:
+            cassette = json.load(fileobject)
+        self.interactions = cassette.get('interactions',[])
+        self._replays = {}
+        for interaction in self.interactions:
+            self._replays.setdefault(self._key(interaction['request']),deque()).append(interaction)
+
+    def save(self):
+        with self._lock:
+            interactions = list(self.interactions)
+        with self._open('wt') as fileobject:
+            json.dump({'version': self.version, 'interactions': interactions}, fileobject)
+        logging.getLogger().info("Recorded {} HTTP requests to '{}'".format(len(interactions),self.filename))
+
+    def _open(self, mode):
+        if self.filename.endswith('.gz'):
+            return gzip.open(self.filename, mode, encoding='utf-8')
+
+        return open(self.filename, mode, encoding='utf-8')
+
+    def _patch(self, send):
+        if Cassette._originalSend is None:
+            Cassette._originalSend = HTTPAdapter.send
+        def patchedSend(adapter, request, **kwargs):
+            return send(adapter, request, **kwargs)
+        HTTPAdapter.send = patchedSend
+
+    def _recordSend(self, adapter, request, **kwargs):
+        interaction = {'request': self._encodeRequest(request)}
+        try:
+            response = Cassette._originalSend(adapter, request, **kwargs)
+            interaction['response'] = {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': {name: value for name, value in response.headers.items() if name not in self.skipHeaders},
+                'body': self._encodeBody(response.content)
+            }
+        except requests.exceptions.RequestException as e:
+            interaction['error'] = {'type': type(e).__name__, 'message': str(e)}
+            raise
+        finally:
+            with self._lock:
+                self.interactions.append(interaction)
+
+        return response
+
+    def _replaySend(self, adapter, request, **kwargs):
+        key = self._key(self._encodeRequest(request))
+        with self._lock:
+            replays = self._replays.get(key)
+            if not replays:
+                raise requests.exceptions.ConnectionError("'{} {}' is not in the cassette '{}'".format(request.method,request.url,self.filename), request=request)
+            interaction = replays.popleft() if len(replays) > 1 else replays[0]
+
+        if 'error' in interaction:
+            raise getattr(requests.exceptions,interaction['error']['type'],requests.exceptions.ConnectionError)(interaction['error']['message'], request=request)
+
+        response = requests.Response()
+        response.status_code = interaction['response']['status']
+        response.reason = interaction['response']['reason']
+        response.headers = CaseInsensitiveDict(interaction['response']['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self._decodeBody(interaction['response']['body'])
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = adapter
+
+        return response
+
+    def _encodeRequest(self, request):
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        return {'method': request.method, 'url': request.url, 'body': self._encodeBody(body) if body else None}
+
+    def _key(self, request):
+        return (request['method'], HTTPSession.createKey(requests.Request(request['method'],request['url'])), json.dumps(request['body']))
+
+    def _encodeBody(self, body: bytes):
+        try:
+            return {'text': body.decode('utf-8')}
+        except UnicodeDecodeError:
+            return {'base64': base64.b64encode(body).decode('ascii')}
+
+    def _decodeBody(self, body: dict):
+        if 'base64' in body:
+            return base64.b64decode(body['base64'])
+
+        return body.get('text','').encode('utf-8')
@@ -13,9 +13,16 @@ from lfx_landscape_tools.landscapemembers import LandscapeMembers
 from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.cachemanager import CacheManager
+from lfx_landscape_tools.deadline import Deadline
+from lfx_landscape_tools.cassette import Cassette
+from lfx_landscape_tools.fakeprojectservice import FakeProjectService
+from lfx_landscape_tools.sourceregistry import SourceRegistry
+from lfx_landscape_tools.mergepipeline import MergePipeline
 
 from datetime import datetime
-from argparse import ArgumentParser,FileType
+from argparse import ArgumentParser,FileType,ArgumentTypeError
 import os
 import subprocess
 from os import path
@@ -26,6 +33,8 @@ class Cli:
 
     _starttime = None
     _defaultconfigfile = 'config.yml'
+    _cassette = None
+    _httpCacheUsed = False
 
     def __init__(self):
         self._starttime = datetime.now()
@@ -35,6 +44,19 @@ class Cli:
         parser.add_argument("-l", "--log", dest="loglevel", default="error", choices=['debug', 'info', 'warning', 'error', 'critical'], help="logging level")
         parser.add_argument("-v", "--verbose", dest="verbose", action='store_true', help="Verbose output (i.e. show all INFO level messages in addition to WARN and above - equivalent to `--log info`)")
         parser.add_argument("--logfile", dest="logfile", default='debug.log', help="Name for the log file to save (default is debug.log")
+        parser.add_argument("--cache-backend", dest="cachebackend", choices=['sqlite', 'filesystem', 'memory'], help="HTTP cache backend (overrides httpCacheBackend in the config file)")
+        parser.add_argument("--cache-location", dest="cachelocation", help="HTTP cache file or directory name (overrides httpCacheLocation in the config file)")
+        parser.add_argument("--cache-expire-after", dest="cacheexpireafter", action='append', type=self._expire_after, metavar="PATTERN=SECONDS", help="Expire cached responses for URLs matching PATTERN after SECONDS; -1 never expires, 0 doesn't cache ( can be repeated )")
+        parser.add_argument("--cache-max-size", dest="cachemaxsize", type=int, help="Maximum HTTP cache size in bytes; least recently used responses are evicted at the end of the run")
+        parser.add_argument("--no-cache-wal", dest="cachewal", action='store_false', default=None, help="Don't use SQLite WAL mode for the HTTP cache")
+        cassette_group = parser.add_mutually_exclusive_group()
+        cassette_group.add_argument("--record", dest="record", metavar="FILE", help="Record every HTTP request and response made during the run to FILE ( gzipped if it ends in .gz )")
+        cassette_group.add_argument("--replay", dest="replay", metavar="FILE", help="Answer every HTTP request from a recording made with --record, without using the network")
+        parser.add_argument("--deadline", dest="deadline", type=float, help="Seconds the run should finish within; optional work ( logos, GitHub org lookups, other project memberships ) is skipped as the deadline nears")
+        parser.add_argument("--lfx-api-base-url", dest="lfxapibaseurl", metavar="URL", help="Send LFX project-service requests to URL instead ( i.e. a local fake_project_service )")
+        parser.add_argument("--full-sync", dest="incrementalsync", action='store_false', default=None, help="Rebuild every item, rather than reusing those whose LFX record is unchanged since the last run")
+        parser.add_argument("--gc", dest="hostedlogosgc", action='store_true', default=None, help="Delete hosted logos no longer referenced in the landscape file after building it")
+        parser.add_argument("--stale-while-revalidate", dest="stalewhilerevalidate", action='store_true', default=None, help="Use stale cached responses straight away and refresh them in the background")
         subparsers = parser.add_subparsers(help='sub-command help')
         
         buildlandscapemembers_parser = subparsers.add_parser("build_members", help="Replace current members with latest from LFX")
@@ -63,6 +85,26 @@ class Cli:
         maketextlogo_parser.add_argument("-o", "--output", dest="filename", help="Filename to save created logo to")
         maketextlogo_parser.set_defaults(func=self.maketextlogo)
 
+        cache_parser = subparsers.add_parser("cache", help="Manage the HTTP cache")
+        cache_parser.add_argument("operation", choices=['warm', 'stats', 'prune', 'export', 'import'], help="warm the cache with everything the config needs, show cache stats per endpoint, prune the cache, or export/import a cache bundle")
+        cache_parser.add_argument("-c", "--config", dest="configfile", default=self._defaultconfigfile, type=FileType('r'), help="name of YAML config file")
+        cache_parser.add_argument("-f", "--file", dest="bundle", default='http_cache_bundle.sqlite', help="cache bundle file to export to or import from")
+        cache_parser.add_argument("--max-size", dest="maxsize", type=int, help="maximum cache size in bytes when pruning")
+        cache_parser.set_defaults(func=self.cache)
+
+        fakeprojectservice_parser = subparsers.add_parser("fake_project_service", help="Serve synthetic LFX project-service data locally for load testing")
+        fakeprojectservice_parser.add_argument("--host", dest="host", default="127.0.0.1", help="host to listen on")
+        fakeprojectservice_parser.add_argument("-p", "--port", dest="port", default=8080, type=int, help="port to listen on")
+        fakeprojectservice_parser.add_argument("--slug", dest="slug", default=FakeProjectService.slug, help="slug of the foundation the members belong to")
+        fakeprojectservice_parser.add_argument("--projects", dest="projects", default=FakeProjectService.projects, type=int, help="number of projects")
+        fakeprojectservice_parser.add_argument("--members", dest="members", default=FakeProjectService.members, type=int, help="number of members")
+        fakeprojectservice_parser.add_argument("--autojoin-projects", dest="autojoinprojects", default=FakeProjectService.autoJoinProjects, type=int, help="number of projects with autojoin enabled")
+        fakeprojectservice_parser.add_argument("--latency", dest="latency", default=FakeProjectService.latency, type=float, help="seconds to delay each response by ( +/- 50%% )")
+        fakeprojectservice_parser.add_argument("--error-rate", dest="errorrate", default=FakeProjectService.errorRate, type=float, help="fraction of requests to fail with a 503")
+        fakeprojectservice_parser.add_argument("--seed", dest="seed", default=FakeProjectService.seed, type=int, help="seed for the synthetic data and injected latency and errors")
+        fakeprojectservice_parser.add_argument("--no-logos", dest="logos", action='store_false', help="don't give projects and members logos")
+        fakeprojectservice_parser.set_defaults(func=self.fakeprojectservice)
+
         validate_parser = subparsers.add_parser("validatedata", help="Validate landscape data file")
         validate_parser.add_argument("filename", help="Landscape data file name", default="landscape.yml")
         validate_parser.set_defaults(func=self.validatedata)
@@ -88,12 +130,34 @@ class Cli:
             handlers=handlers
         )
 
+        if args.record or args.replay:
+            self._cassette = Cassette(args.record if args.record else args.replay)
+            if args.record:
+                self._cassette.record()
+            else:
+                self._cassette.replay()
+            self._disableCacheForCassette()
+
         try:
             args.func(args)
         except AttributeError as e:
             logging.getLogger().debug(e)
             parser.print_help()
+        finally:
+            # save the recording even if the run fails, as that's often the run that needs reproducing
+            if self._cassette:
+                self._cassette.stop()
         
+        # only the commands using the HTTP cache set it up; the others shouldn't create or scan it
+        if self._httpCacheUsed:
+            try:
+                HTTPSession.shared().prune()
+                HTTPSession.shared().saveStats()
+            except Exception as e:
+                logging.getLogger().warning("Couldn't prune the HTTP cache - error message '{}'".format(e))
+            logging.getLogger().info(HTTPSession.shared().summary())
+        if Deadline.shared().summary():
+            logging.getLogger().warning(Deadline.shared().summary())
         logging.getLogger().info("This took {} seconds".format(datetime.now() - self._starttime))
 
     @staticmethod
@@ -104,50 +168,150 @@ class Cli:
         if os.path.isdir(path):
             return path
         else:
-            raise argparse.ArgumentTypeError(f"readable_dir:{path} is not a valid path")
+            raise ArgumentTypeError(f"readable_dir:{path} is not a valid path")
+
+    def _expire_after(self,option):
+        pattern, _, seconds = option.rpartition('=')
+        try:
+            seconds = int(seconds)
+        except ValueError:
+            seconds = None
+        if not pattern or seconds is None or seconds < -1:
+            raise ArgumentTypeError(f"{option} is not PATTERN=SECONDS, with SECONDS a whole number of seconds or -1")
+
+        return (pattern, seconds)
+
+    def _loadConfig(self,args,view):
+        config = Config(args.configfile,view=view)
+        if args.cachebackend:
+            config.httpCacheBackend = args.cachebackend
+        if args.cachelocation:
+            config.httpCacheLocation = args.cachelocation
+        if args.cacheexpireafter:
+            config.httpCacheExpireAfter = dict(config.httpCacheExpireAfter)
+            for pattern, seconds in args.cacheexpireafter:
+                config.httpCacheExpireAfter[pattern] = seconds
+        if args.cachemaxsize:
+            config.httpCacheMaxSize = args.cachemaxsize
+        if args.cachewal is not None:
+            config.httpCacheWAL = args.cachewal
+        if args.stalewhilerevalidate is not None:
+            config.httpCacheStaleWhileRevalidate = args.stalewhilerevalidate
+        if args.deadline:
+            config.deadline = args.deadline
+        if args.incrementalsync is not None:
+            config.incrementalSync = args.incrementalsync
+        if args.lfxapibaseurl:
+            config.lfxApiBaseURL = args.lfxapibaseurl
+        if args.hostedlogosgc is not None:
+            config.hostedLogosGC = args.hostedlogosgc
+        HTTPSession.configure(config)
+        self._httpCacheUsed = True
+        self._disableCacheForCassette()
+        Deadline.configure(config.deadline)
+
+        return config
+
+    def _disableCacheForCassette(self):
+        # every request needs to reach the cassette, so none can be answered from the cache
+        if self._cassette:
+            HTTPSession.shared().settings.disabled = True
+
+    def _loadItems(self,config,loader,refresh = None):
+        '''
+        Load items using loader; if any were built from stale data, wait for the background refreshes ( for as long
+        as the deadline allows ), and if any brought changed data, rebuild the items affected using refresh ( by
+        default the items' own refresh() )
+        '''
+        items = loader()
+        if not any(member.stale for member in items.members):
+            return items
+
+        session = HTTPSession.shared()
+        session.waitForRefreshes(Deadline.shared().available())
+        if session.refreshedURLs():
+            logging.getLogger().info("Stale data was refreshed in the background; rebuilding the items affected")
+            config.projectDirectory.refresh()
+            items = refresh() if refresh else items.refresh()
+
+        return items
+
+    def _build(self,config,landscapeoutput,items,noun):
+        '''
+        Write the items loaded to the landscape, then save the state for the next run and log the summary
+        '''
+        landscapeoutput.load(members=items)
+        landscapeoutput.save()
+        if config.hostedLogosGC:
+            landscapeoutput.removeUnreferencedLogos()
+        landscapeoutput.saveState()
+        items.saveState()
+        
+        logging.getLogger().info("Successfully processed {} {} and skipped {} {}".format(landscapeoutput.itemsProcessed,noun,landscapeoutput.itemsErrors,noun))
+        logging.getLogger().info("Wrote {} files and skipped {} unchanged files".format(landscapeoutput.filesWritten,landscapeoutput.filesSkipped))
     
     def buildmembers(self,args):
-        config = Config(args.configfile,view='members')
+        config = self._loadConfig(args,view='members')
         landscapeoutput = LandscapeOutput(config=config)
-        landscapeoutput.load(members=LFXMembers(config=config))
-        landscapeoutput.save()
-        
-        logging.getLogger().info("Successfully processed {} members and skipped {} members".format(landscapeoutput.itemsProcessed,landscapeoutput.itemsErrors))
+        items = self._loadItems(config,lambda: LFXMembers(config=config))
+        self._build(config,landscapeoutput,items,'members')
 
     def buildprojects(self,args):
-        config = Config(args.configfile,view='projects')
+        config = self._loadConfig(args,view='projects')
         landscapeoutput = LandscapeOutput(config=config)
-        landscapeoutput.load(members=LFXProjects(config=config))
-        landscapeoutput.save()
-        
-        logging.getLogger().info("Successfully processed {} projects and skipped {} projects".format(landscapeoutput.itemsProcessed,landscapeoutput.itemsErrors))
+        items = self._loadItems(config,lambda: LFXProjects(config=config))
+        self._build(config,landscapeoutput,items,'projects')
 
     def buildlfeuprojects(self,args):
-        config = Config(args.configfile,view='projects')
+        config = self._loadConfig(args,view='projects')
         landscapeoutput = LandscapeOutput(config=config)
-        landscapeoutput.load(members=LFXProjectsEU(config=config))
-        landscapeoutput.save()
-        
-        logging.getLogger().info("Successfully processed {} projects and skipped {} projects".format(landscapeoutput.itemsProcessed,landscapeoutput.itemsErrors))
+        items = self._loadItems(config,lambda: LFXProjectsEU(config=config))
+        self._build(config,landscapeoutput,items,'projects')
     
     def syncprojects(self,args):
-        config = Config(args.configfile,view='projects')
-        items = LFXProjects(config=config)
-        logging.getLogger().info("Overlaying current Landscape data")
-        items.overlay(memberstooverlay=LandscapeMembers(config=config))
-        logging.getLogger().info("Overlaying TAC Agenda Project data")
-        items.overlay(memberstooverlay=TACAgendaProject(config=config))
-        # yes, this is intentional :). This ensures the LFX data is the predominate source of truth
-        logging.getLogger().info("Overlaying LFX Projects data")
-        items.overlay(memberstooverlay=LFXProjects(config=config))
-        # also intentional, to overlay extra field dates where the TAC Agenda is the source of truth
-        logging.getLogger().info("Overlaying TAC Agenda Project data 'extra' field")
-        items.overlay(memberstooverlay=TACAgendaProject(config=config),onlykeys=['extra'])
+        config = self._loadConfig(args,view='projects')
+        # the LFX data is the predominate source of truth, other than the 'extra' field dates where the TAC Agenda
+        # is; see syncMergePrecedence in the config
+        pipeline = MergePipeline(config=config,sources=SourceRegistry(config))
         landscapeoutput = LandscapeOutput(config=config)
-        landscapeoutput.load(members=items)
-        landscapeoutput.save()
-        
-        logging.getLogger().info("Successfully processed {} projects and skipped {} projects".format(landscapeoutput.itemsProcessed,landscapeoutput.itemsErrors))
+        items = self._loadItems(config,pipeline.merge,pipeline.refresh)
+        self._build(config,landscapeoutput,items,'projects')
+
+    def cache(self,args):
+        config = self._loadConfig(args,view='members')
+        cachemanager = CacheManager(config=config)
+        if args.operation == 'warm':
+            warmed = cachemanager.warm()
+            logging.getLogger().info("Warmed the HTTP cache with {}".format(", ".join(warmed)))
+        elif args.operation == 'stats':
+            print("{:<60} {:>8} {:>12} {:>10}".format('Endpoint','Entries','Size','Hit ratio'))
+            for endpoint, stats in cachemanager.stats().items():
+                print("{:<60} {:>8} {:>12} {:>10}".format(endpoint,stats['entries'],stats['size'],'{:.1%}'.format(stats['hitRatio']) if stats['hitRatio'] is not None else '-'))
+        elif args.operation == 'prune':
+            logging.getLogger().info("HTTP cache is now {} bytes".format(cachemanager.prune(args.maxsize)))
+        elif args.operation == 'export':
+            cachemanager.exportBundle(args.bundle)
+        elif args.operation == 'import':
+            cachemanager.importBundle(args.bundle)
+
+        return True
+
+    def fakeprojectservice(self,args):
+        service = FakeProjectService(
+            slug=args.slug,
+            projects=args.projects,
+            members=args.members,
+            autoJoinProjects=args.autojoinprojects,
+            latency=args.latency,
+            errorRate=args.errorrate,
+            seed=args.seed,
+            logos=args.logos
+            )
+        print("Serving LFX project-service for '{}' at http://{}:{}; use --lfx-api-base-url to point runs at it".format(args.slug,args.host,args.port))
+        service.serve(host=args.host,port=args.port)
+        logging.getLogger().info("Served {} requests, injecting {} errors".format(service.requestsServed,service.errorsInjected))
+
+        return True
 
     def maketextlogo(self,args):
         svglogo = SVGLogo(name=args.name)
@@ -13,14 +13,14 @@ import logging
 
 ## third party modules
 import ruamel.yaml
-import requests
-import requests_cache
+
+from lfx_landscape_tools.projectdirectory import ProjectDirectory
 
 class Config:
 
-    project = None
+    _project = None
     view = 'members'
-    slug = None
+    _slug = None
     landscapeMembersCategory = 'Members'
     landscapeMembersSubcategories = [
         {"name": "Premier Membership", "category": "Premier"},
@@ -39,6 +39,12 @@ class Config:
     landscapefile = 'landscape.yml'
     missingcsvfile = 'missing.csv'
     hostedLogosDir = 'hosted_logos'
+    # write hosted logos under the hash of their contents, so identical logos share one file
+    hostedLogosContentAddressed = False
+    # delete hosted logos no longer referenced in the landscape file after building it
+    hostedLogosGC = False
+    # 'full' to rewrite the whole landscape file, or 'splice' to only rewrite the category being built
+    landscapeSaveMode = 'full'
     memberSuffix = ''
     memberUsePublicMembershipLogo = False
     projectsAddTechnologySector = False
@@ -50,18 +56,60 @@ class Config:
     projectsFilterByParentSlug = True
     projectsAssignSIGs = False
     tacAgendaProjectUrl = None
+    tacAgendaProjectClient = 'gh'
+    # source precedence for each field when syncing projects, highest first; see MergePipeline
+    syncMergePrecedence = {
+        '*': ['lfx','tac','landscape'],
+        'extra': ['tac','lfx','landscape'],
+    }
+    # how the sources are loaded together when syncing projects; 'threads', 'asyncio' ( which still loads each source on a thread ) or 'serial'
+    syncLoadMode = 'threads'
     artworkRepoUrl = None
     addOtherProjectMemberships = False
+    lfxApiPageSize = 2000
+    lfxApiPrefetch = 2
+    lfxApiBaseURL = None
+    stateDir = '.lfx_landscape_tools'
+    incrementalSync = True
+    httpCacheBackend = 'sqlite'
+    httpCacheLocation = 'http_cache'
+    httpCacheExpireAfter = {}
+    httpCacheMaxSize = None
+    httpCacheWAL = True
+    httpCacheStaleWhileRevalidate = False
+    httpConnectTimeout = 10
+    httpReadTimeout = 60
+    httpMaxPerHost = 8
+    deadline = None
+    _projectDirectory = None
+    _projectStateFile = None
     
     def __init__(self, config_file: io.TextIOWrapper = None, view = None):
         if config_file:
             data_loaded = ruamel.yaml.YAML(typ='safe', pure=True).load(config_file)
             self.view = view if self._isValidViewOption(view) else Config.view
             self.basedir = data_loaded.get('basedir',os.path.dirname(os.path.normpath(config_file.name)))
-            self.slug = data_loaded.get('slug',self._lookupSlugFromProject(data_loaded.get('project')))
-            self.project = data_loaded.get('project',self._lookupProjectFromSlug(self.slug))
-            if not self.slug or not self.project:
+            self.lfxApiPageSize = data_loaded.get('lfxApiPageSize',Config.lfxApiPageSize)
+            self.lfxApiPrefetch = data_loaded.get('lfxApiPrefetch',Config.lfxApiPrefetch)
+            self.lfxApiBaseURL = data_loaded.get('lfxApiBaseURL',Config.lfxApiBaseURL)
+            self.stateDir = data_loaded.get('stateDir',Config.stateDir)
+            self.incrementalSync = data_loaded.get('incrementalSync',Config.incrementalSync)
+            self.httpCacheBackend = data_loaded.get('httpCacheBackend',Config.httpCacheBackend)
+            self.httpCacheLocation = data_loaded.get('httpCacheLocation',Config.httpCacheLocation)
+            self.httpCacheExpireAfter = data_loaded.get('httpCacheExpireAfter',Config.httpCacheExpireAfter)
+            self.httpCacheMaxSize = data_loaded.get('httpCacheMaxSize',Config.httpCacheMaxSize)
+            self.httpCacheWAL = data_loaded.get('httpCacheWAL',Config.httpCacheWAL)
+            self.httpCacheStaleWhileRevalidate = data_loaded.get('httpCacheStaleWhileRevalidate',Config.httpCacheStaleWhileRevalidate)
+            self.httpConnectTimeout = data_loaded.get('httpConnectTimeout',Config.httpConnectTimeout)
+            self.httpReadTimeout = data_loaded.get('httpReadTimeout',Config.httpReadTimeout)
+            self.httpMaxPerHost = data_loaded.get('httpMaxPerHost',Config.httpMaxPerHost)
+            self.deadline = data_loaded.get('deadline',Config.deadline)
+            # the one of slug or project not set is resolved lazily, so a fully specified config doesn't need the network
+            self._slug = data_loaded.get('slug')
+            self._project = data_loaded.get('project')
+            if not self._slug and not self._project:
                 raise ValueError("Invalid project specification in config file")
+            self._projectStateFile = os.path.join(self.basedir,self.stateDir,'project.yml')
             self.landscapeProjectsCategory = data_loaded.get('landscapeProjectsCategory',Config.landscapeProjectsCategory)
             self.landscapeProjectsLevels = data_loaded.get('landscapeProjectsLevels',Config.landscapeProjectsLevels)
             self.landscapeProjectsSubcategories = data_loaded.get('landscapeProjectsSubcategories',self._getlandscapeProjectsSubcategoriesFromLevels())
@@ -72,6 +120,9 @@ class Config:
             self.landscapefile = data_loaded.get('landscapefile',Config.landscapefile)
             self.missingcsvfile = data_loaded.get('missingcsvfile',Config.missingcsvfile)
             self.hostedLogosDir = data_loaded.get('hostedLogosDir',Config.hostedLogosDir)
+            self.hostedLogosContentAddressed = data_loaded.get('hostedLogosContentAddressed',Config.hostedLogosContentAddressed)
+            self.hostedLogosGC = data_loaded.get('hostedLogosGC',Config.hostedLogosGC)
+            self.landscapeSaveMode = data_loaded.get('landscapeSaveMode',Config.landscapeSaveMode)
             self.memberSuffix = data_loaded.get('memberSuffix',Config.memberSuffix)
             self.memberUsePublicMembershipLogo = data_loaded.get('memberUsePublicMembershipLogo',Config.memberUsePublicMembershipLogo)
             self.projectsAddTechnologySector = data_loaded.get('projectsAddTechnologySector',Config.projectsAddTechnologySector)
@@ -83,6 +134,9 @@ class Config:
             self.projectsFilterByParentSlug = data_loaded.get('projectsFilterByParentSlug',Config.projectsFilterByParentSlug)
             self.projectsAssignSIGs = data_loaded.get('projectsAssignSIGs',Config.projectsAssignSIGs)
             self.tacAgendaProjectUrl = data_loaded.get('tacAgendaProjectUrl',Config.tacAgendaProjectUrl)
+            self.tacAgendaProjectClient = data_loaded.get('tacAgendaProjectClient',Config.tacAgendaProjectClient)
+            self.syncMergePrecedence = data_loaded.get('syncMergePrecedence',Config.syncMergePrecedence)
+            self.syncLoadMode = data_loaded.get('syncLoadMode',Config.syncLoadMode)
             self.artworkRepoUrl = data_loaded.get('artworkRepoUrl',Config.artworkRepoUrl)
             self.addOtherProjectMemberships = data_loaded.get('addOtherProjectMemberships',Config.addOtherProjectMemberships)
 
@@ -103,27 +157,92 @@ class Config:
         elif self.view == 'members':
             return self.landscapeMembersSubcategories
 
+    @property
+    def slug(self):
+        if not self._slug and self._project:
+            self._resolveProject()
+
+        return self._slug
+
+    @slug.setter
+    def slug(self, slug):
+        self._slug = slug
+
+    @property
+    def project(self):
+        if not self._project and self._slug:
+            self._resolveProject()
+
+        return self._project
+
+    @project.setter
+    def project(self, project):
+        self._project = project
+
+    @property
+    def projectDirectory(self):
+        if self._projectDirectory is None:
+            self._projectDirectory = ProjectDirectory(pageSize=self.lfxApiPageSize,prefetch=self.lfxApiPrefetch)
+
+        return self._projectDirectory
+
+    def _resolveProject(self):
+        '''
+        Resolve whichever of slug or project isn't set, using the pair saved from a prior run if there is one
+        '''
+        saved = self._loadResolvedProject()
+        if saved and ( saved.get('slug') == self._slug or saved.get('project') == self._project ):
+            logging.getLogger().debug("Using saved project '{}' and slug '{}'".format(saved.get('project'),saved.get('slug')))
+            self._slug = saved.get('slug')
+            self._project = saved.get('project')
+            return
+
+        if not self._slug:
+            self._slug = self._lookupSlugFromProject(self._project)
+        else:
+            self._project = self._lookupProjectFromSlug(self._slug)
+        if not self._slug or not self._project:
+            raise ValueError("Invalid project specification in config file")
+
+        self._saveResolvedProject()
+
+    def _loadResolvedProject(self):
+        if not self._projectStateFile or not os.path.isfile(self._projectStateFile):
+            return None
+
+        try:
+            with open(self._projectStateFile, 'r', encoding="utf8") as fileobject:
+                saved = ruamel.yaml.YAML(typ='safe', pure=True).load(fileobject)
+        except (OSError, ruamel.yaml.YAMLError) as e:
+            logging.getLogger().warning("Cannot read saved project file '{}' - error message '{}'".format(self._projectStateFile,e))
+            return None
+
+        return saved if isinstance(saved,dict) else None
+
+    def _saveResolvedProject(self):
+        if not self._projectStateFile:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self._projectStateFile), exist_ok=True)
+            with open(self._projectStateFile, 'w', encoding="utf8") as fileobject:
+                ruamel.yaml.YAML(typ='safe', pure=True).dump({'slug': self._slug, 'project': self._project}, fileobject)
+        except OSError as e:
+            logging.getLogger().warning("Cannot save project file '{}' - error message '{}'".format(self._projectStateFile,e))
+
     def _lookupProjectFromSlug(self, slug):
-        singleSlugEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?slug={}' 
-        session = requests_cache.CachedSession()
-        if slug:
-            with session.get(singleSlugEndpointURL.format(slug)) as endpointResponse:
-                parentProject = endpointResponse.json()
-                if len(parentProject.get('Data')) > 0: 
-                    return parentProject.get('Data')[0].get("ProjectID")
+        project = self.projectDirectory.bySlug(slug)
+        if project:
+            return project.get("ProjectID")
         
         logging.getLogger().warning("Couldn't find project for slug '{}'".format(slug)) 
         
         return None
 
     def _lookupSlugFromProject(self,project):
-        singleProjectEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=projectId%20eq%20{}'
-        session = requests_cache.CachedSession()
-        if project:
-            with session.get(singleProjectEndpointURL.format(project)) as endpointResponse:
-                parentProject = endpointResponse.json()
-                if len(parentProject.get('Data')) > 0: 
-                    return parentProject.get('Data',[])[0].get("Slug")
+        parentProject = self.projectDirectory.byProjectID(project)
+        if parentProject:
+            return parentProject.get("Slug")
         
         logging.getLogger().warning("Couldn't find slug for project '{}'".format(project)) 
         
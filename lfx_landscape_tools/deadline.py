@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+import threading
+import time
+
+#
+# Latency budget for a run. Once less than 'reserve' ( a fraction of the budget ) remains, optional work such as
+# fetching logos, resolving GitHub orgs and looking up other project memberships is skipped, and what was skipped is
+# recorded so the run can report it.
+#
+class Deadline:
+
+    reserve = 0.1
+
+    _shared = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, seconds: float = None, reserve: float = None):
+        self.seconds = seconds
+        self.reserve = reserve if reserve is not None else self.reserve
+        self.started = time.monotonic()
+        self._skipped = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        '''
+        Returns the deadline for this run; without one set, there is no limit
+        '''
+        with cls._sharedLock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+        return cls._shared
+
+    @classmethod
+    def configure(cls, seconds: float = None):
+        '''
+        Start the deadline for this run, replacing any prior one
+        '''
+        with cls._sharedLock:
+            cls._shared = cls(seconds)
+
+    def remaining(self):
+        '''
+        Returns the seconds left before the deadline, or None if there isn't one
+        '''
+        if self.seconds is None:
+            return None
+
+        return self.seconds - ( time.monotonic() - self.started )
+
+    def available(self):
+        '''
+        Returns the seconds left for optional work before the reserve kept back for required work, or None if there
+        isn't a deadline
+        '''
+        if self.seconds is None:
+            return None
+
+        return max(0, self.remaining() - self.seconds * self.reserve)
+
+    def nearing(self):
+        '''
+        Returns True once the time left is within the reserve kept back for required work
+        '''
+        return self.seconds is not None and self.remaining() < self.seconds * self.reserve
+
+    def allows(self, work, item):
+        '''
+        Returns True if there is time for optional work on item; otherwise records it as skipped
+
+        Keyword arguments:
+        work -- kind of optional work ( i.e. 'logos' )
+        item -- what the work is for, used in the report of what was skipped
+        '''
+        if not self.nearing():
+            return True
+
+        self.skip(work,item)
+
+        return False
+
+    def skip(self, work, item):
+        '''
+        Record optional work on item as skipped to meet the deadline
+        '''
+        with self._lock:
+            if not self._skipped:
+                logging.getLogger().warning("Less than {:.0f} seconds left before the deadline; skipping optional work".format(self.seconds * self.reserve))
+            self._skipped.setdefault(work,[]).append(item)
+
+    @property
+    def skipped(self):
+        with self._lock:
+            return {work: list(items) for work, items in self._skipped.items()}
+
+    def summary(self):
+        '''
+        Returns a report of the optional work skipped to meet the deadline, or None if nothing was skipped
+        '''
+        skipped = self.skipped
+        if not skipped:
+            return None
+
+        return "Skipped to meet the {} second deadline: {}".format(self.seconds,"; ".join("{} ({}) - {}".format(work,len(items),", ".join(str(item) for item in items)) for work, items in skipped.items()))
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+
+#
+# Local stand-in for the LFX project-service endpoints this tool uses ( the project listing and slug, project ID,
+# parent slug, autojoin and legal parent lookups, project members, and committee members ), serving synthetic data
+# at a configurable scale along with an SVG logo for every project and member. Point a run at it with the
+# lfxApiBaseURL config option ( or --lfx-api-base-url ) to load test end to end without the real API.
+#
+# Each response is delayed by latency seconds ( +/- 50% ), and errorRate of them fail with a 503.
+#
+class FakeProjectService:
+
+    slug = 'fake-foundation'
+    projects = 500
+    members = 5000
+    autoJoinProjects = 3
+    latency = 0
+    errorRate = 0
+    seed = 0
+    logos = True
+    membershipLevels = ['Premier Membership', 'General Membership']
+    projectCategories = ['Active', 'Incubation', 'Sandbox']
+
+    def __init__(self, slug = None, projects: int = None, members: int = None, autoJoinProjects: int = None, latency: float = None, errorRate: float = None, seed: int = None, logos: bool = None):
+        self.slug = slug if slug else self.slug
+        self.projects = projects if projects is not None else self.projects
+        self.members = members if members is not None else self.members
+        self.autoJoinProjects = autoJoinProjects if autoJoinProjects is not None else self.autoJoinProjects
+        self.latency = latency if latency is not None else self.latency
+        self.errorRate = errorRate if errorRate is not None else self.errorRate
+        self.seed = seed if seed is not None else self.seed
+        self.logos = logos if logos is not None else self.logos
+        self.baseURL = None
+        self.requestsServed = 0
+        self.errorsInjected = 0
+        self._random = random.Random(self.seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._bodies = {}
+
+    def start(self, host = '127.0.0.1', port: int = 0):
+        '''
+        Start serving in a background thread; returns the base URL to use for lfxApiBaseURL
+        '''
+        self._bind(host, port)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self.baseURL
+
+    def serve(self, host = '127.0.0.1', port: int = 8080):
+        '''
+        Serve until interrupted
+        '''
+        self._bind(host, port)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        '''
+        Stop serving
+        '''
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def handle(self, path, headers = None):
+        '''
+        Returns the status, headers and body for a GET of path ( including any query string )
+        '''
+        with self._lock:
+            self.requestsServed += 1
+            delay = self.latency * self._random.uniform(0.5, 1.5) if self.latency else 0
+            fail = self.errorRate and self._random.random() < self.errorRate
+            if fail:
+                self.errorsInjected += 1
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return 503, {'Content-Type': 'application/json'}, json.dumps({'Message': 'Injected error'}).encode('utf-8')
+
+        with self._lock:
+            cached = self._bodies.get(path)
+        if cached is None:
+            try:
+                contentType, body = self._route(path)
+            except LookupError as e:
+                return 404, {'Content-Type': 'application/json'}, json.dumps({'Message': str(e)}).encode('utf-8')
+            cached = (contentType, body, '"{}"'.format(hashlib.sha1(body).hexdigest()))
+            with self._lock:
+                self._bodies[path] = cached
+        contentType, body, etag = cached
+        if headers and headers.get('If-None-Match') == etag:
+            return 304, {'ETag': etag}, b''
+
+        return 200, {'Content-Type': contentType, 'ETag': etag}, body
+
+    def _bind(self, host, port):
+        self._server = ThreadingHTTPServer((host, port), FakeProjectServiceHandler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        self.baseURL = 'http://{}:{}'.format(host, self._server.server_address[1])
+        self._generate()
+        logging.getLogger().info("Serving {} projects and {} members at '{}'".format(len(self._projectRecords),len(self._memberRecords),self.baseURL))
+
+    def _route(self, path):
+        url = urlsplit(path)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+        parts = url.path.strip('/').split('/')
+        if parts[:3] == ['v1', 'public', 'projects'] and len(parts) == 3:
+            return 'application/json', self._page(self._findProjects(query), query)
+        if parts[:3] == ['v1', 'public', 'projects'] and len(parts) == 5 and parts[4] == 'members':
+            return 'application/json', json.dumps(self._projectMembers(parts[3])).encode('utf-8')
+        if parts[:3] == ['v2', 'public', 'projects'] and len(parts) == 7 and parts[4] == 'committees' and parts[6] == 'members':
+            return 'application/json', self._page(self._committeeMembers(parts[3], parts[5]), query)
+        if parts[0] == 'logos' and len(parts) == 3:
+            return 'image/svg+xml', self._logo(parts[2]).encode('utf-8')
+
+        raise LookupError("No route for '{}'".format(url.path))
+
+    def _findProjects(self, query):
+        records = self._projectRecords
+        for name, value in query.items():
+            if name == 'slug':
+                records = [record for record in records if record['Slug'] == value]
+            elif name == 'autoJoinEnabled':
+                records = [record for record in records if record['AutoJoinEnabled'] == ( value == 'true' )]
+            elif name == 'legalParentName':
+                records = [record for record in records if record['LegalParentName'] == value]
+            elif name == '$filter':
+                field, _, value = value.partition(' eq ')
+                if field == 'parentSlug' and value:
+                    records = [record for record in records if record.get('ParentSlug') == value]
+                elif field == 'projectId':
+                    records = [record for record in records if record['ProjectID'] == value]
+
+        return records
+
+    def _page(self, records, query):
+        offset = int(query.get('offset', 0))
+        pageSize = int(query.get('pageSize', len(records) or 1))
+
+        return json.dumps({'Data': records[offset:offset + pageSize], 'Metadata': {'Offset': offset, 'PageSize': pageSize, 'TotalSize': len(records)}}).encode('utf-8')
+
+    def _projectMembers(self, project):
+        record = self._projectsBySlug.get(project, self._projectsByID.get(project))
+        if record is None:
+            raise LookupError("Project '{}' not found".format(project))
+        if record['Slug'] == self.slug:
+            return self._memberRecords
+        if not record['AutoJoinEnabled']:
+            return []
+
+        # every autojoin project has a share of the foundation's members
+        step = self._autoJoinSlugs.index(record['Slug']) + 2
+        return [dict(member, ProjectName=record['Name']) for member in self._memberRecords[::step]]
+
+    def _committeeMembers(self, projectID, committeeID):
+        if projectID not in self._projectsByID:
+            raise LookupError("Project '{}' not found".format(projectID))
+        committeeRandom = random.Random('{}/{}/{}'.format(self.seed, projectID, committeeID))
+        roles = ['Chair', 'Vice Chair', 'TAC/TOC Representative', 'None', 'None']
+
+        return [{'FirstName': 'first{}'.format(committeeRandom.randrange(100000)), 'LastName': 'last{}'.format(committeeRandom.randrange(100000)), 'Role': role} for role in roles if role != 'None']
+
+    def _logo(self, name):
+        colour = hashlib.sha1(name.encode('utf-8')).hexdigest()[:6]
+
+        return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><rect width="100" height="100" fill="#{}"/><circle cx="50" cy="50" r="30" fill="#ffffff"/></svg>'.format(colour)
+
+    def _generate(self):
+        dataRandom = random.Random(self.seed)
+        root = {
+            'ProjectID': 'fake{:014d}'.format(0),
+            'Name': 'Fake Foundation',
+            'Slug': self.slug,
+            'Status': 'Active',
+            'Model': ['Membership'],
+            'AutoJoinEnabled': False,
+            'LegalParentName': 'The Linux Foundation',
+            'DisplayOnWebsite': True,
+        }
+        self._projectRecords = [root]
+        self._autoJoinSlugs = []
+        groups = [self.slug]
+        for i in range(1, self.projects + 1):
+            slug = 'project-{}'.format(i)
+            record = {
+                'ProjectID': 'fake{:014d}'.format(i),
+                'Name': 'Project {}'.format(i),
+                'Slug': slug,
+                'ParentSlug': dataRandom.choice(groups),
+                'Description': 'Synthetic project {} for load testing'.format(i),
+                'Status': 'Active' if dataRandom.random() < 0.95 else 'Archived',
+                'Category': dataRandom.choice(self.projectCategories),
+                'Model': ['Membership'] if i % 50 == 0 else [],
+                'DisplayOnWebsite': True,
+                'TestRecord': False,
+                'AutoJoinEnabled': len(self._autoJoinSlugs) < self.autoJoinProjects and i % 50 == 0,
+                'LegalParentName': 'Linux Foundation Europe' if i % 10 == 0 else 'The Linux Foundation',
+                'Website': 'https://{}.example.org'.format(slug),
+                'RepositoryURL': 'https://github.com/fake-foundation/{}'.format(slug),
+                'PrimaryOpenSourceLicense': 'Apache-2.0',
+                'StartDate': '20{:02d}-01-01'.format(10 + i % 15),
+                'IndustrySector': '',
+                'TechnologySector': '',
+                'HasProgramManager': i % 3 == 0,
+                'ProjectLogo': self._logoURL('projects', slug),
+            }
+            if record['AutoJoinEnabled']:
+                self._autoJoinSlugs.append(slug)
+            if record['Model']:
+                # projects with a membership model are project groups other projects can be under
+                groups.append(slug)
+            self._projectRecords.append(record)
+        self._projectRecords.sort(key=lambda record: record['Name'])
+        self._projectsBySlug = {record['Slug']: record for record in self._projectRecords}
+        self._projectsByID = {record['ProjectID']: record for record in self._projectRecords}
+
+        self._memberRecords = []
+        for i in range(1, self.members + 1):
+            slug = 'member-{}'.format(i)
+            self._memberRecords.append({
+                'ID': 'fakemember{:08d}'.format(i),
+                'Name': 'Member {}'.format(i),
+                'Website': 'https://{}.example.com'.format(slug),
+                'Membership': {'Name': dataRandom.choice(self.membershipLevels)},
+                'OrganizationDescription': 'Synthetic member {} for load testing'.format(i),
+                'Logo': self._logoURL('members', slug),
+                'CrunchBaseURL': 'https://www.crunchbase.com/organization/{}'.format(slug),
+                'Twitter': None,
+                'LinkedInURL': None,
+                'ProjectName': root['Name'],
+            })
+        self._memberRecords.sort(key=lambda record: record['Name'])
+        with self._lock:
+            self._bodies = {}
+
+    def _logoURL(self, kind, name):
+        return '{}/logos/{}/{}.svg'.format(self.baseURL, kind, name) if self.logos else None
+
+#
+# Request handler passing each GET to the FakeProjectService the server was started for
+#
+class FakeProjectServiceHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, headers, body = self.server.service.handle(self.path, self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.getLogger().debug("Fake project service - {}".format(format % args))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+import os
+
+## third party modules
+import requests
+
+from lfx_landscape_tools.httpsession import HTTPSession
+
+#
+# Client for GitHub Projects ( v2 ) using the GraphQL API through the shared HTTP session. It follows the paging of
+# the project items and only asks for the fields given, returning each item shaped like the output of
+# 'gh project item-list --format json' ( field names with the first letter lowercased, and labels as a list of names ).
+#
+class GitHubProjectsClient:
+
+    graphqlURL = 'https://api.github.com/graphql'
+    pageSize = 100
+    labelsLimit = 50
+    fields = []
+
+    query = '''
+query($org: String!, $number: Int!, $pageSize: Int!, $cursor: String) {
+  organization(login: $org) {
+    projectV2(number: $number) {
+      items(first: $pageSize, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          content {
+            ... on Issue { title url labels(first: %(labelsLimit)d) { nodes { name } } }
+            ... on PullRequest { title url labels(first: %(labelsLimit)d) { nodes { name } } }
+            ... on DraftIssue { title }
+          }
+%(fields)s
+        }
+      }
+    }
+  }
+}
+'''
+
+    fieldQuery = '''          field%(index)d: fieldValueByName(name: %(name)s) {
+            ... on ProjectV2ItemFieldTextValue { text }
+            ... on ProjectV2ItemFieldDateValue { date }
+            ... on ProjectV2ItemFieldNumberValue { number }
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+            ... on ProjectV2ItemFieldIterationValue { title }
+          }'''
+
+    def __init__(self, fields: list = None, token = None, pageSize: int = None, session: requests.Session = None):
+        self.fields = fields if fields is not None else self.fields
+        self.token = token if token else os.environ.get('GITHUB_TOKEN',os.environ.get('GH_TOKEN'))
+        self.pageSize = pageSize if pageSize else self.pageSize
+        self._session = session
+
+    @property
+    def session(self):
+        if not self._session:
+            self._session = HTTPSession.shared()
+
+        return self._session
+
+    def items(self, org, number):
+        '''
+        Generator yielding every item in the project, following the paging of the project items
+
+        Keyword arguments:
+        org -- GitHub organization the project belongs to
+        number -- project number
+        '''
+        query = self.query % {'labelsLimit': self.labelsLimit, 'fields': "\n".join(self.fieldQuery % {'index': index, 'name': self._quote(name)} for index, name in enumerate(self.fields))}
+        cursor = None
+        while True:
+            data = self._post(query, {'org': org, 'number': int(number), 'pageSize': self.pageSize, 'cursor': cursor})
+            project = ( data.get('organization') or {} ).get('projectV2')
+            if project is None:
+                raise ValueError("GitHub Project {} not found in '{}'".format(number,org))
+            items = project.get('items',{})
+            for node in items.get('nodes',[]):
+                yield self._item(node)
+            if not items.get('pageInfo',{}).get('hasNextPage'):
+                break
+            cursor = items.get('pageInfo',{}).get('endCursor')
+
+    def _post(self, query, variables):
+        headers = {'Authorization': 'bearer {}'.format(self.token)} if self.token else {}
+        logging.getLogger().debug("Fetching GitHub Project items for '{}' at cursor '{}'".format(variables.get('org'),variables.get('cursor')))
+        response = self.session.post(self.graphqlURL, json={'query': query, 'variables': variables}, headers=headers)
+        response.raise_for_status()
+        body = response.json()
+        if body.get('errors'):
+            raise ValueError("; ".join(error.get('message','') for error in body.get('errors')))
+
+        return body.get('data') or {}
+
+    def _item(self, node):
+        content = node.get('content') or {}
+        item = {
+            'content': {'title': content.get('title'), 'url': content.get('url')},
+            'labels': [label.get('name') for label in ( content.get('labels') or {} ).get('nodes',[])],
+        }
+        for index, name in enumerate(self.fields):
+            value = node.get('field{}'.format(index))
+            if not value:
+                continue
+            for key in ['text','date','number','name','title']:
+                if key in value:
+                    item[name[:1].lower() + name[1:]] = value[key]
+                    break
+
+        return item
+
+    def _quote(self, name):
+        return '"{}"'.format(name.replace('\\','\\\\').replace('"','\\"'))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from lfx_landscape_tools.logomanifest import LogoManifest
+from lfx_landscape_tools.outputfiles import OutputFiles
+from lfx_landscape_tools.svglogo import SVGLogo
+
+#
+# Batches the logos to host for a build and writes them all at once; the hosted logos directory is checked once, each
+# file is written once from a thread pool even when several items share it, and a file whose contents are unchanged
+# on disk isn't rewritten.
+#
+# Logos are written under the slugified item name by default. Items whose names slugify to the same filename but
+# have different logos collide; the last one added is the one written, as it would be writing them one after another,
+# and the collision is logged. With contentAddressed, logos are instead written under the hash of their contents, so
+# items with identical logos share one file and names can't collide.
+#
+# Each hosted logo's owners, hash and size are recorded in the manifest, if one is given; saving it is left to the
+# caller. A logo still to be read from the very file it would be written to ( see SVGLogo.pendingFile ) isn't written
+# or read at all.
+#
+class HostedLogos:
+
+    workers = 8
+    contentAddressed = False
+
+    def __init__(self, path, files: OutputFiles = None, workers: int = None, contentAddressed: bool = None, manifest: LogoManifest = None):
+        self.path = path
+        self.files = files if files else OutputFiles()
+        self.workers = workers if workers else self.workers
+        self.contentAddressed = contentAddressed if contentAddressed is not None else self.contentAddressed
+        self.manifest = manifest
+        self.collisions = 0
+        self._logos = {}
+
+    def __len__(self):
+        return len(self._logos)
+
+    def add(self, name, logo: SVGLogo):
+        '''
+        Add the logo for the item name to be written; returns the filename it will be written to
+        '''
+        digest = logo.digest if logo.digest else LogoManifest.digest(str(logo))
+        filename = '{}.svg'.format(digest) if self.contentAddressed else logo.filename(name)
+        if self.manifest is not None:
+            self.manifest.reference(filename, name, digest)
+        existing = self._logos.get(filename)
+        if existing and existing[0] != name and existing[2] != digest:
+            logging.getLogger().warning("Hosted logo '{}' for '{}' collides with the one for '{}'; using the logo for '{}'".format(filename,name,existing[0],name))
+            self.collisions += 1
+        self._logos[filename] = (name, logo, digest)
+
+        return filename
+
+    def save(self):
+        '''
+        Write every logo added since the last save
+        '''
+        if not self._logos:
+            return
+
+        logging.getLogger().debug("Saving {} hosted logos to '{}'".format(len(self._logos),self.path))
+        logos = []
+        filenames = {}
+        for filename, (name, logo, digest) in self._logos.items():
+            filenamepath = os.path.normpath("{}/{}".format(self.path,filename))
+            filenames[filename] = filenamepath
+            if logo.pendingFile and os.path.normpath(logo.pendingFile) == filenamepath:
+                # the logo was never read from the hosted file it would be written to, so that's still as it was
+                self.files.skip(filenamepath)
+            else:
+                logos.append((filename, (name, logo)))
+        self._logos = {}
+        if logos:
+            # the first creates the directory if needed, so the rest don't check for it
+            filename, (name, logo) = logos[0]
+            logo.save(name,self.path,files=self.files,filename=filename)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for future in [executor.submit(logo.save,name,self.path,files=self.files,makedirs=False,filename=filename) for filename, (name, logo) in logos[1:]]:
+                    future.result()
+        if self.manifest is not None:
+            for filename, filenamepath in filenames.items():
+                self.manifest.stat(filename, filenamepath)
+
+    def removeUnreferenced(self, referenced):
+        '''
+        Delete the hosted logos not in referenced, in one scan of the hosted logos directory; returns the number deleted
+        '''
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return 0
+
+        removed = 0
+        for entry in entries:
+            # only logos, and not the temporary files of one being written
+            if entry.name in referenced or entry.name.startswith('.') or not entry.name.endswith('.svg') or not entry.is_file():
+                continue
+            try:
+                os.unlink(entry.path)
+            except OSError as e:
+                logging.getLogger().warning("Cannot remove unreferenced hosted logo '{}' - error message '{}'".format(entry.path,e))
+                continue
+            logging.getLogger().info("Removed unreferenced hosted logo '{}'".format(entry.path))
+            removed += 1
+            if self.manifest is not None:
+                self.manifest.remove(entry.name)
+
+        return removed
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote
+
+## third party modules
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#
+# Transport adapter applying default connect/read timeouts to requests that don't set their own, and limiting how many
+# requests are made to a host at once
+#
+class LimitedHTTPAdapter(HTTPAdapter):
+
+    def __init__(self, timeout = None, maxPerHost: int = None, **kwargs):
+        self.timeout = timeout
+        self.maxPerHost = maxPerHost
+        self._hostSemaphores = {}
+        self._hostLock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout = None, **kwargs):
+        semaphore = self._hostSemaphore(urlsplit(request.url).netloc)
+        if semaphore is None:
+            return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+        with semaphore:
+            return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+    def _hostSemaphore(self, host):
+        if not self.maxPerHost:
+            return None
+        with self._hostLock:
+            if host not in self._hostSemaphores:
+                self._hostSemaphores[host] = threading.BoundedSemaphore(self.maxPerHost)
+
+            return self._hostSemaphores[host]
+
+#
+# Cached HTTP session shared by every request made during a run. Responses from the endpoints in revalidateURLs, and
+# for requests made with revalidate=True ( i.e. logos, which can be replaced at the same URL on any host ), are
+# revalidated with the server the first time they are used in a run ( using If-None-Match / If-Modified-Since when the
+# cached response has an ETag or Last-Modified header ), so unchanged payloads aren't downloaded again.
+#
+# With staleWhileRevalidate set, an expired ( or not yet revalidated ) cached response is returned straight away and
+# refreshed in the background; isStale() tells whether the data for a URL is still waiting on that refresh.
+#
+# When maxSize is set, prune() evicts the least recently used responses until the cache fits; the last time each
+# response was used is kept in a '.lru.json' file next to the cache, and the cache hits and misses for each endpoint
+# in a '.stats.json' file.
+#
+# Every request has a connect and read timeout ( in seconds ), and at most maxPerHost requests go to a host at once.
+#
+# With lfxApiBaseURL set, requests to the LFX project-service are sent to that base URL instead ( i.e. a local
+# FakeProjectService for load testing ).
+#
+class HTTPSession(requests_cache.CachedSession):
+
+    cacheName = 'http_cache'
+    revalidateURLs = [
+        'api-gw.platform.linuxfoundation.org/project-service'
+    ]
+    maxSize = None
+    staleWhileRevalidate = False
+    refreshWorkers = 4
+    timeout = (10, 60)
+    maxPerHost = 8
+    lfxApiDefaultBaseURL = 'https://api-gw.platform.linuxfoundation.org/project-service'
+    lfxApiBaseURL = None
+
+    _shared = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, cache_name = None, revalidateURLs: list = None, maxSize: int = None, staleWhileRevalidate: bool = None, timeout = None, maxPerHost: int = None, lfxApiBaseURL = None, **kwargs):
+        kwargs.setdefault('key_fn',self.createKey)
+        super().__init__(cache_name if cache_name else self.cacheName, **kwargs)
+        self.timeout = timeout if timeout else self.timeout
+        self.maxPerHost = maxPerHost if maxPerHost else self.maxPerHost
+        adapter = LimitedHTTPAdapter(timeout=self.timeout, maxPerHost=self.maxPerHost, max_retries=Retry(total=3, backoff_factor=0.5))
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        self.lfxApiBaseURL = lfxApiBaseURL.rstrip('/') if lfxApiBaseURL else self.lfxApiBaseURL
+        self.revalidateURLs = revalidateURLs if revalidateURLs is not None else self.revalidateURLs
+        self.maxSize = maxSize if maxSize else self.maxSize
+        self._revalidatedKeys = set()
+        self._revalidateKeys = set()
+        self.staleWhileRevalidate = staleWhileRevalidate if staleWhileRevalidate is not None else self.staleWhileRevalidate
+        self._accessTimes = {}
+        self._endpointStats = {}
+        self._refreshes = {}
+        self._refreshExecutor = None
+        self._statsLock = threading.Lock()
+        self.requestsSent = 0
+        self.cacheHits = 0
+        self.notModified = 0
+        self.bytesSaved = 0
+        self.staleServed = 0
+
+    @classmethod
+    def shared(cls):
+        '''
+        Returns the session shared by everything in this run
+        '''
+        with cls._sharedLock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+        return cls._shared
+
+    @classmethod
+    def configure(cls, config):
+        '''
+        Replace the shared session with one using the HTTP cache settings in config
+        '''
+        session = cls.fromConfig(config)
+        with cls._sharedLock:
+            if cls._shared is not None:
+                cls._shared.close()
+            cls._shared = session
+
+    @classmethod
+    def fromConfig(cls, config):
+        '''
+        Create a session using the HTTP cache settings in config
+        '''
+        if config.httpCacheBackend == 'sqlite':
+            # WAL lets concurrent runs read the cache while another is writing to it
+            backend = requests_cache.SQLiteCache(config.httpCacheLocation, wal=config.httpCacheWAL)
+        elif config.httpCacheBackend == 'filesystem':
+            backend = requests_cache.FileCache(config.httpCacheLocation)
+        elif config.httpCacheBackend == 'memory':
+            backend = 'memory'
+        else:
+            raise ValueError("Invalid HTTP cache backend '{}'".format(config.httpCacheBackend))
+
+        return cls(backend=backend, urls_expire_after=config.httpCacheExpireAfter if config.httpCacheExpireAfter else None, maxSize=config.httpCacheMaxSize, staleWhileRevalidate=config.httpCacheStaleWhileRevalidate, timeout=(config.httpConnectTimeout, config.httpReadTimeout), maxPerHost=config.httpMaxPerHost, lfxApiBaseURL=config.lfxApiBaseURL)
+
+    @staticmethod
+    def createKey(request, **kwargs):
+        '''
+        Cache key for a request, normalizing the URL further than requests_cache does so equivalent URLs share an entry
+        '''
+        request = request.prepare() if isinstance(request,requests.Request) else request.copy()
+        url = urlsplit(request.url)
+        query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)), quote_via=quote)
+        request.url = urlunsplit((url.scheme.lower(), url.netloc.lower().removesuffix(':443').removesuffix(':80'), url.path.rstrip('/') or '/', query, ''))
+
+        return requests_cache.create_key(request, **kwargs)
+
+    def request(self, method, url, *args, revalidate: bool = False, **kwargs):
+        '''
+        As for requests_cache.CachedSession.request, with revalidate=True to revalidate the cached response for url the
+        first time it's used in the run, as for the endpoints in revalidateURLs
+        '''
+        url = self.rewriteURL(url)
+        if revalidate:
+            key = self.cache.create_key(requests.Request(method,url,params=kwargs.get('params')))
+            with self._statsLock:
+                self._revalidateKeys.add(key)
+
+        return super().request(method, url, *args, **kwargs)
+
+    def rewriteURL(self, url):
+        '''
+        Returns url with the LFX project-service base URL replaced by lfxApiBaseURL, if set
+        '''
+        if self.lfxApiBaseURL and isinstance(url,str) and url.startswith(self.lfxApiDefaultBaseURL):
+            return self.lfxApiBaseURL + url[len(self.lfxApiDefaultBaseURL):]
+
+        return url
+
+    def send(self, request, **kwargs):
+        revalidate = False
+        cachedResponse = None
+        key = self.cache.create_key(request)
+        with self._statsLock:
+            self._accessTimes[key] = time.time()
+        if not self.settings.disabled and request.method == 'GET':
+            with self._statsLock:
+                requested = key in self._revalidateKeys
+            if requested or self._isRevalidateURL(request.url):
+                with self._statsLock:
+                    revalidate = key not in self._revalidatedKeys
+                    self._revalidatedKeys.add(key)
+            if revalidate or self.staleWhileRevalidate:
+                cachedResponse = self.cache.get_response(key)
+            if self.staleWhileRevalidate and cachedResponse is not None and ( revalidate or cachedResponse.is_expired ):
+                return self._sendStale(request, key, cachedResponse, **kwargs)
+            if revalidate and cachedResponse is not None:
+                kwargs.update(self._refreshOptions(request, cachedResponse))
+
+        response = super().send(request, **kwargs)
+
+        with self._statsLock:
+            if response.status_code == 504 and 'only-if-cached' in request.headers.get('Cache-Control',''):
+                # not in the cache, and nothing was sent
+                pass
+            elif revalidate and getattr(response,'revalidated',False):
+                self.notModified += 1
+                self.bytesSaved += len(response.content)
+                self._countEndpoint(request.url,'hits')
+            elif getattr(response,'from_cache',False):
+                self.cacheHits += 1
+                self.bytesSaved += len(response.content)
+                self._countEndpoint(request.url,'hits')
+            else:
+                self.requestsSent += 1
+                self._countEndpoint(request.url,'misses')
+
+        return response
+
+    def summary(self):
+        '''
+        Returns a summary of the HTTP requests made during the run
+        '''
+        summary = "Sent {} HTTP requests; {} served from cache and {} revalidated as not modified, saving {} bytes".format(self.requestsSent,self.cacheHits,self.notModified,self.bytesSaved)
+        if self.staleServed:
+            summary += "; {} stale responses used while refreshing in the background".format(self.staleServed)
+
+        return summary
+
+    @staticmethod
+    def endpoint(url):
+        '''
+        Returns the endpoint a URL is grouped under in the cache statistics; its host and first path segment
+        '''
+        url = urlsplit(url)
+        return "{}/{}".format(url.netloc.lower(),url.path.strip('/').split('/')[0])
+
+    def endpointStats(self):
+        '''
+        Returns the cache hits and misses for each endpoint, including those saved from prior runs
+        '''
+        stats = self._loadState('stats')
+        with self._statsLock:
+            for endpoint, counts in self._endpointStats.items():
+                saved = stats.setdefault(endpoint,{'hits': 0, 'misses': 0})
+                for name, count in counts.items():
+                    saved[name] = saved.get(name,0) + count
+
+        return stats
+
+    def saveStats(self):
+        '''
+        Add the cache hits and misses for each endpoint during this run to those saved with the cache
+        '''
+        stats = self.endpointStats()
+        with self._statsLock:
+            self._endpointStats = {}
+        self._saveState('stats',stats)
+
+    def isStale(self, url):
+        '''
+        Returns True if the response used for url was stale and hasn't been refreshed yet
+        '''
+        with self._statsLock:
+            refresh = self._refreshes.get(self.cache.create_key(requests.Request('GET',url)))
+        if refresh is None:
+            return False
+
+        return not refresh[1].done() or refresh[1].exception() is not None
+
+    def refreshedURLs(self):
+        '''
+        Returns the URLs used stale whose background refresh has since completed with changed data
+        '''
+        with self._statsLock:
+            refreshes = list(self._refreshes.values())
+        urls = []
+        for url, future, digest in refreshes:
+            if not future.done() or future.exception() is not None:
+                continue
+            response = future.result()
+            if not getattr(response,'revalidated',False) and hashlib.sha256(response.content).hexdigest() != digest:
+                urls.append(url)
+
+        return urls
+
+    def waitForRefreshes(self, timeout: float = None):
+        '''
+        Wait for the background refreshes underway to finish, for up to timeout seconds ( without one, each refresh is
+        still bounded by the request timeouts ); returns True if they all have
+        '''
+        with self._statsLock:
+            futures = [future for url, future, digest in self._refreshes.values()]
+        done, notDone = wait(futures, timeout=timeout)
+        if notDone:
+            logging.getLogger().info("{} background refreshes didn't finish in time".format(len(notDone)))
+
+        return not notDone
+
+    def close(self):
+        if self._refreshExecutor is not None:
+            self._refreshExecutor.shutdown(wait=False)
+        super().close()
+
+    def _sendStale(self, request, key, cachedResponse, **kwargs):
+        '''
+        Returns the stale cached response, refreshing it in the background if that isn't already underway
+        '''
+        with self._statsLock:
+            self.staleServed += 1
+            self.bytesSaved += len(cachedResponse.content)
+            self._countEndpoint(request.url,'hits')
+            if key in self._refreshes:
+                return cachedResponse
+            if self._refreshExecutor is None:
+                self._refreshExecutor = ThreadPoolExecutor(max_workers=self.refreshWorkers)
+            logging.getLogger().debug("Using stale response for '{}' while refreshing it".format(request.url))
+            kwargs.update(self._refreshOptions(request, cachedResponse))
+            kwargs['stream'] = False
+            future = self._refreshExecutor.submit(self._refresh, request.copy(), **kwargs)
+            self._refreshes[key] = (request.url, future, hashlib.sha256(cachedResponse.content).hexdigest())
+
+        return cachedResponse
+
+    def _refresh(self, request, **kwargs):
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.RequestException as e:
+            logging.getLogger().warning("Couldn't refresh stale response for '{}' - error message '{}'".format(request.url,e))
+            raise
+        with self._statsLock:
+            if not getattr(response,'revalidated',False):
+                self.requestsSent += 1
+
+        return response
+
+    def _countEndpoint(self, url, name):
+        counts = self._endpointStats.setdefault(self.endpoint(url),{'hits': 0, 'misses': 0})
+        counts[name] += 1
+
+    def _refreshOptions(self, request, cachedResponse):
+        if cachedResponse.headers.get('ETag') or cachedResponse.headers.get('Last-Modified'):
+            logging.getLogger().debug("Revalidating '{}'".format(request.url))
+            return {'refresh': True}
+
+        logging.getLogger().debug("No validator for '{}'; refetching".format(request.url))
+        return {'force_refresh': True}
+
+    def prune(self, maxSize: int = None):
+        '''
+        Remove expired responses, then the least recently used responses until the cache is no larger than maxSize bytes;
+        returns the size of the cache afterwards, or None without a maxSize, when nothing is removed
+
+        Keyword arguments:
+        maxSize -- maximum size of the cache in bytes; defaults to the session maxSize
+        '''
+        maxSize = maxSize if maxSize else self.maxSize
+        if not maxSize:
+            # nothing to evict, so skip reading every response; just keep when they were used for a later prune
+            self._saveState('lru',self._loadState('lru') | self._accessTimes)
+            return None
+        self.cache.delete(expired=True)
+
+        accessTimes = self._loadState('lru') | self._accessTimes
+        entries = []
+        for key, response in self.cache.responses.items():
+            lastUsed = accessTimes.get(key, response.created_at.timestamp() if response.created_at else 0)
+            entries.append((lastUsed, key, response.size))
+        size = sum(entry[2] for entry in entries)
+        if maxSize and size > maxSize:
+            evict = []
+            for lastUsed, key, entrySize in sorted(entries):
+                if size <= maxSize:
+                    break
+                evict.append(key)
+                size -= entrySize
+            logging.getLogger().info("Evicting {} responses from the HTTP cache to get under {} bytes".format(len(evict),maxSize))
+            self.cache.delete(*evict)
+
+        self._saveState('lru',{key: accessTimes.get(key) for lastUsed, key, entrySize in entries if key in self.cache.responses and key in accessTimes})
+
+        return size
+
+    def _stateFile(self, name):
+        if isinstance(self.cache,requests_cache.SQLiteCache):
+            return "{}.{}.json".format(os.path.splitext(self.cache.db_path)[0],name)
+        if isinstance(self.cache,requests_cache.FileCache):
+            return "{}.{}.json".format(str(self.cache.cache_dir).rstrip(os.sep),name)
+
+        return None
+
+    def _loadState(self, name):
+        filename = self._stateFile(name)
+        if not filename or not os.path.isfile(filename):
+            return {}
+        try:
+            with open(filename, 'r') as fileobject:
+                return json.load(fileobject)
+        except (OSError, ValueError) as e:
+            logging.getLogger().warning("Cannot read HTTP cache state '{}' - error message '{}'".format(filename,e))
+
+        return {}
+
+    def _saveState(self, name, state: dict):
+        filename = self._stateFile(name)
+        if not filename:
+            return
+        try:
+            with open(filename, 'w') as fileobject:
+                json.dump(state, fileobject)
+        except OSError as e:
+            logging.getLogger().warning("Cannot save HTTP cache state '{}' - error message '{}'".format(filename,e))
+
+    def _isRevalidateURL(self, url):
+        baseurl = url.split('://',1)[-1]
+        return any(fnmatch(baseurl,"{}*".format(pattern)) for pattern in self.revalidateURLs)
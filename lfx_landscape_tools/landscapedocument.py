@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+import os
+import threading
+
+## third party modules
+import ruamel.yaml
+import ruamel.yaml.main
+
+#
+# Parses of landscape files shared by everything in a run, so a large landscape.yml is only parsed once for each way
+# it's used. Reading the current items only needs plain data, so uses the safe loader ( which is backed by libyaml
+# when ruamel.yaml.clib is installed, and pure Python otherwise ); the round-trip loader, which keeps the comments and
+# formatting, is only used for rewriting the file in LandscapeOutput.save. A parse is reused only while the file on
+# disk is the same as when it was parsed ( same modification time, size and inode ); if it has changed in between
+# it's parsed again.
+#
+# Readers get the parsed tree itself and must not change it; LandscapeOutput.save changes the round-trip tree in
+# place before writing it back out, after which the file is parsed again the next time it's asked for.
+#
+class LandscapeDocument:
+
+    _documents = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, filename, roundTrip: bool = True):
+        '''
+        Returns the parse of filename, reusing the one from earlier in the run if the file hasn't changed since; raises
+        OSError if the file can't be read, or a ruamel.yaml error if it can't be parsed
+
+        Keyword arguments:
+        filename -- landscape file to parse
+        roundTrip -- True for a round-trip parse that can be changed and written back out, False for a read-only one
+        '''
+        filename = os.path.abspath(filename)
+        with cls._lock:
+            signature = cls._signature(filename)
+            # a round-trip parse has everything a read-only one does
+            for key in [(filename, True)] if roundTrip else [(filename, False), (filename, True)]:
+                document = cls._documents.get(key)
+                if document is not None and document[0] == signature:
+                    logging.getLogger().debug("Reusing parsed landscape file '{}'".format(filename))
+                    return document[1]
+            if (filename, roundTrip) in cls._documents:
+                logging.getLogger().info("Landscape file '{}' has changed on disk since it was parsed; parsing it again".format(filename))
+
+            with open(filename, 'r', encoding="utf8", errors='ignore') as fileobject:
+                logging.getLogger().debug("Successfully opened landscape file '{}'".format(filename))
+                landscape = cls.loader(roundTrip).load(fileobject)
+                logging.getLogger().debug("Successfully parsed yaml output in landscape file '{}'".format(filename))
+            cls._documents[(filename, roundTrip)] = (signature, landscape)
+
+        return landscape
+
+    @staticmethod
+    def loader(roundTrip: bool = True):
+        '''
+        Returns the ruamel.yaml loader for a round-trip or read-only parse
+        '''
+        return ruamel.yaml.YAML() if roundTrip else ruamel.yaml.YAML(typ='safe')
+
+    @staticmethod
+    def hasCParser():
+        '''
+        Returns True if read-only parses are backed by libyaml
+        '''
+        return ruamel.yaml.main.CParser is not None
+
+    @classmethod
+    def forget(cls, filename):
+        '''
+        Drop the parse of filename, i.e. after it's been rewritten
+        '''
+        with cls._lock:
+            for roundTrip in [True, False]:
+                cls._documents.pop((os.path.abspath(filename), roundTrip), None)
+
+    @classmethod
+    def clear(cls):
+        '''
+        Drop every parse
+        '''
+        with cls._lock:
+            cls._documents = {}
+
+    @staticmethod
+    def _signature(filename):
+        stat = os.stat(filename)
+
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
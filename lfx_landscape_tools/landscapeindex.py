@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import json
+import logging
+import os
+
+## third party modules
+import ruamel.yaml
+
+#
+# Byte offsets of each category in a landscape file, so one category can be rewritten in place without parsing or
+# serializing the rest of the file. The index is found by scanning the lines of the file rather than parsing it, and
+# is kept in a sidecar file between runs. It's only used while the file's modification time and size match those
+# when it was built, and the lines at the recorded offsets are still the ones recorded; otherwise the file is scanned
+# again.
+#
+# For each category, 'start' and 'end' are the range of the whole entry, and 'subcategoriesStart' and
+# 'subcategoriesEnd' the range of its 'subcategories' key and value, with 'keyIndent' the indent of its keys.
+#
+class LandscapeIndex:
+
+    rootKeys = ['landscape','categories']
+
+    def __init__(self, landscapefile, filename = None):
+        self.landscapefile = landscapefile
+        self.filename = filename
+        self._index = self._load()
+
+    def category(self, name):
+        '''
+        Returns the offsets of the category name in the landscape file, or None if it isn't in there or the file
+        can't be scanned
+        '''
+        if not self._isValid():
+            logging.getLogger().debug("Scanning landscape file '{}' for category offsets".format(self.landscapefile))
+            try:
+                self._index = self.scan()
+            except OSError as e:
+                logging.getLogger().debug("Cannot scan landscape file '{}' - error message '{}'".format(self.landscapefile,e))
+                self._index = None
+                return None
+
+        return self._index['categories'].get(name)
+
+    def scan(self):
+        '''
+        Returns the index for the landscape file as it is on disk
+        '''
+        with open(self.landscapefile, 'rb') as fileobject:
+            signature = self._signature(fileobject.fileno())
+            data = fileobject.read()
+
+        categories = {}
+        root = False
+        sequenceIndent = None
+        entry = None
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            start = offset
+            offset += len(line)
+            text = line.decode('utf-8', 'ignore').rstrip('\r\n')
+            stripped = text.strip()
+            indent = len(text) - len(text.lstrip(' '))
+            if not root:
+                root = indent == 0 and stripped.split('#')[0].strip() in ['{}:'.format(key) for key in self.rootKeys]
+                continue
+            if stripped == '' or stripped.startswith('#'):
+                continue
+            if ( indent == 0 and not stripped.startswith('-') ) or ( sequenceIndent is not None and indent < sequenceIndent ):
+                # the next top level key, so the end of the categories
+                break
+            key = None
+            if stripped.startswith('- ') and ( sequenceIndent is None or indent == sequenceIndent ):
+                sequenceIndent = indent
+                self._close(entry, categories)
+                content = text[indent + 1:]
+                entry = {'start': start, 'end': offset, 'keyIndent': indent + 1 + len(content) - len(content.lstrip(' ')), 'header': line.decode('utf-8', 'ignore')}
+                key = content.strip()
+            elif entry is not None and indent == entry['keyIndent'] and not stripped.startswith('-'):
+                key = stripped
+            if entry is None:
+                continue
+            if key is not None:
+                if 'subcategoriesStart' in entry and 'subcategoriesEnd' not in entry:
+                    entry['subcategoriesEnd'] = entry['end']
+                if key.startswith('name:'):
+                    entry['name'] = self._name(key)
+                elif key.startswith('subcategories:') and start != entry['start']:
+                    entry['subcategoriesStart'] = start
+                    entry['subcategoriesHeader'] = line.decode('utf-8', 'ignore')
+            # the end of the last line with content, so comments and blank lines before the next entry are kept
+            entry['end'] = offset
+        self._close(entry, categories)
+
+        return {'signature': signature, 'categories': categories}
+
+    def update(self, name, subcategories: bytes):
+        '''
+        Record that the subcategories of category name were replaced with subcategories, moving the offsets after them
+        '''
+        category = self._index['categories'][name]
+        end = category['subcategoriesEnd']
+        delta = len(subcategories) - ( end - category['subcategoriesStart'] )
+        for other in self._index['categories'].values():
+            for key in ['start','end','subcategoriesStart','subcategoriesEnd']:
+                if other[key] >= end:
+                    other[key] += delta
+        category['subcategoriesHeader'] = subcategories.splitlines(keepends=True)[0].decode('utf-8', 'ignore')
+        with open(self.landscapefile, 'rb') as fileobject:
+            self._index['signature'] = self._signature(fileobject.fileno())
+
+    def save(self):
+        '''
+        Save the index to the sidecar file
+        '''
+        if not self.filename or not self._index:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            with open(self.filename, 'w', encoding="utf8") as fileobject:
+                json.dump(self._index, fileobject)
+        except OSError as e:
+            logging.getLogger().warning("Cannot save landscape index file '{}' - error message '{}'".format(self.filename,e))
+
+    def _close(self, entry, categories):
+        if entry is None or 'name' not in entry or 'subcategoriesStart' not in entry:
+            return
+        entry.setdefault('subcategoriesEnd', entry['end'])
+        # the first of duplicate categories is the one the full rewrite replaces
+        categories.setdefault(entry.pop('name'), entry)
+
+    def _name(self, key):
+        try:
+            return str(ruamel.yaml.YAML(typ='safe').load(key).get('name'))
+        except Exception:
+            return None
+
+    def _isValid(self):
+        if not self._index:
+            return False
+        try:
+            with open(self.landscapefile, 'rb') as fileobject:
+                if self._signature(fileobject.fileno()) != self._index.get('signature'):
+                    return False
+                for category in self._index.get('categories',{}).values():
+                    for offset, header in [(category['start'], category['header']), (category['subcategoriesStart'], category['subcategoriesHeader'])]:
+                        fileobject.seek(offset)
+                        if fileobject.readline().decode('utf-8', 'ignore') != header:
+                            return False
+        except (OSError, KeyError, TypeError):
+            return False
+
+        return True
+
+    def _signature(self, fd):
+        stat = os.fstat(fd)
+
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load(self):
+        if not self.filename or not os.path.isfile(self.filename):
+            return None
+        try:
+            with open(self.filename, 'r', encoding="utf8") as fileobject:
+                index = json.load(fileobject)
+        except (OSError, ValueError) as e:
+            logging.getLogger().warning("Cannot read landscape index file '{}' - error message '{}'".format(self.filename,e))
+            return None
+
+        return index if isinstance(index,dict) else None
@@ -12,12 +12,14 @@ import re
 from urllib.parse import urlparse
 
 ## third party modules
-import ruamel.yaml
 import requests
 
 from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.member import Member
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.landscapedocument import LandscapeDocument
+from lfx_landscape_tools.logomanifest import LogoManifest
+from lfx_landscape_tools.svglogo import SVGLogo
 
 class LandscapeMembers(Members):
 
@@ -36,6 +38,7 @@ class LandscapeMembers(Members):
         self.landscapefile = os.path.join(config.basedir,config.landscapefile)
         self.memberSuffix = config.memberSuffix if config.view == 'members' else self.memberSuffix
         self.hostedLogosDir = os.path.join(config.basedir,config.hostedLogosDir)
+        self.logoManifest = LogoManifest(os.path.join(config.basedir,config.stateDir,'hostedlogos.json'))
         self.assignSIGs = config.projectsAssignSIGs
 
     def loadData(self):
@@ -44,10 +47,7 @@ class LandscapeMembers(Members):
         landscape = {}
 
         try:
-            with open(self.landscapefile, 'r', encoding="utf8", errors='ignore') as fileobject: 
-                logging.getLogger().debug("Successfully opened landscape file '{}'".format(self.landscapefile))
-                landscape = ruamel.yaml.YAML().load(fileobject)
-                logging.getLogger().debug("Successfully parsed yaml output in landscape file '{}'".format(self.landscapefile))
+            landscape = LandscapeDocument.load(self.landscapefile,roundTrip=False)
         except Exception as e:
             logging.getLogger().error("Error opening landscape file '{}' - will not load current landscape data - '{}'".format(self.landscapefile,e))
         else:
@@ -63,14 +63,14 @@ class LandscapeMembers(Members):
                             member.name = re.sub('{}$'.format(re.escape(self.memberSuffix)),'',item.get('name'))
                             if item.get('logo'):
                                 if urlparse(item.get('logo')).scheme == '':
-                                    member.logo = os.path.normpath("{}/{}".format(self.hostedLogosDir,item.get('logo')))
+                                    logofile = os.path.normpath("{}/{}".format(self.hostedLogosDir,item.get('logo')))
+                                    # a hosted logo unchanged since it was written isn't read unless it's needed
+                                    digest = self.logoManifest.unchanged(os.path.normpath(item.get('logo')),logofile)
+                                    member.logo = SVGLogo(filename=logofile,digest=digest) if digest else logofile
                                 else:
                                     member.logo = item.get('logo')
                             logger.info("Found Landscape Member '{}'".format(member.name))
-                            for key, value in item.items():
-                                if key not in ['item','name','homepage_url','logo']:
-                                    logger.debug("Setting '{}' to '{}' for '{}'".format(key,value,member.name))
-                                    setattr(member, key, value)
+                            member.loadLandscapeItemAttributes(item)
                             for landscapeSubcategory in self.landscapeSubcategories:
                                 if subcategory.get('name') == landscapeSubcategory.get('category'):
                                     logger.debug("Parsing subcategory '{}' to landscapeSubcategory '{}'".format(subcategory.get('name'),landscapeSubcategory.get('name')))
@@ -79,6 +79,4 @@ class LandscapeMembers(Members):
                             if self.assignSIGs:
                                 member.second_path = [item for item in member.second_path if not item.startswith('SIG /')]
 
-                            member.homepage_url = item.get('homepage_url')
-                            member.linkedin = item.get('extra',{}).get('linkedin_url')
                             self.members.append(member)
@@ -7,17 +7,44 @@
 
 ## built in modules
 import csv
+import io
 import re
 import logging
 import os
+import shutil
 from contextlib import suppress
+from urllib.parse import urlparse
 
 ## third party modules
 import ruamel.yaml
+from ruamel.yaml.representer import RoundTripRepresenter
 
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.landscapedocument import LandscapeDocument
+from lfx_landscape_tools.landscapeindex import LandscapeIndex
+from lfx_landscape_tools.outputfiles import OutputFiles
+from lfx_landscape_tools.hostedlogos import HostedLogos
+from lfx_landscape_tools.logomanifest import LogoManifest
 from lfx_landscape_tools.members import Members
 
+#
+# Round-trip representer for landscape files, which leaves the 'item', 'category' and 'subcategory' keys that start each
+# entry empty rather than writing them out as null. Only the first key of a mapping that also has a 'name' is an entry
+# start; the same keys anywhere else ( such as under 'extra' ) are written as they are
+#
+class LandscapeRepresenter(RoundTripRepresenter):
+
+    emptyKeys = ['item','category','subcategory']
+
+    def represent_mapping(self, tag, mapping, flow_style = None):
+        node = super().represent_mapping(tag, mapping, flow_style=flow_style)
+        if node.value and 'name' in mapping:
+            keynode, valuenode = node.value[0]
+            if keynode.value in self.emptyKeys and valuenode.tag == 'tag:yaml.org,2002:null':
+                valuenode.value = ''
+
+        return node
+
 class LandscapeOutput:
 
     
@@ -30,17 +57,28 @@ class LandscapeOutput:
     landscapefile = 'landscape.yml'
     hostedLogosDir = 'hosted_logos'
     memberSuffix = ''
+    saveMode = 'full'
+    # indent of the category keys as the writer outputs them
+    keyIndent = 4
     
     _itemsProcessed = 0
     _itemsErrors = 0
+    # set when save() couldn't read the landscape file and wrote just the category built
+    _resetLandscape = False
 
     def __init__(self, config: Config):
         self.landscapeItems = []
+        self.staleItems = []
+        self.files = OutputFiles()
         self.landscapeCategory = config.landscapeCategory
         self.landscapeSubcategories = config.landscapeSubcategories
         self.landscapefile = os.path.join(config.basedir,config.landscapefile)
         self.hostedLogosDir = os.path.join(config.basedir,config.hostedLogosDir)
+        self.logoManifest = LogoManifest(os.path.join(config.basedir,config.stateDir,'hostedlogos.json'))
+        self.hostedLogos = HostedLogos(self.hostedLogosDir,files=self.files,contentAddressed=config.hostedLogosContentAddressed,manifest=self.logoManifest)
         self.memberSuffix = config.memberSuffix if config.view == 'members' else self.memberSuffix
+        self.saveMode = config.landscapeSaveMode
+        self.indexfile = os.path.join(config.basedir,config.stateDir,'landscapeindex.json')
         for landscapeSubcategory in self.landscapeSubcategories:
             subcategory = {
                 "subcategory": None,
@@ -49,6 +87,14 @@ class LandscapeOutput:
             }
             if subcategory not in self.landscapeItems:
                 self.landscapeItems.append(subcategory)
+        # the landscapeItems subcategory each membership goes in
+        subcategoriesByName = {}
+        for landscapeItemSubcategory in self.landscapeItems:
+            subcategoriesByName.setdefault(landscapeItemSubcategory['name'],landscapeItemSubcategory)
+        self._subcategoriesByMembership = {}
+        for landscapeSubcategory in self.landscapeSubcategories:
+            self._subcategoriesByMembership.setdefault(landscapeSubcategory.get('name'),subcategoriesByName.get(landscapeSubcategory.get('category')))
+
     @property
     def itemsProcessed(self):
         return self._itemsProcessed
@@ -57,6 +103,14 @@ class LandscapeOutput:
     def itemsErrors(self):
         return self._itemsErrors
 
+    @property
+    def filesWritten(self):
+        return self.files.written
+
+    @property
+    def filesSkipped(self):
+        return self.files.skipped
+
     def load(self, members: Members):
         '''
         Load Members into landscapeItems
@@ -66,47 +120,57 @@ class LandscapeOutput:
         '''
         logger = logging.getLogger() 
         logger.info("Processing '{}' items".format(self.landscapeCategory))
+        notFound = {}
         for member in members.members:
             logger.info("Processing '{}'...".format(member.name))
-            foundCategory = False
-            for landscapeItemSubcategory in self.landscapeItems:
-                landscapeSubcategory = next((item for item in self.landscapeSubcategories if item["name"] == member.membership), None)
-                if ( ( landscapeSubcategory is not None )
-                        and ( landscapeSubcategory['name'] == member.membership ) 
-                        and ( landscapeItemSubcategory['name'] == landscapeSubcategory['category'] ) ):
-                    foundCategory = True
-                    # Write out to error log if it's missing key parameters
-                    if not member.isValidLandscapeItem():
-                        logger.error("Not adding '{}' to Landscape - Missing key attributes {}".format(member.name,",".join(member.invalidLandscapeItemAttributes())))
-                        self._itemsErrors += 1
-                    # otherwise we can add it
-                    else:
-                        logger.info("Added '{}' to Landscape in SubCategory '{}'".format(member.name,member.membership))
-                        self._itemsProcessed += 1
-                        member.hostLogo(self.hostedLogosDir)
-                        member.entrysuffix = self.memberSuffix if self.memberSuffix else member.entrysuffix
-                        landscapeItemSubcategory['items'].append(member.toLandscapeItemAttributes())
-                    break
-            if not foundCategory:
-                logger.error("Not adding '{}' to Landscape - SubCategory '{}' not found".format(member.name,member.membership))
+            landscapeItemSubcategory = self._subcategoriesByMembership.get(member.membership)
+            if landscapeItemSubcategory is None:
+                notFound.setdefault(member.membership,[]).append(member.name)
+                self._itemsErrors += 1
+            # Write out to error log if it's missing key parameters
+            elif not member.isValidLandscapeItem():
+                logger.error("Not adding '{}' to Landscape - Missing key attributes {}".format(member.name,",".join(member.invalidLandscapeItemAttributes())))
                 self._itemsErrors += 1
+            # otherwise we can add it
+            else:
+                logger.info("Added '{}' to Landscape in SubCategory '{}'".format(member.name,member.membership))
+                self._itemsProcessed += 1
+                member.entrysuffix = self.memberSuffix if self.memberSuffix else member.entrysuffix
+                landscapeItem = member.toLandscapeItemAttributes()
+                landscapeItem['logo'] = self.hostedLogos.add(member.name,member.logo)
+                landscapeItemSubcategory['items'].append(landscapeItem)
+                if member.stale:
+                    self.staleItems.append(member.name)
+
+        # written together once every item is in
+        self.hostedLogos.save()
+
+        if notFound:
+            logger.error("Not adding {} items to Landscape - SubCategory not found for {}".format(
+                sum(len(names) for names in notFound.values()),
+                "; ".join("'{}' ({})".format(membership,", ".join(names)) for membership, names in notFound.items())))
 
     def save(self):
         '''
         Save the landscapeItems for a given landscapeCategory to the landscapefile
         '''
+        if self.staleItems:
+            logging.getLogger().warning("{} items were built from stale cached data that wasn't refreshed in time: {}".format(len(self.staleItems),", ".join(self.staleItems)))
+
+        if self.saveMode == 'splice' and self._spliceCategory():
+            return
+
         # open existing landscape data file and see where to add the category data
         landscape = {}
         try:
-            with open(self.landscapefile, 'r', encoding="utf8", errors='ignore') as fileobject: 
-                logging.getLogger().debug("Successfully opened landscape file '{}'".format(self.landscapefile))
-                landscape = ruamel.yaml.YAML().load(fileobject)
-                if not isinstance(landscape,dict) or landscape is None:
-                    landscape = {}
-                    raise RuntimeError('Landscape file is empty')
-                logging.getLogger().debug("Successfully parsed yaml output in landscape file '{}'".format(self.landscapefile))
+            # the same parse the current items were loaded from, unless the file has changed since
+            landscape = LandscapeDocument.load(self.landscapefile)
+            if not isinstance(landscape,dict) or landscape is None:
+                landscape = {}
+                raise RuntimeError('Landscape file is empty')
         except Exception as e:
             logging.getLogger().error("Error opening landscape file '{}'; will reset file - error message is '{}'".format(self.landscapefile,e))
+            self._resetLandscape = True
             landscape = {
                 'categories': [{
                     'name': self.landscapeCategory,
@@ -133,25 +197,108 @@ class LandscapeOutput:
                     'subcategories': self.landscapeItems
                     })
         finally:
-            with open(self.landscapefile, 'w+', encoding="utf8", errors='ignore') as fileobject: 
-                ryaml = ruamel.yaml.YAML(typ='rt')
-                ryaml.Representer.add_representer(str,self._str_presenter)
-                ryaml.Representer.add_representer(type(None),self._none_representer)
-                ryaml.indent(mapping=2, sequence=4, offset=2)
-                ryaml.default_flow_style = False
-                ryaml.allow_unicode = True
-                ryaml.width = 1000000
-                ryaml.preserve_quotes = False
-                ryaml.dump(landscape, fileobject, transform=self._removeNulls)
-
-    def _removeNulls(self,yamlout):
-        return yamlout.replace('- item: null','- item:') \
-            .replace('- category: null','- category:') \
-            .replace('- subcategory: null','- subcategory:') \
-            .replace('\u2028',' ') \
-            .replace('\x95','')
+            # streamed to a temporary file, which replaces the landscape file once complete if it's changed
+            with self.files.stream(self.landscapefile, 'w', encoding="utf8", errors='ignore') as fileobject:
+                self._yaml().dump(landscape, fileobject)
+            LandscapeDocument.forget(self.landscapefile)
+
+    def removeUnreferencedLogos(self):
+        '''
+        Delete the hosted logos that no item in the landscape file references any more; returns the number deleted
+        '''
+        logger = logging.getLogger()
+        if not self._itemsProcessed:
+            # most likely the items couldn't be loaded, rather than there being none
+            logger.warning("No items were added to the landscape; not removing unreferenced hosted logos")
+            return 0
+        if self._resetLandscape:
+            # the other categories, and the logos they reference, were dropped with the file rather than removed
+            logger.warning("The landscape file was reset; not removing unreferenced hosted logos")
+            return 0
+        try:
+            landscape = LandscapeDocument.load(self.landscapefile,roundTrip=False)
+        except Exception as e:
+            logger.error("Cannot read landscape file '{}' - not removing unreferenced hosted logos - '{}'".format(self.landscapefile,e))
+            return 0
+
+        # every category counts, not just the one built, as they all share the hosted logos
+        referenced = set()
+        for category in landscape.get('landscape',landscape.get('categories')) or []:
+            for subcategory in category.get('subcategories') or []:
+                for item in subcategory.get('items') or []:
+                    if item.get('logo') and urlparse(item.get('logo')).scheme == '':
+                        referenced.add(os.path.normpath(item.get('logo')))
+        removed = self.hostedLogos.removeUnreferenced(referenced)
+        logger.info("Removed {} unreferenced hosted logos".format(removed))
+
+        return removed
+
+    def saveState(self):
+        '''
+        Save the manifest of the hosted logos
+        '''
+        self.logoManifest.save()
+
+    def _spliceCategory(self):
+        '''
+        Replace just the subcategories of landscapeCategory in the landscapefile, leaving the rest of the file as it
+        is; returns False if the category can't be found, so the whole file needs rewriting
+        '''
+        index = LandscapeIndex(self.landscapefile, self.indexfile)
+        category = index.category(self.landscapeCategory)
+        if category is None:
+            logging.getLogger().info("Landscape Category '{}' not found in '{}'; rewriting the whole file".format(self.landscapeCategory,self.landscapefile))
+            return False
+
+        yamlout = io.StringIO()
+        self._yaml().dump({'landscape': [{'category': None, 'name': self.landscapeCategory, 'subcategories': self.landscapeItems}]}, yamlout)
+        lines = yamlout.getvalue().splitlines(keepends=True)
+        first = next(i for i, line in enumerate(lines) if line.startswith(' ' * self.keyIndent + 'subcategories:'))
+        subcategories = ''.join(self._indent(line, category['keyIndent'] - self.keyIndent) for line in lines[first:]).encode('utf-8', 'ignore')
+
+        logging.getLogger().debug("Splicing Landscape Category '{}' into '{}'".format(self.landscapeCategory,self.landscapefile))
+        with open(self.landscapefile, 'rb') as source, self.files.stream(self.landscapefile, 'wb') as fileobject:
+            self._copyRange(source, fileobject, category['subcategoriesStart'])
+            fileobject.write(subcategories)
+            source.seek(category['subcategoriesEnd'])
+            shutil.copyfileobj(source, fileobject)
+        index.update(self.landscapeCategory, subcategories)
+        index.save()
+        LandscapeDocument.forget(self.landscapefile)
+
+        return True
+
+    def _copyRange(self, source, destination, length):
+        while length > 0:
+            chunk = source.read(min(length, 1048576))
+            if not chunk:
+                break
+            destination.write(chunk)
+            length -= len(chunk)
+
+    def _indent(self, line, shift):
+        if not line.strip():
+            return line
+        if shift >= 0:
+            return ' ' * shift + line
+
+        return line[min(-shift, len(line) - len(line.lstrip(' '))):]
+
+    def _yaml(self):
+        ryaml = ruamel.yaml.YAML(typ='rt')
+        ryaml.Representer = LandscapeRepresenter
+        ryaml.Representer.add_representer(str,self._str_presenter)
+        ryaml.Representer.add_representer(type(None),self._none_representer)
+        ryaml.indent(mapping=2, sequence=4, offset=2)
+        ryaml.default_flow_style = False
+        ryaml.allow_unicode = True
+        ryaml.width = 1000000
+        ryaml.preserve_quotes = False
+
+        return ryaml
 
     def _str_presenter(self, dumper, data):
+        data = data.replace('\u2028',' ').replace('\x95','')
         if '\n' in data:
             return dumper.represent_scalar(u'tag:yaml.org,2002:str', data, style='|')
         if len(data.splitlines()) > 1:  # check for multiline string
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import codecs
+import json
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+## third party modules
+import requests
+
+from lfx_landscape_tools.httpsession import HTTPSession
+
+#
+# Client for the LFX project-service API which follows the API paging, so results aren't truncated at a single page and
+# at most 'prefetch' + 1 pages of pageSize records are held in memory at once ( the page being read, and up to 'prefetch'
+# pages requested ahead of it ), rather than the whole listing. Records are parsed from each page's body incrementally,
+# so a page is never decoded into one string or list of records.
+#
+# Responses go through the HTTP cache, which reads each page's body in full before it's parsed ( to store it, or
+# because it came from the cache ); the body is only streamed from the network when the cache is disabled ( i.e. when
+# recording or replaying a cassette ). Use a smaller pageSize to hold less at once.
+#
+class LFXAPIClient:
+
+    pageSize = 2000
+    prefetch = 2
+    chunkSize = 65536
+    # True when the page being read was a stale cached response still being refreshed in the background
+    stale = False
+
+    def __init__(self, pageSize: int = None, prefetch: int = None, session: requests.Session = None):
+        self.pageSize = pageSize if pageSize else self.pageSize
+        self.prefetch = prefetch if prefetch else self.prefetch
+        self._session = session
+
+    @property
+    def session(self):
+        if not self._session:
+            self._session = HTTPSession.shared()
+
+        return self._session
+
+    def pageURL(self, url, offset = 0):
+        '''
+        Returns the URL for the page of results starting at offset
+        '''
+        return "{url}{sep}pageSize={pageSize}&offset={offset}".format(url=url,sep='&' if urlparse(url).query else '?',pageSize=self.pageSize,offset=offset)
+
+    def records(self, url):
+        '''
+        Generator yielding each record from a paginated endpoint as it is parsed from its page, following the
+        'Metadata' returned with each page. Up to 'prefetch' subsequent pages are requested ahead of the page being
+        read.
+
+        Keyword arguments:
+        url -- endpoint URL without any paging parameters
+        '''
+        logger = logging.getLogger()
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            pending = deque([executor.submit(self._get,self.pageURL(url))])
+            upcoming = None
+            offset = 0
+            while pending:
+                with pending.popleft().result() as response:
+                    self.stale = self._isStale(response)
+                    stream = JSONRecordStream(response.iter_content(chunk_size=self.chunkSize))
+                    count = 0
+                    for record in stream:
+                        count += 1
+                        yield record
+                logger.debug("Read {} records at offset {} from '{}'".format(count,offset,url))
+                if offset == 0:
+                    totalSize = stream.envelope.get('Metadata',{}).get('TotalSize')
+                    if totalSize is not None:
+                        # the first page tells us how many pages there are, so queue up requests for the rest
+                        upcoming = deque(range(self.pageSize,totalSize,self.pageSize))
+                offset += self.pageSize
+                if upcoming is None:
+                    # no paging metadata; keep going until we get a short page
+                    if count == self.pageSize:
+                        pending.append(executor.submit(self._get,self.pageURL(url,offset)))
+                    continue
+                while upcoming and len(pending) < self.prefetch:
+                    pending.append(executor.submit(self._get,self.pageURL(url,upcoming.popleft())))
+
+    def stream(self, url):
+        '''
+        Generator yielding each record from a non-paginated endpoint as it is parsed
+
+        Keyword arguments:
+        url -- endpoint URL
+        '''
+        with self._get(url) as response:
+            self.stale = self._isStale(response)
+            yield from JSONRecordStream(response.iter_content(chunk_size=self.chunkSize))
+
+    def _get(self, url):
+        logging.getLogger().debug("Fetching '{}'".format(url))
+        # only streamed when the cache is disabled; otherwise the cache reads the whole page first
+        response = self.session.get(url, stream=True)
+        response.raise_for_status()
+
+        return response
+
+    def _isStale(self, response):
+        return isinstance(self.session,HTTPSession) and self.session.isStale(response.url)
+
+#
+# Incremental parser for an LFX API response body; yields each record from either a top-level JSON array or the
+# 'Data' array of an envelope object. Any other envelope keys ( such as 'Metadata' ) are collected in envelope.
+#
+class JSONRecordStream:
+
+    whitespace = ' \t\r\n'
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self.envelope = {}
+
+    def __iter__(self):
+        token = self._peek()
+        if token == '[':
+            yield from self._array()
+        elif token == '{':
+            self._pos += 1
+            while True:
+                token = self._peek()
+                if token == '}' or token == '':
+                    self._pos += 1
+                    return
+                if token == ',':
+                    self._pos += 1
+                    continue
+                key = self._value()
+                if self._peek() != ':':
+                    raise ValueError("Invalid JSON response - expected ':' after '{}'".format(key))
+                self._pos += 1
+                if self._peek() == '[' and key == 'Data':
+                    yield from self._array()
+                else:
+                    self.envelope[key] = self._value()
+        elif token != '':
+            raise ValueError("Invalid JSON response - expected an object or array")
+
+    def _array(self):
+        self._pos += 1
+        while True:
+            token = self._peek()
+            if token == ']':
+                self._pos += 1
+                return
+            if token == ',':
+                self._pos += 1
+                continue
+            if token == '':
+                raise ValueError("Invalid JSON response - unterminated array")
+            yield self._value()
+
+    def _fill(self):
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+            self._buffer = self._buffer[self._pos:] + (self._decoder.decode(chunk) if isinstance(chunk,bytes) else chunk)
+        except StopIteration:
+            self._buffer = self._buffer[self._pos:] + self._decoder.decode(b'',final=True)
+            self._eof = True
+        self._pos = 0
+
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self.whitespace:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _value(self):
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+                # a value ending right at the buffer edge ( i.e. a number ) may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
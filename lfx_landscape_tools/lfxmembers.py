@@ -6,74 +6,120 @@
 # encoding=utf8
 
 import logging
+import os
 
 # third party modules
 import requests
-import requests_cache
 
 from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.member import Member
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.deadline import Deadline
+from lfx_landscape_tools.recordstate import RecordState
+from lfx_landscape_tools.logomanifest import LogoManifest
 
 class LFXMembers(Members):
 
     project = ''
     endpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects/{}/members?orderBy=name&status=Active,At Risk' 
     endpointURLUsePublicMembershipLogo = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects/{}/members?orderBy=name&status=Active,At Risk&usePublicMembershipLogo=true' 
-    endpointURLAllAutoJoinProjects = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?autoJoinEnabled=true&pageSize=2000'
+    endpointURLAllAutoJoinProjects = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?autoJoinEnabled=true'
+
+    pageSize = LFXAPIClient.pageSize
+    prefetch = LFXAPIClient.prefetch
+    incrementalSync = True
 
     def processConfig(self, config: type[Config]):
         self.project = config.project
+        self.pageSize = config.lfxApiPageSize
+        self.prefetch = config.lfxApiPrefetch
         self.endpointURL = self.endpointURLUsePublicMembershipLogo if config.memberUsePublicMembershipLogo else self.endpointURL
         self.addOtherProjectMemberships = config.addOtherProjectMemberships 
+        # other project memberships come from other endpoints, so a member's record alone doesn't tell if it changed
+        self.incrementalSync = config.incrementalSync and not self.addOtherProjectMemberships
+        self.recordState = RecordState(
+            os.path.join(config.basedir,config.stateDir,'{}.json'.format(type(self).__name__.lower())),
+            context=[self.project,self.endpointURL]
+            )
+        self.logoManifest = LogoManifest(os.path.join(config.basedir,config.stateDir,'hostedlogos.json'))
+        self.hostedLogosDir = os.path.join(config.basedir,config.hostedLogosDir)
 
     def loadData(self):
         logger = logging.getLogger()
         logger.info("Loading LFX Members data")
 
-        with requests.get(self.endpointURL.format(self.project)) as endpointResponse:
-            memberList = endpointResponse.json()
-            logger.info('Found {} records'.format(len(memberList)))
-            for record in memberList:
-                if self.find(name=record.get('Name'),homepage_url=record.get('Website'),membership=record.get('Membership',{}).get('Name')) or self._isTestRecord(record):
-                    logger.debug("Skipping '{}'".format(record.get('Name')))
-                    continue
-
-                member = Member()
-                member.name = record.get('Name')
-                logger.info("Found LFX Member '{}'".format(member.name))
-                second_path = []
-                member.membership = record.get('Membership',{}).get('Name')
-                member.homepage_url = record.get('Website')
-                member.description = record.get('OrganizationDescription')
-                member.logo = record.get('Logo')
-                if not member.logo:
-                    logger.info("Creating text logo for '{}'".format(member.name))
-                    member.logo = SVGLogo(name=member.name)
-                member.crunchbase = record.get('CrunchBaseURL')
-                member.twitter = record.get('Twitter')
-                member.linkedin = record.get('LinkedInURL')
-                if self.addOtherProjectMemberships:
-                    for slug in self.projectsOnAutojoin:
-                        session = requests_cache.CachedSession()
-                        with session.get(self.endpointURL.format(slug)) as otherProjectMembershipsEndpointResponse:
-                            for membership in otherProjectMembershipsEndpointResponse.json():
-                                if membership.get('ID') == record.get('ID'):
-                                    logger.info("Adding other membership - {}".format(membership.get("ProjectName")))
-                                    second_path.append('Project Membership / {}'.format(membership.get("ProjectName")))
-                member.second_path = second_path
+        client = LFXAPIClient()
+        count = 0
+        reused = 0
+        for record in client.stream(self.endpointURL.format(self.project)):
+            count += 1
+            if self.find(name=record.get('Name'),homepage_url=record.get('Website'),membership=record.get('Membership',{}).get('Name')) or self._isTestRecord(record):
+                logger.debug("Skipping '{}'".format(record.get('Name')))
+                continue
+            unchanged = self.recordState.unchanged(record.get('ID'),record)
+            digest = self.recordState.current(record.get('ID'))
+            member = self._reuse(record.get('ID'),digest)
+            if member:
+                logger.debug("Reusing '{}' as the LFX record is unchanged since it was loaded".format(record.get('Name')))
+            elif unchanged:
+                member = self._restore(record.get('ID'))
+                if member:
+                    logger.debug("Reusing '{}' from the prior run as the LFX record is unchanged".format(record.get('Name')))
+                    reused += 1
+            if member:
+                member.stale = client.stale
                 self.members.append(member)
+                self._track(record.get('ID'),digest,member)
+                continue
+
+            member = Member()
+            member.name = record.get('Name')
+            logger.info("Found LFX Member '{}'".format(member.name))
+            second_path = []
+            member.membership = record.get('Membership',{}).get('Name')
+            member.homepage_url = record.get('Website')
+            member.description = record.get('OrganizationDescription')
+            member.logo = record.get('Logo')
+            if not member.logo:
+                logger.info("Creating text logo for '{}'".format(member.name))
+                member.logo = SVGLogo(name=member.name)
+            member.crunchbase = record.get('CrunchBaseURL')
+            member.twitter = record.get('Twitter')
+            member.linkedin = record.get('LinkedInURL')
+            if self.addOtherProjectMemberships and Deadline.shared().allows('other project memberships',member.name):
+                for slug in self.projectsOnAutojoin:
+                    with HTTPSession.shared().get(self.endpointURL.format(slug)) as otherProjectMembershipsEndpointResponse:
+                        for membership in otherProjectMembershipsEndpointResponse.json():
+                            if membership.get('ID') == record.get('ID'):
+                                logger.info("Adding other membership - {}".format(membership.get("ProjectName")))
+                                second_path.append('Project Membership / {}'.format(membership.get("ProjectName")))
+            member.second_path = second_path
+            member.stale = client.stale
+            self.members.append(member)
+            self._track(record.get('ID'),digest,member)
+            self._keep(record.get('ID'),member)
+
+        logger.info('Found {} records'.format(count))
+        if reused:
+            logger.info("Reused {} items from the prior run as their LFX records are unchanged".format(reused))
+
+    def saveState(self):
+        '''
+        Save the hashes of the LFX records loaded, so the next run can reuse the items for those unchanged
+        '''
+        if self.incrementalSync:
+            self.recordState.save()
 
     @property
     def projectsOnAutojoin(self):
-        session = requests_cache.CachedSession()
+        client = LFXAPIClient(pageSize=self.pageSize,prefetch=self.prefetch)
         slugs = []
-        with session.get(self.endpointURLAllAutoJoinProjects) as endpointResponse:
-            projects = endpointResponse.json()
-            for project in projects['Data']:
-                if self.project != project.get('Slug'):
-                    slugs.append(project.get('Slug'))
+        for project in client.records(self.endpointURLAllAutoJoinProjects):
+            if self.project != project.get('Slug'):
+                slugs.append(project.get('Slug'))
 
         return slugs
 
@@ -6,22 +6,25 @@
 # encoding=utf8
 
 import logging
+import os
 
 # third party modules
 import requests
-import requests_cache
 from urllib.parse import urlparse
 
 from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.member import Member
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.recordstate import RecordState
+from lfx_landscape_tools.logomanifest import LogoManifest
 
 class LFXProjects(Members):
 
     project = '' 
     defaultCrunchbase = 'https://www.crunchbase.com/organization/linux-foundation'
-    endpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=parentSlug%20eq%20{}&pageSize=2000&orderBy=name'
+    endpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=parentSlug%20eq%20{}&orderBy=name'
     singleSlugEndpointUrl = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?slug={slug}' 
     calendarUrl = 'https://zoom-lfx.platform.linuxfoundation.org/meetings/{slug}'
     icalUrl = 'https://webcal.prod.itx.linuxfoundation.org/lfx/{project_id}'
@@ -38,6 +41,9 @@ class LFXProjects(Members):
     addParentProject = True
     addCategory = True
     landscapeProjectsLevels = {}
+    pageSize = LFXAPIClient.pageSize
+    prefetch = LFXAPIClient.prefetch
+    incrementalSync = True
 
     def processConfig(self, config: type[Config]):
         self.project = config.slug
@@ -50,98 +56,133 @@ class LFXProjects(Members):
         self.artworkRepoUrl = config.artworkRepoUrl
         self.projectsFilterByParentSlug = config.projectsFilterByParentSlug
         self.landscapeProjectsLevels = config.landscapeProjectsLevels
+        self.pageSize = config.lfxApiPageSize
+        self.prefetch = config.lfxApiPrefetch
+        self.projectDirectory = config.projectDirectory
+        self.incrementalSync = config.incrementalSync
+        self.recordState = RecordState(
+            os.path.join(config.basedir,config.stateDir,'{}.json'.format(type(self).__name__.lower())),
+            context=[self.project,self.addTechnologySector,self.addIndustrySector,self.addPMOManagedStatus,self.addParentProject,self.addCategory,self.defaultCrunchbase,self.artworkRepoUrl,self.landscapeProjectsLevels]
+            )
+        self.logoManifest = LogoManifest(os.path.join(config.basedir,config.stateDir,'hostedlogos.json'))
+        self.hostedLogosDir = os.path.join(config.basedir,config.hostedLogosDir)
 
     def loadData(self):
         logger = logging.getLogger()
         logger.info("Loading LFX Projects data for {}".format(self.project))
 
-        session = requests_cache.CachedSession()
-        with session.get(self.endpointURL.format(self.project if self.projectsFilterByParentSlug else '')) as endpointResponse:
-            memberList = endpointResponse.json()
-            for record in memberList['Data']:
-                if self.find(name=record.get('Name'),homepage_url=record.get('Website'),slug=record.get('Slug')):
-                    logger.debug("Skipping '{}'".format(record.get('Name')))
-                    continue
-                if self.activeOnly and record['Status'] != 'Active':
-                    logger.debug("Skipping '{}'".format(record.get('Name')))
-                    continue
-                if not record.get('DisplayOnWebsite'):
-                    logger.debug("Skipping '{}'".format(record.get('Name')))
-                    continue
-                if record.get('TestRecord'):
-                    logger.debug("Skipping '{}'".format(record.get('Name')))
-                    continue
-
-                second_path = []
-                extra = {}
-                annotations = {}
-                other_links = []
-                member = Member()
-                member.membership = 'All'
-                member.name = record.get('Name')
-                logger.info("Found LFX Project '{}'".format(member.name))
-                extra['lfx_slug'] = record.get('Slug')
-                member.license = record.get('PrimaryOpenSourceLicense')
-                # Let's not include the root project
-                if extra.get('lfx_slug') == self.project:
-                    continue
-                member.repo_url = record.get('RepositoryURL')
-                extra['accepted'] = record.get('StartDate')
-                extra['archived'] = record.get('ProjectEntityDissolutionDate')
-                member.description = record.get('Description')
-                if self.addCategory and record.get('Category'):
-                    for projectLevel in self.landscapeProjectsLevels:
-                        if projectLevel.get('name') == record.get('Category'):
-                            member.project = projectLevel.get('level')
-                            member.membership = projectLevel.get('name')
-                            logger.debug("Project level is {} - {}".format(member.project,member.membership))
-                            break
-                member.homepage_url = record.get('Website')
-                if not member.homepage_url and record.get('RepositoryURL'):
-                    logger.debug("Trying to use 'RepositoryURL' for 'homepage_url' instead")
-                    member.homepage_url = record.get('RepositoryURL')
-                if self.addParentProject:
-                    parentProject = self.lookupParentProjectBySlug(record.get('ParentSlug',self.project))
-                    if parentProject and "Membership" in parentProject.get("Model",[]):
-                        second_path.append('Project Group / {}'.format(parentProject.get("Name").replace("/",":")))
-                member.logo = record.get('ProjectLogo')
-                if not member.logo:
-                    logger.info("Creating text logo for '{}'".format(member.name))
-                    member.logo = SVGLogo(name=member.name)
-                member.crunchbase = record.get('CrunchBaseUrl',self.defaultCrunchbase)
-                member.linkedin = record.get('LinkedIn')
-                member.twitter = record.get('Twitter')
-                extra['facebook_url'] = record.get('Facebook')
-                extra['reddit_url'] = record.get('Reddit')
-                extra['pinterest_url'] = record.get('Pinterest')
-                extra['youtube_url'] = record.get('YouTube')
-                if self.addPMOManagedStatus and record.get('HasProgramManager'):
-                    second_path.append('PMO Managed / All')
-                if self.addIndustrySector and record.get('IndustrySector') != '':
-                    second_path.append('Industry / {}'.format(record['IndustrySector'].replace("/",":")))
-                if self.addTechnologySector and record.get('TechnologySector') != '':
-                    sectors = record['TechnologySector'].split(";")
-                    for sector in sectors:
-                        second_path.append('Technology Sector / {}'.format(sector.replace("/",":")))
-                extra['dev_stats_url'] = self.lfxinsightsUrl.format(parent_slug=record.get('ParentSlug',self.project),slug=extra.get('lfx_slug'))
-                other_links.append({'name': 'Calendar','url': self.calendarUrl.format(slug=extra.get('lfx_slug'))})
-                other_links.append({'name': 'iCal', 'url': self.icalUrl.format(project_id=record.get('ProjectID'))})
-                other_links.append({'name': 'Charter', 'url': record.get('CharterURL')})
-                if self.artworkRepoUrl:
-                    extra['artwork_url'] = self.artworkRepoUrl.format(slug=extra.get('lfx_slug'))
-                extra['annotations'] = annotations
-                extra['other_links'] = other_links
-                member.extra = extra
-                member.second_path = second_path
+        reused = 0
+        client = LFXAPIClient(pageSize=self.pageSize,prefetch=self.prefetch)
+        for record in client.records(self.endpointURL.format(self.project if self.projectsFilterByParentSlug else '')):
+            if self.find(name=record.get('Name'),homepage_url=record.get('Website'),slug=record.get('Slug')):
+                logger.debug("Skipping '{}'".format(record.get('Name')))
+                continue
+            if self.activeOnly and record['Status'] != 'Active':
+                logger.debug("Skipping '{}'".format(record.get('Name')))
+                continue
+            if not record.get('DisplayOnWebsite'):
+                logger.debug("Skipping '{}'".format(record.get('Name')))
+                continue
+            if record.get('TestRecord'):
+                logger.debug("Skipping '{}'".format(record.get('Name')))
+                continue
+            # Let's not include the root project
+            if record.get('Slug') == self.project:
+                continue
+            # the parent project is part of the item too, so a change to it means the item needs rebuilding
+            parentProject = self.lookupParentProjectBySlug(record.get('ParentSlug',self.project)) if self.addParentProject else None
+            unchanged = self.recordState.unchanged(record.get('Slug'),record,context=[parentProject.get('Name'),parentProject.get('Model')] if parentProject else None)
+            digest = self.recordState.current(record.get('Slug'))
+            member = self._reuse(record.get('Slug'),digest)
+            if member:
+                logger.debug("Reusing '{}' as the LFX record is unchanged since it was loaded".format(record.get('Name')))
+            elif unchanged:
+                member = self._restore(record.get('Slug'))
+                if member:
+                    logger.debug("Reusing '{}' from the prior run as the LFX record is unchanged".format(record.get('Name')))
+                    reused += 1
+            if member:
+                member.stale = client.stale or ( self.addParentProject and self.projectDirectory.stale )
                 self.members.append(member)
+                self._track(record.get('Slug'),digest,member)
+                continue
+
+            second_path = []
+            extra = {}
+            annotations = {}
+            other_links = []
+            member = Member()
+            member.membership = 'All'
+            member.name = record.get('Name')
+            logger.info("Found LFX Project '{}'".format(member.name))
+            extra['lfx_slug'] = record.get('Slug')
+            member.license = record.get('PrimaryOpenSourceLicense')
+            member.repo_url = record.get('RepositoryURL')
+            extra['accepted'] = record.get('StartDate')
+            extra['archived'] = record.get('ProjectEntityDissolutionDate')
+            member.description = record.get('Description')
+            if self.addCategory and record.get('Category'):
+                for projectLevel in self.landscapeProjectsLevels:
+                    if projectLevel.get('name') == record.get('Category'):
+                        member.project = projectLevel.get('level')
+                        member.membership = projectLevel.get('name')
+                        logger.debug("Project level is {} - {}".format(member.project,member.membership))
+                        break
+            member.homepage_url = record.get('Website')
+            if not member.homepage_url and record.get('RepositoryURL'):
+                logger.debug("Trying to use 'RepositoryURL' for 'homepage_url' instead")
+                member.homepage_url = record.get('RepositoryURL')
+            if self.addParentProject and parentProject and "Membership" in parentProject.get("Model",[]):
+                second_path.append('Project Group / {}'.format(parentProject.get("Name").replace("/",":")))
+            member.logo = record.get('ProjectLogo')
+            if not member.logo:
+                logger.info("Creating text logo for '{}'".format(member.name))
+                member.logo = SVGLogo(name=member.name)
+            member.crunchbase = record.get('CrunchBaseUrl',self.defaultCrunchbase)
+            member.linkedin = record.get('LinkedIn')
+            member.twitter = record.get('Twitter')
+            extra['facebook_url'] = record.get('Facebook')
+            extra['reddit_url'] = record.get('Reddit')
+            extra['pinterest_url'] = record.get('Pinterest')
+            extra['youtube_url'] = record.get('YouTube')
+            if self.addPMOManagedStatus and record.get('HasProgramManager'):
+                second_path.append('PMO Managed / All')
+            if self.addIndustrySector and record.get('IndustrySector') != '':
+                second_path.append('Industry / {}'.format(record['IndustrySector'].replace("/",":")))
+            if self.addTechnologySector and record.get('TechnologySector') != '':
+                sectors = record['TechnologySector'].split(";")
+                for sector in sectors:
+                    second_path.append('Technology Sector / {}'.format(sector.replace("/",":")))
+            extra['dev_stats_url'] = self.lfxinsightsUrl.format(parent_slug=record.get('ParentSlug',self.project),slug=extra.get('lfx_slug'))
+            other_links.append({'name': 'Calendar','url': self.calendarUrl.format(slug=extra.get('lfx_slug'))})
+            other_links.append({'name': 'iCal', 'url': self.icalUrl.format(project_id=record.get('ProjectID'))})
+            other_links.append({'name': 'Charter', 'url': record.get('CharterURL')})
+            if self.artworkRepoUrl:
+                extra['artwork_url'] = self.artworkRepoUrl.format(slug=extra.get('lfx_slug'))
+            extra['annotations'] = annotations
+            extra['other_links'] = other_links
+            member.extra = extra
+            member.second_path = second_path
+            member.stale = client.stale or ( self.addParentProject and self.projectDirectory.stale )
+            self.members.append(member)
+            self._track(record.get('Slug'),digest,member)
+            self._keep(record.get('Slug'),member)
+
+        if reused:
+            logger.info("Reused {} items from the prior run as their LFX records are unchanged".format(reused))
+
+    def saveState(self):
+        '''
+        Save the hashes of the LFX records loaded, so the next run can reuse the items for those unchanged
+        '''
+        if self.incrementalSync:
+            self.recordState.save()
 
     def lookupParentProjectBySlug(self, slug):
-        session = requests_cache.CachedSession()
         if slug:
-            with session.get(self.singleSlugEndpointUrl.format(slug=slug)) as endpointResponse:
-                parentProject = endpointResponse.json()
-                if len(parentProject.get('Data',[])) > 0: 
-                    return parentProject['Data'][0]
-                logging.getLogger().warning("Couldn't find project for slug '{}'".format(slug)) 
+            parentProject = self.projectDirectory.bySlug(slug)
+            if parentProject:
+                return parentProject
+            logging.getLogger().warning("Couldn't find project for slug '{}'".format(slug)) 
         
         return False
@@ -8,4 +8,4 @@
 from lfx_landscape_tools.lfxprojects import LFXProjects
 
 class LFXProjectsEU(LFXProjects):
-    endpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?legalParentName=Linux%20Foundation%20Europe&pageSize=2000&orderBy=name'
+    endpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?legalParentName=Linux%20Foundation%20Europe&orderBy=name'
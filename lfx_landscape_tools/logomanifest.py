@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import hashlib
+import json
+import logging
+import os
+
+#
+# Manifest of the hosted logos, kept in a sidecar file. For each file in the hosted logos directory it records the
+# items the logo is for ( with content addressed logos, many items can share one file ), the hash of its contents,
+# its size and modification time once written, and the last run that referenced it. Each time the manifest is loaded
+# is a new run.
+#
+# A hosted logo whose size and modification time are still the ones recorded is taken to still have the recorded
+# hash, so it doesn't need reading to know what's in it. The file each item last referenced is indexed by item name
+# when the manifest is loaded, so an item's logo is found without going through every entry.
+#
+class LogoManifest:
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.run, self.logos = self._load()
+        # item name to the hosted logo filename it last referenced; the latest run wins for items in several entries
+        self._owners = {}
+        for filename, entry in sorted(self.logos.items(), key=lambda logo: logo[1].get('lastRun',0)):
+            for owner in entry.get('owners',[]):
+                self._owners[owner] = filename
+
+    def __len__(self):
+        return len(self.logos)
+
+    @staticmethod
+    def digest(contents: str):
+        '''
+        Returns the hash of the logo contents
+        '''
+        return hashlib.sha256(contents.encode('utf-8')).hexdigest()
+
+    def get(self, filename):
+        '''
+        Returns the entry for the hosted logo filename, or None if there isn't one
+        '''
+        return self.logos.get(filename)
+
+    def owned(self, owner):
+        '''
+        Returns the hosted logo filename the item owner last referenced, or None if it hasn't referenced one
+        '''
+        return self._owners.get(owner)
+
+    def find(self, owner, digest, path):
+        '''
+        Returns the path of the hosted logo the item owner last referenced, in the hosted logos directory path, if
+        it's still as recorded with contents hashing to digest; otherwise None
+        '''
+        filename = self._owners.get(owner)
+        if filename is None:
+            return None
+        filenamepath = os.path.normpath(os.path.join(path, filename))
+
+        return filenamepath if self.unchanged(filename, filenamepath) == digest else None
+
+    def reference(self, filename, owner, digest):
+        '''
+        Record that the item owner uses the hosted logo filename, with contents hashing to digest, in this run
+        '''
+        entry = self.logos.setdefault(filename, {})
+        if entry.get('lastRun') != self.run or entry.get('hash') != digest:
+            entry['owners'] = []
+        if entry.get('hash') != digest:
+            # the file is about to be rewritten, so what's recorded about it on disk no longer holds
+            entry.pop('size', None)
+            entry.pop('mtime', None)
+        if owner not in entry['owners']:
+            entry['owners'].append(owner)
+        entry['hash'] = digest
+        entry['lastRun'] = self.run
+        self._owners[owner] = filename
+
+    def stat(self, filename, filenamepath):
+        '''
+        Record the size and modification time of the hosted logo filename, as written to filenamepath
+        '''
+        entry = self.logos.get(filename)
+        if entry is None:
+            return
+        try:
+            stat = os.stat(filenamepath)
+        except OSError:
+            entry.pop('size', None)
+            entry.pop('mtime', None)
+            return
+        entry['size'] = stat.st_size
+        entry['mtime'] = stat.st_mtime_ns
+
+    def unchanged(self, filename, filenamepath):
+        '''
+        Returns the recorded hash of the hosted logo filename if the file at filenamepath is still as it was
+        recorded, or None if it isn't or there's no record of it
+        '''
+        entry = self.logos.get(filename)
+        if not entry or 'size' not in entry or 'mtime' not in entry:
+            return None
+        try:
+            stat = os.stat(filenamepath)
+        except OSError:
+            return None
+
+        return entry.get('hash') if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime'] else None
+
+    def remove(self, filename):
+        '''
+        Drop the entry for the hosted logo filename, i.e. once it's been deleted
+        '''
+        entry = self.logos.pop(filename, None)
+        for owner in entry.get('owners',[]) if entry else []:
+            if self._owners.get(owner) == filename:
+                del self._owners[owner]
+
+    def save(self):
+        '''
+        Save the manifest to the sidecar file
+        '''
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            with open(self.filename, 'w', encoding="utf8") as fileobject:
+                json.dump({'run': self.run, 'logos': self.logos}, fileobject, indent=2, sort_keys=True)
+        except OSError as e:
+            logging.getLogger().warning("Cannot save hosted logos manifest '{}' - error message '{}'".format(self.filename,e))
+
+    def _load(self):
+        if not os.path.isfile(self.filename):
+            return 1, {}
+
+        try:
+            with open(self.filename, 'r', encoding="utf8") as fileobject:
+                manifest = json.load(fileobject)
+        except (OSError, ValueError) as e:
+            logging.getLogger().warning("Cannot read hosted logos manifest '{}' - error message '{}'".format(self.filename,e))
+            return 1, {}
+
+        if not isinstance(manifest,dict) or not isinstance(manifest.get('logos'),dict):
+            return 1, {}
+
+        return manifest.get('run',0) + 1, manifest['logos']
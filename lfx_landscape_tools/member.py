@@ -6,22 +6,23 @@
 # encoding=utf8
 
 ## built in modules
+import copy
 import os
 from urllib.parse import urlparse
 import logging
-import socket
+import time
 from typing import Self
 
 ## third party modules
 from url_normalize import url_normalize
 import validators
 import requests
-import requests_cache
-from github import Github, GithubException, RateLimitExceededException, Auth
 import ruamel.yaml
 from bs4 import BeautifulSoup
 
 from lfx_landscape_tools.svglogo import SVGLogo
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.deadline import Deadline
 
 #
 # Member object to ensure we have normalization on fields. Only fields that are required or need validation are defined; others can be added dynamically.
@@ -34,6 +35,10 @@ class Member:
     __extra = {}
     project = None
     project_org = None
+    # GitHub search for the repos in an org; done through the shared session, so it's cached like any other request
+    githubSearchURL = 'https://api.github.com/search/repositories'
+    # attempts at the search when GitHub has a server error or the API rate limit is hit
+    githubAttempts = 3
     additional_repos = []
     __name = None
     __homepage_url = None
@@ -45,6 +50,8 @@ class Member:
 
     # config properties
     entrysuffix = ''
+    # built from stale cached data
+    stale = False
 
     # schema for items entries
     itemschema = []
@@ -53,7 +60,7 @@ class Member:
         # load in data schema from landscape2
         try:
             schemaURL = 'https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml'
-            endpointResponse = requests_cache.CachedSession().get(schemaURL)
+            endpointResponse = HTTPSession.shared().get(schemaURL)
             endpointResponse.raise_for_status() 
             dataschema = ruamel.yaml.YAML().load(endpointResponse.text)
         except requests.exceptions.RequestException as e:
@@ -63,6 +70,13 @@ class Member:
         else:
             self.itemschema = dataschema.get('categories',{})[0].get('subcategories',{})[0].get('items',{})[0]
 
+    def clone(self):
+        '''
+        Returns a copy of this Member which can be changed without changing this one
+        '''
+        # the schema is the same for every Member and never changed, so no need to copy it
+        return copy.deepcopy(self,{id(self.itemschema): self.itemschema})
+
     def __dir__(self):
         returnvalue = list(self.itemschema.keys())
         returnvalue.append('linkedin')
@@ -91,7 +105,11 @@ class Member:
             self.__repo_url = None
         elif repo_url is not None:
             repo_url = url_normalize(repo_url.rstrip("/"), default_scheme='https')
-            if self._isGitHubOrg(repo_url):
+            if self._isGitHubOrg(repo_url) and not Deadline.shared().allows('GitHub org resolution',self.name):
+                logging.getLogger().info("Not finding the GitHub Repo for GitHub Org {} for '{}' to meet the deadline".format(repo_url,self.name))
+                self.project_org = None
+                self.__repo_url = None
+            elif self._isGitHubOrg(repo_url):
                 logging.debug("{} is determined to be a GitHub Org for '{}' - finding related GitHub Repo".format(repo_url,self.name))
                 try:
                     found_repo_url = self._getPrimaryGitHubRepoFromGitHubOrg(repo_url)
@@ -133,31 +151,48 @@ class Member:
         if len(self._getPinnedGithubReposFromGithubOrg(url)) > 0:
             return self._getPinnedGithubReposFromGithubOrg(url)[0]
 
-        with requests_cache.enabled():
-            while True:
-                try:
-                    if 'GITHUB_TOKEN' in os.environ:
-                        g = Github(auth=Auth.Token(os.environ['GITHUB_TOKEN']), per_page=1000)
-                    else:
-                        g = Github(per_page=1000)
-                    repos = g.search_repositories(query="org:{}".format(urlparse(url).path.split("/")[1]),sort="stars",order="desc")
-                    if len(list(repos)) > 0:
-                        return repos[0].html_url
-                    else:
-                        return ''
-                except RateLimitExceededException:
-                    logging.info("Sleeping until we get past the API rate limit....")
-                    time.sleep(g.rate_limiting_resettime-now())
-                except GithubException as e:
-                    if e.status == 502:
-                        logging.debug("Server error - retrying...")
-                    if e.status == 404:
-                        return False
-                    else:
-                        logging.getLogger().warning(e.data)
-                        return
-                except socket.timeout:
-                    logging.debug("Server error - retrying...")
+        headers = {'Accept': 'application/vnd.github+json'}
+        if 'GITHUB_TOKEN' in os.environ:
+            headers['Authorization'] = 'Bearer {}'.format(os.environ['GITHUB_TOKEN'])
+        params = {'q': 'org:{}'.format(urlparse(url).path.split("/")[1]), 'sort': 'stars', 'order': 'desc', 'per_page': 1}
+        for attempt in range(self.githubAttempts):
+            try:
+                response = HTTPSession.shared().get(self.githubSearchURL, params=params, headers=headers)
+            except requests.exceptions.RequestException as e:
+                logging.getLogger().warning("Cannot search GitHub Org {} - error message '{}'".format(url,e))
+                return
+            if response.status_code in [403,429] and ( response.headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in response.headers ):
+                wait = self._githubRateLimitWait(response)
+                available = Deadline.shared().available()
+                if not Deadline.shared().allows('GitHub org resolution',self.name):
+                    logging.info("Not waiting for the API rate limit to find the GitHub Repo for GitHub Org {} for '{}' to meet the deadline".format(url,self.name))
+                    return
+                if available is not None and wait > available:
+                    Deadline.shared().skip('GitHub org resolution',self.name)
+                    logging.info("Not waiting {:.0f} seconds for the API rate limit to find the GitHub Repo for GitHub Org {} for '{}' to meet the deadline".format(wait,url,self.name))
+                    return
+                if attempt + 1 < self.githubAttempts:
+                    logging.info("Sleeping {:.0f} seconds until we get past the API rate limit....".format(wait))
+                    time.sleep(wait)
+            elif response.status_code == 502:
+                logging.debug("Server error - retrying...")
+            elif response.status_code == 404:
+                return False
+            elif response.status_code != 200:
+                logging.getLogger().warning(response.text)
+                return
+            else:
+                repos = response.json().get('items',[])
+                return repos[0].get('html_url') if repos else ''
+
+        logging.getLogger().warning("Cannot search GitHub Org {} after {} attempts".format(url,self.githubAttempts))
+
+    def _githubRateLimitWait(self, response):
+        # seconds until the rate limit resets; a secondary rate limit says how long to wait instead
+        if 'Retry-After' in response.headers:
+            return max(0, int(response.headers['Retry-After']))
+
+        return max(0, int(response.headers.get('X-RateLimit-Reset',0)) - time.time())
 
     def _getPinnedGithubReposFromGithubOrg(self, url):
         if not self._isGitHubOrg(url):
@@ -166,7 +201,7 @@ class Member:
         repos = []
 
         try:
-            orgPageResponse = requests_cache.CachedSession().get(url)
+            orgPageResponse = HTTPSession.shared().get(url)
             orgPageResponse.raise_for_status()
         except requests.exceptions.RequestException as e:
             logging.getLogger().error("Cannot load {} - error message '{}'".format(url,e))
@@ -243,15 +278,15 @@ class Member:
             self.__logo = logo
         elif urlparse(logo).scheme != '':
             self.__logo = SVGLogo(url=logo)
+            if self.__logo.skipped:
+                logging.getLogger().info("Creating text logo for '{}' to meet the deadline".format(self.name))
+                self.__logo = SVGLogo(name=self.name)
         else:
             self.__logo = SVGLogo(filename=logo)
 
         if not self.__logo.isValid():
             self.__logo = None
             logging.getLogger().warning("Member.logo for '{name}' invalid format".format(name=self.name))
-    
-    def hostLogo(self, path = "./"):
-        self.__logo.save(self.name,path)
 
     @property
     def twitter(self):
@@ -367,6 +402,17 @@ class Member:
 
         return returnentry
         
+    def loadLandscapeItemAttributes(self, item: dict):
+        '''
+        Set this Member from the attributes of a landscape item, other than the name and logo
+        '''
+        for key, value in item.items():
+            if key not in ['item','name','homepage_url','logo']:
+                logging.getLogger().debug("Setting '{}' to '{}' for '{}'".format(key,value,self.name))
+                setattr(self, key, value)
+        self.homepage_url = item.get('homepage_url')
+        self.linkedin = item.get('extra',{}).get('linkedin_url')
+
     def isValidLandscapeItem(self):
         return self.homepage_url and self.logo and self.name
 
@@ -6,6 +6,7 @@
 # encoding=utf8
 
 ## built in modules
+import copy
 import re
 from abc import ABC, abstractmethod
 from typing import Self
@@ -15,15 +16,27 @@ import logging
 from url_normalize import url_normalize
 
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.member import Member
+from lfx_landscape_tools.svglogo import SVGLogo
+from lfx_landscape_tools.logomanifest import LogoManifest
 
 #
 # Abstract Members class to normalize the methods used for the other ways of getting a member's info
 #
 class Members(ABC):
 
+    # set by loaders that keep the items they build for the next run to reuse; see _keep() and _restore()
+    incrementalSync = False
+    recordState = None
+    logoManifest = None
+    hostedLogosDir = None
+
     def __init__(self, config: type[Config], loadData = True):
         self.processConfig(config)
         self.members = []
+        # items built from each record this run, with the record hash, for refresh() to reuse
+        self._builtItems = {}
+        self._reusableItems = {}
         if loadData:
             self.loadData()
 
@@ -35,6 +48,82 @@ class Members(ABC):
     def loadData(self):
         pass
 
+    def clone(self):
+        '''
+        Returns a copy of these Members, with copies of each Member, so either can be changed without changing the other
+        '''
+        members = copy.copy(self)
+        members.members = [member.clone() for member in self.members]
+
+        return members
+
+    def refresh(self):
+        '''
+        Load the data again, i.e. once the stale data it was loaded from has been refreshed; items built from records
+        that haven't changed since are reused rather than built again. Returns these Members.
+        '''
+        self._reusableItems = self._builtItems
+        self._builtItems = {}
+        self.members = []
+        try:
+            self.loadData()
+        finally:
+            self._reusableItems = {}
+
+        return self
+
+    def saveState(self):
+        '''
+        Save any state kept for the next run, once the items loaded have been saved to the landscape
+        '''
+        pass
+
+    def _reuse(self, key, digest):
+        '''
+        Returns the item built earlier in the run from the record for key, if the record still has the hash digest
+        '''
+        item = self._reusableItems.get(key)
+
+        return item[1] if item and digest and item[0] == digest else None
+
+    def _track(self, key, digest, member):
+        '''
+        Record that member was built from the record for key with the hash digest, so refresh() can reuse it
+        '''
+        self._builtItems[key] = (digest, member)
+
+    def _keep(self, key, member):
+        '''
+        Keep member, as built from the record for key, for the next run to restore if the record is unchanged
+        '''
+        if not self.incrementalSync or not member.logo:
+            return
+        # the hosted logo is found again by its hash, so the logo needn't be fetched
+        self.recordState.keep(key, {
+            'item': member.toLandscapeItemAttributes(),
+            'membership': member.membership,
+            'logo': member.logo.digest if member.logo.digest else LogoManifest.digest(str(member.logo))
+            })
+
+    def _restore(self, key):
+        '''
+        Returns the item kept on the prior run for the record for key, as it was built from that record, or None if
+        there isn't one or its hosted logo has changed since
+        '''
+        kept = self.recordState.item(key) if self.incrementalSync else None
+        logofile = self.logoManifest.find(kept['item'].get('name'),kept.get('logo'),self.hostedLogosDir) if kept else None
+        if not logofile:
+            return None
+
+        member = Member()
+        member.name = kept['item'].get('name')
+        member.loadLandscapeItemAttributes(kept['item'])
+        member.membership = kept.get('membership')
+        member.logo = SVGLogo(filename=logofile,digest=kept.get('logo'))
+        self.recordState.keep(key, kept)
+
+        return member
+
     def find(self, name, homepage_url, slug = None, membership = None, repo_url = None):
         '''
         Find Member object in this Members object that match the criteria given.
@@ -91,6 +180,7 @@ class Members(ABC):
             for foundmember in foundmembers:
                 logging.getLogger().debug("Found item to check for overlay '{}'".format(foundmember.name)) 
                 member.overlay(membertooverlay=foundmember,onlykeys=onlykeys,skipkeys=skipkeys)
+                member.stale = member.stale or foundmember.stale
 
     def normalizeName(self, name):
         if name is None:
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+from fnmatch import fnmatch
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.sourceregistry import SourceRegistry
+from lfx_landscape_tools.lfxprojects import LFXProjects
+from lfx_landscape_tools.landscapemembers import LandscapeMembers
+from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+
+#
+# Merges the items from several sources in a single pass, using the source precedence for each field set in the
+# config ( syncMergePrecedence ). Each item from the base source is matched once with the items in every other source,
+# and then each field is overlaid from the matched items in order of precedence, lowest first; so scalar values come
+# from the highest precedence source that has one, and lists are combined with the highest precedence values first.
+#
+# Sources are matched in the order of the '*' precedence, lowest first, each using the name, homepage_url and slug the
+# item has with the sources matched before it overlaid; so an item the landscape renames is matched in the TAC data by
+# its landscape name, as it was when the sources were overlaid one after the other.
+#
+# Precedence is given as a mapping of field name patterns ( i.e. 'extra' or 'extra.*' for all of extra ) to the
+# source names, highest precedence first; '*' is the precedence for any field not otherwise matched.
+#
+class MergePipeline:
+
+    base = 'lfx'
+    sourceTypes = {
+        'lfx': LFXProjects,
+        'tac': TACAgendaProject,
+        'landscape': LandscapeMembers,
+    }
+    precedence = {
+        '*': ['lfx','tac','landscape'],
+        'extra': ['tac','lfx','landscape'],
+    }
+
+    loadMode = 'threads'
+
+    def __init__(self, config: Config, sources: SourceRegistry = None, sourceTypes: dict = None, base = None, precedence: dict = None, loadMode = None):
+        self.sources = sources if sources else SourceRegistry(config)
+        self.loadMode = loadMode if loadMode else config.syncLoadMode
+        self.sourceTypes = sourceTypes if sourceTypes else self.sourceTypes
+        self.base = base if base else self.base
+        self.precedence = precedence if precedence else config.syncMergePrecedence
+        if self.base not in self.sourceTypes:
+            raise ValueError("Invalid merge base source '{}'".format(self.base))
+        for pattern, names in self.precedence.items():
+            for name in names:
+                if name not in self.sourceTypes:
+                    raise ValueError("Invalid source '{}' in merge precedence for '{}'".format(name,pattern))
+
+    def fieldPrecedence(self, field):
+        '''
+        Returns the source names for field, highest precedence first
+        '''
+        for pattern, names in self.precedence.items():
+            if pattern != '*' and fnmatch(field, pattern.removesuffix('.*')):
+                return names
+
+        return self.precedence.get('*',[])
+
+    def matchOrder(self, names):
+        '''
+        Returns the source names in the order they are matched with each item; lowest '*' precedence first
+        '''
+        order = list(reversed(self.fieldPrecedence('*')))
+
+        return [name for name in order if name in names] + [name for name in names if name not in order]
+
+    def refresh(self):
+        '''
+        Refresh the sources with items built from stale data, then returns the items merged again
+        '''
+        self.sources.refresh()
+
+        return self.merge()
+
+    def merge(self):
+        '''
+        Returns a copy of the base source items with the fields from every source merged in
+        '''
+        logger = logging.getLogger()
+        names = []
+        for fieldNames in self.precedence.values():
+            names.extend(name for name in fieldNames if name not in names)
+        # the sources don't depend on each other until they are merged, so are loaded together
+        self.sources.load([self.sourceTypes[name] for name in [self.base] + names],mode=self.loadMode)
+        logger.info("Merging {} data into {} items".format(", ".join(names),self.base))
+        items = self.sources.clone(self.sourceTypes[self.base])
+        sources = {name: self.sources.get(self.sourceTypes[name]) for name in names}
+
+        for member in items.members:
+            logger.debug("Merging item '{}'".format(member.name))
+            keys = {'name': member.name, 'homepage_url': member.homepage_url, 'slug': member.extra.get('lfx_slug')}
+            matches = {}
+            for name in self.matchOrder(names):
+                matches[name] = sources[name].find(**keys)
+                for foundmember in matches[name]:
+                    keys['name'] = foundmember.name if foundmember.name is not None else keys['name']
+                    keys['homepage_url'] = foundmember.homepage_url if foundmember.homepage_url is not None else keys['homepage_url']
+                    keys['slug'] = foundmember.extra.get('lfx_slug') if foundmember.extra.get('lfx_slug') is not None else keys['slug']
+            # fields sharing the same precedence are overlaid together
+            fieldsByOrder = {}
+            for name, foundmembers in matches.items():
+                for foundmember in foundmembers:
+                    for field in dir(foundmember):
+                        fields = fieldsByOrder.setdefault(tuple(reversed(self.fieldPrecedence(field))),[])
+                        if field not in fields:
+                            fields.append(field)
+            for order, fields in fieldsByOrder.items():
+                for name in order:
+                    for foundmember in matches.get(name,[]):
+                        member.overlay(membertooverlay=foundmember,onlykeys=fields)
+            for foundmembers in matches.values():
+                for foundmember in foundmembers:
+                    member.stale = member.stale or foundmember.stale
+
+        return items
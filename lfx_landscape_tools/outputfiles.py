@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager, suppress
+
+#
+# Writes the files a build outputs ( landscape.yml and the hosted logos ), skipping any whose contents are the same
+# as what's already on disk so unchanged files keep their modification times and don't trigger downstream rebuilds.
+# Counts the files written and skipped for the run summary.
+#
+# Files are written to a temporary file in the same directory, which is synced to disk and then renamed over the
+# file, so a crash part way through never leaves a partly written file in place.
+#
+class OutputFiles:
+
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def write(self, filename, contents: str, encoding = 'utf-8', errors = 'strict'):
+        '''
+        Write contents to filename unless it already has those contents; returns True if the file was written
+
+        Keyword arguments:
+        filename -- file to write
+        contents -- text to write to it
+        encoding -- encoding to write the text in
+        errors -- how encoding errors are handled, as for str.encode()
+        '''
+        data = contents.encode(encoding, errors)
+        if self.unchanged(filename, data):
+            self.skip(filename)
+            return False
+
+        with self.stream(filename, 'wb', check=False) as fileobject:
+            fileobject.write(data)
+
+        return True
+
+    @contextmanager
+    def stream(self, filename, mode = 'w', check: bool = True, **kwargs):
+        '''
+        Context manager giving a file object to stream the new contents of filename into; once it's closed, the
+        contents replace filename unless they are the same as what's already there. If an error is raised before then,
+        filename is left as it was.
+
+        Keyword arguments:
+        filename -- file to write
+        mode -- 'w' to write text or 'wb' to write bytes
+        check -- False to always replace filename, i.e. when it's already known to be different
+        kwargs -- passed to open(), i.e. encoding or errors
+        '''
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmpfilename = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(filename)), suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, mode, **kwargs) as fileobject:
+                yield fileobject
+                fileobject.flush()
+                unchanged = check and self._sameContents(tmpfilename, filename)
+                if not unchanged:
+                    os.fsync(fileobject.fileno())
+            if unchanged:
+                os.unlink(tmpfilename)
+                self.skip(filename)
+                return
+
+            os.chmod(tmpfilename, self._mode(filename, tmpfilename))
+            os.replace(tmpfilename, filename)
+            self._syncDirectory(directory)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmpfilename)
+            raise
+        with self._lock:
+            self.written += 1
+
+    def skip(self, filename):
+        '''
+        Count filename as skipped, i.e. when it's already known to be unchanged without comparing it
+        '''
+        logging.getLogger().debug("Skipping unchanged file '{}'".format(filename))
+        with self._lock:
+            self.skipped += 1
+
+    def unchanged(self, filename, data: bytes):
+        '''
+        Returns True if filename exists and has the contents data
+        '''
+        try:
+            if os.path.getsize(filename) != len(data):
+                return False
+            return self._digest(filename) == hashlib.sha256(data).digest()
+        except OSError:
+            return False
+
+    def _sameContents(self, filename, otherfilename):
+        try:
+            if os.path.getsize(filename) != os.path.getsize(otherfilename):
+                return False
+            return self._digest(filename) == self._digest(otherfilename)
+        except OSError:
+            return False
+
+    def _digest(self, filename):
+        digest = hashlib.sha256()
+        with open(filename, 'rb') as fileobject:
+            for chunk in iter(lambda: fileobject.read(1048576), b''):
+                digest.update(chunk)
+
+        return digest.digest()
+
+    def _mode(self, filename, tmpfilename):
+        # keep the permissions of the file being replaced, rather than the owner only ones of the temporary file
+        try:
+            return stat.S_IMODE(os.stat(filename).st_mode)
+        except OSError:
+            pass
+
+        # a new file gets the permissions open() would give it; reading the umask means setting it, which isn't
+        # thread safe, so create a file alongside the temporary one the way open() does and see what it got instead
+        probe = '{}.mode'.format(tmpfilename)
+        fd = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            return stat.S_IMODE(os.fstat(fd).st_mode)
+        finally:
+            os.close(fd)
+            os.unlink(probe)
+
+    def _syncDirectory(self, directory):
+        # so the rename itself survives a crash; not every platform can open a directory to sync it
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
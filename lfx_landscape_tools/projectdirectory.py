@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import logging
+import threading
+
+## third party modules
+import requests
+
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.httpsession import HTTPSession
+
+#
+# In-memory directory of LFX projects indexed by 'ProjectID' and 'Slug', built from a single bulk listing of the
+# project-service the first time it's used. Lookups not in the listing fall back to fetching that single project.
+#
+class ProjectDirectory:
+
+    # True when any lookup was answered from stale cached data still being refreshed in the background
+    stale = False
+
+    listingEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?orderBy=name'
+    singleSlugEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?slug={}'
+    singleProjectEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=projectId%20eq%20{}'
+
+    def __init__(self, pageSize: int = None, prefetch: int = None):
+        self.pageSize = pageSize
+        self.prefetch = prefetch
+        self._bySlug = {}
+        self._byProjectID = {}
+        self._misses = set()
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._byProjectID)
+
+    def load(self):
+        '''
+        Build the directory from the bulk project listing; only done once
+        '''
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            logger = logging.getLogger()
+            logger.info("Loading LFX project directory")
+            try:
+                client = LFXAPIClient(pageSize=self.pageSize,prefetch=self.prefetch)
+                for record in client.records(self.listingEndpointURL):
+                    self.stale = self.stale or client.stale
+                    self.add(record)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning("Couldn't load LFX project directory; will look up projects individually - error message '{}'".format(e))
+            else:
+                logger.info("Loaded {} projects into the LFX project directory".format(len(self)))
+
+    def refresh(self):
+        '''
+        Clear the directory if it was built from stale data, so it's loaded again on the next lookup
+        '''
+        with self._lock:
+            if not self.stale:
+                return
+            self._bySlug = {}
+            self._byProjectID = {}
+            self._misses = set()
+            self._loaded = False
+            self.stale = False
+
+    def add(self, record: dict):
+        '''
+        Add a project record to the directory
+        '''
+        with self._lock:
+            if record.get('ProjectID'):
+                self._byProjectID[record.get('ProjectID')] = record
+            if record.get('Slug'):
+                self._bySlug[record.get('Slug')] = record
+
+    def bySlug(self, slug):
+        '''
+        Returns the project record for the given slug, or None if it isn't found
+        '''
+        return self._lookup(slug,self._bySlug,self.singleSlugEndpointURL)
+
+    def byProjectID(self, projectID):
+        '''
+        Returns the project record for the given project ID, or None if it isn't found
+        '''
+        return self._lookup(projectID,self._byProjectID,self.singleProjectEndpointURL)
+
+    def _lookup(self, key, index, singleEndpointURL):
+        if not key:
+            return None
+
+        self.load()
+        with self._lock:
+            if key in index:
+                return index[key]
+            if singleEndpointURL.format(key) in self._misses:
+                return None
+
+        logging.getLogger().debug("'{}' not in the LFX project directory; looking it up".format(key))
+        session = HTTPSession.shared()
+        with session.get(singleEndpointURL.format(key)) as endpointResponse:
+            records = endpointResponse.json().get('Data',[])
+            self.stale = self.stale or session.isStale(endpointResponse.url)
+        with self._lock:
+            if len(records) > 0:
+                self.add(records[0])
+                return records[0]
+            self._misses.add(singleEndpointURL.format(key))
+
+        return None
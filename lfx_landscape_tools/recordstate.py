@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import hashlib
+import json
+import logging
+import os
+
+#
+# Content hashes of the raw LFX records each landscape item was built from, kept in a sidecar state file so a record
+# that hasn't changed since the prior run can reuse the item built for it then. The hash also covers context ( the
+# loader settings and anything else the item depends on ), so changing the config rebuilds everything.
+#
+# The item built from each record is kept alongside its hash as the loader built it, before anything else is merged
+# into it, so reusing it gives the same item a full sync would.
+#
+class RecordState:
+
+    def __init__(self, filename, context = None):
+        self.filename = filename
+        self.context = context
+        self._hashes, self._items = self._load()
+        self._current = {}
+        self._currentItems = {}
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def digest(self, record, context = None):
+        '''
+        Returns the content hash for record
+        '''
+        return hashlib.sha256(json.dumps({'record': record, 'context': self.context, 'extra': context}, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def unchanged(self, key, record, context = None):
+        '''
+        Returns True if record is the same as when the state was last saved; either way it's kept for the next save
+
+        Keyword arguments:
+        key -- what identifies the record between runs ( i.e. the slug or member ID )
+        record -- the raw record
+        context -- anything else the item built from record depends on
+        '''
+        digest = self.digest(record, context)
+        self._current[key] = digest
+
+        return self._hashes.get(key) == digest
+
+    def current(self, key):
+        '''
+        Returns the hash of the record for key as last checked with unchanged(), or None if it hasn't been
+        '''
+        return self._current.get(key)
+
+    def item(self, key):
+        '''
+        Returns the item kept for key when the state was last saved, or None if there isn't one
+        '''
+        return self._items.get(key)
+
+    def keep(self, key, item):
+        '''
+        Keep item as the one built from the record for key, for the next save
+        '''
+        self._currentItems[key] = item
+
+    def save(self):
+        '''
+        Save the hashes of the records seen since the state was loaded, and the items kept for them, replacing those
+        saved before
+        '''
+        items = {key: item for key, item in self._currentItems.items() if key in self._current}
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            with open(self.filename, 'w', encoding="utf8") as fileobject:
+                json.dump({'hashes': self._current, 'items': items}, fileobject, default=str)
+        except OSError as e:
+            logging.getLogger().warning("Cannot save record state file '{}' - error message '{}'".format(self.filename,e))
+            return
+
+        self._hashes = dict(self._current)
+        self._items = items
+
+    def _load(self):
+        if not os.path.isfile(self.filename):
+            return {}, {}
+
+        try:
+            with open(self.filename, 'r', encoding="utf8") as fileobject:
+                state = json.load(fileobject)
+        except (OSError, ValueError) as e:
+            logging.getLogger().warning("Cannot read record state file '{}' - error message '{}'".format(self.filename,e))
+            return {}, {}
+
+        # a state file without the items can't be reused from, so it's as good as none
+        if not isinstance(state,dict) or not isinstance(state.get('hashes'),dict) or not isinstance(state.get('items'),dict):
+            return {}, {}
+
+        return state['hashes'], state['items']
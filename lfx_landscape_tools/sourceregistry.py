@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+## built in modules
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.members import Members
+
+#
+# Members sources for a run, each loaded once the first time it's asked for. Passes that only read a source ( i.e.
+# overlaying it onto other items ) share the loaded instance; a pass that changes the items it's given gets a clone.
+#
+# Sources that don't depend on each other can be loaded together with load(), and how long each one took to load is
+# logged so the source bounding a run can be seen. Loading a source is blocking I/O, so the 'asyncio' mode still runs
+# each one on a thread ( asyncio.to_thread ) and loads no faster than the 'threads' mode.
+#
+class SourceRegistry:
+
+    loadModes = ['threads','asyncio','serial']
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.loadTimes = {}
+        self._sources = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, source: type[Members]):
+        '''
+        Returns the loaded instance of source, loading it if this is the first time it's asked for; it's shared, so
+        must not be changed
+        '''
+        with self._lock:
+            lock = self._locks.setdefault(source,threading.Lock())
+        with lock:
+            if source not in self._sources:
+                logging.getLogger().debug("Loading source '{}'".format(source.__name__))
+                start = time.perf_counter()
+                self._sources[source] = source(config=self.config)
+                self.loadTimes[source] = time.perf_counter() - start
+                logging.getLogger().info("Loaded source '{}' in {:.2f} seconds".format(source.__name__,self.loadTimes[source]))
+
+            return self._sources[source]
+
+    def clone(self, source: type[Members]):
+        '''
+        Returns a copy of the loaded instance of source which can be changed
+        '''
+        return self.get(source).clone()
+
+    def refresh(self):
+        '''
+        Load again each loaded source with items built from stale data, i.e. once that has been refreshed
+        '''
+        with self._lock:
+            sources = list(self._sources.items())
+        for source, instance in sources:
+            if any(member.stale for member in instance.members):
+                logging.getLogger().info("Refreshing source '{}'".format(source.__name__))
+                instance.refresh()
+
+    def load(self, sources: list, mode = 'threads'):
+        '''
+        Load each of sources at the same time, returning the loaded instances in the same order; an error loading
+        any of them is raised once they have all finished
+
+        Keyword arguments:
+        sources -- Members subclasses to load; they must not depend on each other
+        mode -- 'threads' to load on a thread each, 'asyncio' to load as asyncio tasks that each run the load on a thread, or 'serial' to load one after another
+        '''
+        if mode not in self.loadModes:
+            raise ValueError("Invalid source load mode '{}'".format(mode))
+        sources = list(dict.fromkeys(sources))
+        start = time.perf_counter()
+        if mode == 'serial' or len(sources) < 2:
+            loaded = [self.get(source) for source in sources]
+        elif mode == 'asyncio':
+            loaded = asyncio.run(self._gather(sources))
+            for result in loaded:
+                if isinstance(result, BaseException):
+                    raise result
+        else:
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = [executor.submit(self.get,source) for source in sources]
+            loaded = [future.result() for future in futures]
+
+        if sources:
+            slowest = max(sources, key=lambda source: self.loadTimes.get(source,0))
+            logging.getLogger().info("Loaded {} sources in {:.2f} seconds; slowest was '{}' at {:.2f} seconds".format(len(sources),time.perf_counter() - start,slowest.__name__,self.loadTimes.get(slowest,0)))
+
+        return loaded
+
+    async def _gather(self, sources):
+        return await asyncio.gather(*[asyncio.to_thread(self.get,source) for source in sources],return_exceptions=True)
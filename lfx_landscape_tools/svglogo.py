@@ -15,45 +15,60 @@ import logging
 
 ## third party modules
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import cairo
 
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.deadline import Deadline
+from lfx_landscape_tools.outputfiles import OutputFiles
+
 class SVGLogo:
 
     __contents = ''
     __filename = None
+    # file the contents are still to be read from
+    __pending = None
+    # attempts to fetch a logo when the connection drops mid-response
+    attempts = 3
+    # set when fetching the logo was skipped to meet the run deadline
+    skipped = False
+    # hash of the contents, when it's known without reading them
+    digest = None
 
-    def __init__(self, contents = None, filename = None, url = None, name = None):
+    def __init__(self, contents = None, filename = None, url = None, name = None, digest = None):
         if contents:
             self.__contents = contents
+        elif filename and digest:
+            # the hash is already known ( i.e. from the hosted logos manifest ), so the file is only read if the
+            # contents are needed
+            self.__pending = filename
+            self.__filename = os.path.basename(filename)
+            self.digest = digest
         elif filename:
-            try:
-                with open(filename,'r') as f:
-                    self.__contents = f.read()
-                    self.__filename = os.path.basename(filename)
-            except FileNotFoundError:
-                logging.getLogger().warning("Logo '{}' not found".format(filename))
+            self.__read(filename)
         elif url:
-            session = requests.Session()
-            retry = Retry(backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)        
-            while True:
+            session = HTTPSession.shared()
+            # once the deadline nears, only use logos already in the cache
+            onlyIfCached = Deadline.shared().nearing()
+            for attempt in range(self.attempts):
                 try:
-                    r = session.get(url, allow_redirects=True)
+                    # a logo can be replaced at the same URL, so a cached one is checked with the host once a run
+                    r = session.get(url, allow_redirects=True, only_if_cached=onlyIfCached, revalidate=not onlyIfCached)
                     if r.status_code == 200:
                         self.__contents = r.content.decode('utf-8')
-                    break
-                except requests.exceptions.ConnectionError:
-                    logging.getLogger().warning("ConnectionError with '{}'",format(url))
+                    elif onlyIfCached and r.status_code == 504:
+                        self.skipped = True
+                        Deadline.shared().skip('logos',url)
                     break
                 except requests.exceptions.ChunkedEncodingError:
-                    pass
+                    logging.getLogger().debug("ChunkedEncodingError with '{}' - retrying".format(url))
+                except requests.exceptions.RequestException as e:
+                    logging.getLogger().warning("Cannot load logo '{}' - error message '{}'".format(url,e))
+                    break
                 except UnicodeDecodeError:
                     logging.getLogger().warning("UnicodeDecodeError with '{}'".format(url))
                     break
+            else:
+                logging.getLogger().warning("Cannot load logo '{}' after {} attempts".format(url,self.attempts))
         elif name:
            width = len(max(name.split(" "),key=len)) * 32
            height = len(name.split(" ")) * 65
@@ -76,51 +91,80 @@ class SVGLogo:
                 fp.seek(0)
                 self.__contents = fp.read().decode('utf-8')
 
+    def __read(self, filename):
+        try:
+            with open(filename,'r') as f:
+                self.__contents = f.read()
+                self.__filename = os.path.basename(filename)
+        except FileNotFoundError:
+            logging.getLogger().warning("Logo '{}' not found".format(filename))
+
+    def __load(self):
+        if self.__pending:
+            filename, self.__pending = self.__pending, None
+            self.__read(filename)
+
+    @property
+    def pendingFile(self):
+        '''
+        The file the contents will be read from, or None if they have been read already
+        '''
+        return self.__pending
+
     def __str__(self):
+        self.__load()
         return self.__contents
 
     def filename(self, name):
         return self.__filename if self.__filename else "{}.svg".format(slugify(os.path.splitext(name)[0],separator='_'))
 
-    def save(self, name, path = './'):
-        filename = self.filename(name)
+    def save(self, name, path = './', files: OutputFiles = None, makedirs: bool = True, filename = None):
+        self.__load()
+        filename = filename if filename else self.filename(name)
         filenamepath = os.path.normpath("{}/{}".format(path,filename))
-        if not os.path.isdir(path):
+        if makedirs and not os.path.isdir(path):
             os.makedirs(path)
 
         try:
-            with open(filenamepath, 'w') as fp:
+            # only written if it's changed
+            if ( files if files else OutputFiles() ).write(filenamepath, self.__contents):
                 logging.getLogger().debug("Saving hosted_logos '{}'".format(filenamepath))
-                fp.write(self.__contents)
         except FileNotFoundError:
             logging.getLogger().error("Cannot save '{}' in '{}'".format(filename,path))
 
         return filename
 
     def isValid(self):
+        if self.__pending:
+            # only logos that were valid are hosted
+            return True
         return self.__contents != '' and self.__contents.find('base64') == -1 and self.__contents.find('<text') == -1 and self.__contents.find('<image') == -1 and self.__contents.find('<tspan') == -1
 
     def addCaption(self, caption="", title=""):
+        self.__load()
         postJson = {
             'svg': self.__contents, 
             'title': title,
             'caption': caption
         }
-        x = requests.post("https://autocrop.cncf.io/autocrop", json=postJson)
+        x = HTTPSession.shared().post("https://autocrop.cncf.io/autocrop", json=postJson)
         response = x.json()
         if response['success']:
             self.__contents = response['result']
+            self.digest = None
         else:
             raise RuntimeError("Adding caption failed: {}".format(response['error']))
 
     def autocrop(self, title=''):
+        self.__load()
         postJson = {
             'svg': self.__contents, 
             'title': title
         }
-        x = requests.post("https://autocrop.cncf.io/autocrop", json=postJson)
+        x = HTTPSession.shared().post("https://autocrop.cncf.io/autocrop", json=postJson)
         response = x.json()
         if response['success']:
             self.__contents = response['result']
+            self.digest = None
         else:
             raise RuntimeError("Autocrop failed: {}".format(response['error']))
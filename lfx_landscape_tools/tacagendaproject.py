@@ -9,16 +9,18 @@ import logging
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # third party modules
 import requests
-import requests_cache
 from urllib.parse import urlparse
 
 from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.member import Member
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.githubprojects import GitHubProjectsClient
 
 class TACAgendaProject(Members):
 
@@ -28,11 +30,19 @@ class TACAgendaProject(Members):
 
     pcc_committee_url = 'https://api-gw.platform.linuxfoundation.org/project-service/v2/public/projects/{project_id}/committees/{committee_id}/members?$filter=role%20ne%20None&orderBy=Role'
     gh_cli_call = "gh project item-list {gh_project_id} --owner {gh_org} --format json --limit 200"
+    # 'gh' uses the GitHub CLI; 'graphql' uses the GraphQL API directly
+    client = 'gh'
+    # how many agenda items to look up in LFX at once
+    lookupWorkers = 8
+    # project fields read from each item when using the GraphQL API
+    projectFields = ['Last Review Date','Accepted','Incubating','Graduated','Archived','Scheduled Date','PCC TSC Committee URL','SIG']
 
     def processConfig(self, config: type[Config]):
         self.parent_slug = config.slug
         self.defaultCrunchbase = config.projectsDefaultCrunchbase
         self.assignSIGs = config.projectsAssignSIGs
+        self.projectDirectory = config.projectDirectory
+        self.client = config.tacAgendaProjectClient
         if config.tacAgendaProjectUrl:
             urlparts = urlparse(config.tacAgendaProjectUrl).path.split('/')
             if urlparts and len(urlparts) > 3 and urlparts[1] == 'orgs' and urlparts[3] == 'projects':
@@ -49,18 +59,13 @@ class TACAgendaProject(Members):
             logger.error("Cannot find GitHub Project - ID:{id} Org:{org}".format(id=id,org=org))
             return None
 
-        command = subprocess.run(self.gh_cli_call.format(gh_project_id=self.gh_project_id,gh_org=self.gh_org), shell=True, capture_output=True)
-        logger.debug("gh cli call {}".format(self.gh_cli_call.format(gh_project_id=self.gh_project_id,gh_org=self.gh_org)))
-        jsonProjectData = command.stdout
-        csvRows = []
-        try:
-            projectData = json.loads(jsonProjectData)
-        except:
-            logger.error("Invalid response from gh client: '{}'".format(command.stderr))
+        projectData = self._loadProjectItems()
+        if projectData is None:
             return None
 
         logger.info('Found {} records'.format(len(projectData.get('items',[]))))
 
+        items = []
         for item in projectData.get('items',[]):
             found = False
             for label in item.get('labels',{}):
@@ -70,8 +75,15 @@ class TACAgendaProject(Members):
             if not found:
                 logger.debug("Skipping '{}'".format(item.get('content',{}).get('title').strip()))
                 continue
+            items.append(item)
 
+        # the LFX lookups for each item are independent, so run them together and take the results in item order
+        with ThreadPoolExecutor(max_workers=self.lookupWorkers) as executor:
+            lookups = [executor.submit(self._lookupCommittee,item.get('pCC TSC Committee URL','')) for item in items]
+
+        for item, lookup in zip(items,lookups):
             logger.info("Processing {}...".format(item.get('content',{}).get('title')))
+            projectdetailsfromlfxcommittee, memberList, stale = lookup.result()
             member = Member()
             member.name = item.get('content',{}).get('title').strip()
             member.crunchbase = self.defaultCrunchbase
@@ -84,41 +96,76 @@ class TACAgendaProject(Members):
             extra['archived'] = item.get('archived')
             extra['annual_review_url'] = item.get('content',{}).get('url')
             annotations['next_annual_review_date'] = item.get('scheduled Date')
-            projectdetailsfromlfxcommittee = self._lookupProjectAndCommitteeDetailsByLFXURL(item.get('pCC TSC Committee URL',''))
             if self.assignSIGs and projectdetailsfromlfxcommittee.get('category') != 'SIG':
                 member.second_path = ['SIG / {}'.format(item.get('sIG','No SIG'))]
             extra['lfx_slug'] = projectdetailsfromlfxcommittee.get('slug')
-            session = requests_cache.CachedSession()
+            member.stale = self.projectDirectory.stale or stale
             chair = []
-            if projectdetailsfromlfxcommittee.get('project_id') and projectdetailsfromlfxcommittee.get('committee_id'):
-                with session.get(self.pcc_committee_url.format(
-                        project_id=projectdetailsfromlfxcommittee.get('project_id'), \
-                        committee_id=projectdetailsfromlfxcommittee.get('committee_id'))) \
-                        as endpointResponse:
-                    try:
-                        memberList = endpointResponse.json()
-                        for record in memberList.get('Data',[]):
-                            if record.get('Role') in ['Chair','Vice Chair']:
-                                logger.info("Found '{} {}' for the role '{}".format(record.get('FirstName').title(),record.get('LastName').title(),record.get('Role')))
-                                chair.append('{} {}'.format(record.get('FirstName').title(),record.get('LastName').title()))
-                            elif record.get('Role') == 'TAC/TOC Representative':
-                                annotations["TAC_representative"] = '{} {}'.format(record.get('FirstName').title(),record.get('LastName').title())
-                    except Exception as e:
-                        logger.error("Couldn't load TSC Committee data for '{project}' - {error}".format(project=member.name,error=e))
+            if isinstance(memberList,Exception):
+                logger.error("Couldn't load TSC Committee data for '{project}' - {error}".format(project=member.name,error=memberList))
+            elif memberList is not None:
+                try:
+                    for record in memberList.get('Data',[]):
+                        if record.get('Role') in ['Chair','Vice Chair']:
+                            logger.info("Found '{} {}' for the role '{}".format(record.get('FirstName').title(),record.get('LastName').title(),record.get('Role')))
+                            chair.append('{} {}'.format(record.get('FirstName').title(),record.get('LastName').title()))
+                        elif record.get('Role') == 'TAC/TOC Representative':
+                            annotations["TAC_representative"] = '{} {}'.format(record.get('FirstName').title(),record.get('LastName').title())
+                except Exception as e:
+                    logger.error("Couldn't load TSC Committee data for '{project}' - {error}".format(project=member.name,error=e))
             annotations['chair'] = ", ".join(chair)
             extra['annotations'] = annotations
             member.extra = extra
             self.members.append(member)
 
+    def _lookupCommittee(self, url):
+        '''
+        Returns the LFX project and committee details for the committee at url, the committee members response ( or
+        the exception raised decoding it ), and if that response was stale
+        '''
+        projectdetailsfromlfxcommittee = self._lookupProjectAndCommitteeDetailsByLFXURL(url)
+        if not projectdetailsfromlfxcommittee.get('project_id') or not projectdetailsfromlfxcommittee.get('committee_id'):
+            return projectdetailsfromlfxcommittee, None, False
+
+        session = HTTPSession.shared()
+        with session.get(self.pcc_committee_url.format(
+                project_id=projectdetailsfromlfxcommittee.get('project_id'), \
+                committee_id=projectdetailsfromlfxcommittee.get('committee_id'))) \
+                as endpointResponse:
+            try:
+                memberList = endpointResponse.json()
+            except Exception as e:
+                memberList = e
+
+            return projectdetailsfromlfxcommittee, memberList, session.isStale(endpointResponse.url)
+
+    def _loadProjectItems(self):
+        '''
+        Returns the items in the GitHub Project, in the form output by 'gh project item-list', or None if they
+        couldn't be loaded
+        '''
+        logger = logging.getLogger()
+        if self.client == 'graphql':
+            try:
+                return {'items': list(GitHubProjectsClient(fields=self.projectFields).items(self.gh_org,self.gh_project_id))}
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error("Invalid response from GitHub GraphQL API: '{}'".format(e))
+                return None
+
+        command = subprocess.run(self.gh_cli_call.format(gh_project_id=self.gh_project_id,gh_org=self.gh_org), shell=True, capture_output=True)
+        logger.debug("gh cli call {}".format(self.gh_cli_call.format(gh_project_id=self.gh_project_id,gh_org=self.gh_org)))
+        try:
+            return json.loads(command.stdout)
+        except:
+            logger.error("Invalid response from gh client: '{}'".format(command.stderr))
+            return None
+
     def _lookupProjectAndCommitteeDetailsByLFXURL(self,url):
         urlparts = urlparse(url).path.split('/')
         if isinstance(urlparts,list) and len(urlparts) == 6 and urlparts[1] == 'project' and urlparts[3] == 'collaboration' and urlparts[4] == 'committees':
-            singleProjectEndpointURL = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=projectId%20eq%20{}'
-            session = requests_cache.CachedSession()
-            with session.get(singleProjectEndpointURL.format(urlparts[2])) as endpointResponse:
-                parentProject = endpointResponse.json()
-                if len(parentProject.get('Data')) > 0: 
-                    return {'project_id': urlparts[2],'committee_id': urlparts[5],'slug': parentProject.get('Data')[0]["Slug"],'category': parentProject.get('Data')[0].get('Category')}
+            parentProject = self.projectDirectory.byProjectID(urlparts[2])
+            if parentProject: 
+                return {'project_id': urlparts[2],'committee_id': urlparts[5],'slug': parentProject["Slug"],'category': parentProject.get('Category')}
         
         logging.getLogger().warning("Couldn't find project information with LFX URL '{}'".format(url)) 
 
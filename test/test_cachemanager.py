@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import tempfile
+import os
+import responses
+import logging
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.cachemanager import CacheManager
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.lfxprojects import LFXProjects
+from lfx_landscape_tools.landscapeoutput import LandscapeOutput
+
+class TestCacheManager(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.config = Config()
+        self.config.httpCacheBackend = 'memory'
+
+    @responses.activate
+    def testStats(self):
+        responses.add(method=responses.GET,url='https://foo.com/members/1',body='x' * 10)
+        responses.add(method=responses.GET,url='https://bar.com/logo.svg',body='y' * 5)
+        session = HTTPSession.fromConfig(self.config)
+        session.get('https://foo.com/members/1')
+        session.get('https://foo.com/members/1')
+        session.get('https://bar.com/logo.svg')
+
+        stats = CacheManager(config=self.config,session=session).stats()
+        self.assertEqual(list(stats.keys()),['bar.com/logo.svg','foo.com/members'])
+        self.assertEqual(stats['foo.com/members']['entries'],1)
+        self.assertEqual(stats['foo.com/members']['size'],10)
+        self.assertEqual(stats['foo.com/members']['hitRatio'],0.5)
+        self.assertEqual(stats['bar.com/logo.svg']['hitRatio'],0)
+
+    @responses.activate
+    def testExportImport(self):
+        responses.add(method=responses.GET,url='https://foo.com/members',body='members')
+        session = HTTPSession.fromConfig(self.config)
+        session.get('https://foo.com/members')
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle = os.path.join(tmpdir,'bundle.sqlite')
+            self.assertEqual(CacheManager(config=self.config,session=session).exportBundle(bundle),1)
+
+            newsession = HTTPSession.fromConfig(self.config)
+            self.assertEqual(CacheManager(config=self.config,session=newsession).importBundle(bundle),1)
+            response = newsession.get('https://foo.com/members')
+            self.assertTrue(response.from_cache)
+            self.assertEqual(response.text,'members')
+        self.assertEqual(len(responses.calls),1)
+
+    def testImportMissingBundle(self):
+        with self.assertRaises(ValueError):
+            CacheManager(config=self.config,session=HTTPSession.fromConfig(self.config)).importBundle('/tmp/doesnotexist.sqlite')
+
+    @responses.activate
+    def testPrune(self):
+        for i in range(3):
+            responses.add(method=responses.GET,url='https://foo.com/{}'.format(i),body='x' * 100)
+        session = HTTPSession.fromConfig(self.config)
+        for i in range(3):
+            session.get('https://foo.com/{}'.format(i))
+
+        self.assertLessEqual(CacheManager(config=self.config,session=session).prune(150),150)
+        self.assertEqual(len(session.cache.responses),1)
+
+    @responses.activate
+    def testPruneWithoutMaxSize(self):
+        for i in range(3):
+            responses.add(method=responses.GET,url='https://foo.com/{}'.format(i),body='x' * 100)
+        session = HTTPSession.fromConfig(self.config)
+        for i in range(3):
+            session.get('https://foo.com/{}'.format(i))
+
+        self.assertIsNone(session.prune())
+        self.assertGreaterEqual(CacheManager(config=self.config,session=session).prune(),300)
+        self.assertEqual(len(session.cache.responses),3)
+
+    @responses.activate
+    def testWarmBuildsEveryItem(self):
+        with open("{}/data.yml".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+            responses.get('https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml', body=fileobject.read())
+        logo = responses.get("https://lf-master-project-logos-prod.s3.us-east-2.amazonaws.com/opencue.svg",body='<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+        responses.get(LFXAPIClient().pageURL(LFXProjects.endpointURL.format('aswf')),json={"Data": [{
+            "DisplayOnWebsite": True,
+            "Name": "OpenCue",
+            "ProjectLogo": "https://lf-master-project-logos-prod.s3.us-east-2.amazonaws.com/opencue.svg",
+            "Slug": "opencue",
+            "Status": "Active",
+            "TestRecord": False,
+            "Website": "https://opencue.io"
+            }], "Metadata": {"Offset": 0, "PageSize": 2000, "TotalSize": 1}})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.config.view = 'projects'
+            self.config.basedir = tmpdir
+            self.config.slug = 'aswf'
+            self.config.projectsAddParentProject = False
+            with HTTPSession.shared().cache_disabled():
+                # a prior build, so there's state to reuse the item from
+                members = LFXProjects(config=self.config)
+                landscapeoutput = LandscapeOutput(config=self.config)
+                landscapeoutput.load(members=members)
+                landscapeoutput.save()
+                landscapeoutput.saveState()
+                members.saveState()
+                LFXProjects(config=self.config)
+                self.assertEqual(logo.call_count,1)
+
+                with self.assertLogs(level='ERROR'):
+                    self.assertIn('LFX Projects',CacheManager(config=self.config).warm())
+            self.assertEqual(logo.call_count,2)
+            self.assertTrue(self.config.incrementalSync)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import tempfile
+import os
+import responses
+import requests
+import logging
+import unittest.mock
+
+from lfx_landscape_tools.cassette import Cassette
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.member import Member
+
+class TestCassette(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name,'cassette.json.gz')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _record(self):
+        with responses.RequestsMock() as mock:
+            mock.add(method=responses.GET,url='https://foo.com/projects?slug=aswf&orderBy=name',json={"Data": [{"Slug": "aswf"}]})
+            mock.add(method=responses.POST,url='https://autocrop.cncf.io/autocrop',json={"success": True, "result": "logo"})
+            mock.add(method=responses.GET,url='https://foo.com/logo.png',body=b'\x89PNG\xff')
+            mock.add(method=responses.GET,url='https://foo.com/broken',body=requests.exceptions.ConnectionError("broken"))
+            cassette = Cassette(self.filename)
+            cassette.record()
+            try:
+                session = HTTPSession(backend='memory')
+                session.settings.disabled = True
+                session.get('https://foo.com/projects?slug=aswf&orderBy=name')
+                session.post('https://autocrop.cncf.io/autocrop',json={"svg": "logo"})
+                session.get('https://foo.com/logo.png')
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    session.get('https://foo.com/broken')
+            finally:
+                cassette.stop()
+
+        return cassette
+
+    def testRecord(self):
+        cassette = self._record()
+        self.assertEqual(len(cassette.interactions),4)
+        self.assertTrue(os.path.isfile(self.filename))
+        self.assertEqual(cassette.interactions[3]['error']['type'],'ConnectionError')
+
+    def testReplay(self):
+        self._record()
+        cassette = Cassette(self.filename)
+        cassette.replay()
+        try:
+            session = HTTPSession(backend='memory')
+            session.settings.disabled = True
+            # same request with the query in a different order
+            self.assertEqual(session.get('https://foo.com/projects?orderBy=name&slug=aswf',stream=True).json(),{"Data": [{"Slug": "aswf"}]})
+            self.assertEqual(session.get('https://foo.com/projects?slug=aswf&orderBy=name').json(),{"Data": [{"Slug": "aswf"}]})
+            self.assertEqual(session.post('https://autocrop.cncf.io/autocrop',json={"svg": "logo"}).json(),{"success": True, "result": "logo"})
+            self.assertEqual(session.get('https://foo.com/logo.png').content,b'\x89PNG\xff')
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                session.get('https://foo.com/broken')
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                session.post('https://autocrop.cncf.io/autocrop',json={"svg": "other logo"})
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                requests.get('https://foo.com/not-recorded')
+        finally:
+            cassette.stop()
+
+    def testRecordCachedGitHubLookup(self):
+        with responses.RequestsMock() as mock:
+            with open("{}/data.yml".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+                mock.add(method=responses.GET,url='https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml',body=fileobject.read())
+            with open("{}/github_openassetio_search_repo.json".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+                mock.add(method=responses.GET,url='https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1',body=fileobject.read())
+            mock.add(method=responses.GET,url='https://github.com/OpenAssetIO',body='')
+            session = HTTPSession(backend='memory')
+            with unittest.mock.patch.object(HTTPSession,'shared',return_value=session):
+                member = Member()
+                member.name = 'test'
+                member.repo_url = 'https://github.com/OpenAssetIO'
+
+                # already in the cache, but the lookup is still recorded so it can be replayed elsewhere
+                cassette = Cassette(self.filename)
+                cassette.record()
+                try:
+                    session.settings.disabled = True
+                    member.repo_url = 'https://github.com/OpenAssetIO'
+                finally:
+                    cassette.stop()
+        self.assertEqual(member.repo_url,'https://github.com/OpenAssetIO/OpenAssetIO')
+        self.assertIn('https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1',[interaction['request']['url'] for interaction in cassette.interactions])
+
+if __name__ == '__main__':
+    unittest.main()
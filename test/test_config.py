@@ -9,6 +9,7 @@ import unittest
 import tempfile
 import os
 import responses
+import requests
 import logging
 
 from lfx_landscape_tools.config import Config
@@ -21,6 +22,7 @@ from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.httpsession import HTTPSession
 
 class TestConfig(unittest.TestCase):
     
@@ -66,6 +68,54 @@ memberSuffix: " (help)"
 
         os.unlink(tmpfilename.name)
 
+    def testLoadConfigHTTPCache(self):
+        testconfigfilecontents = """
+project: a09410000182dD2AAI # Academy Software Foundation
+slug: aswf
+httpCacheBackend: filesystem
+httpCacheLocation: /tmp/lfx_http_cache
+httpCacheExpireAfter:
+  'api-gw.platform.linuxfoundation.org/project-service': 3600
+httpCacheMaxSize: 1000000
+httpCacheWAL: false
+httpCacheStaleWhileRevalidate: true
+httpReadTimeout: 30
+deadline: 600
+lfxApiBaseURL: http://localhost:8080
+incrementalSync: false
+tacAgendaProjectClient: graphql
+syncMergePrecedence:
+  '*': [lfx, landscape]
+syncLoadMode: asyncio
+hostedLogosContentAddressed: true
+hostedLogosGC: true
+"""
+        tmpfilename = tempfile.NamedTemporaryFile(mode='w',delete=False)
+        tmpfilename.write(testconfigfilecontents)
+        tmpfilename.close()
+
+        with open(tmpfilename.name) as fp:
+            config = Config(fp)
+
+            self.assertEqual(config.httpCacheBackend,"filesystem")
+            self.assertEqual(config.httpCacheLocation,"/tmp/lfx_http_cache")
+            self.assertEqual(config.httpCacheExpireAfter,{'api-gw.platform.linuxfoundation.org/project-service': 3600})
+            self.assertEqual(config.httpCacheMaxSize,1000000)
+            self.assertFalse(config.httpCacheWAL)
+            self.assertTrue(config.httpCacheStaleWhileRevalidate)
+            self.assertEqual(config.httpConnectTimeout,10)
+            self.assertEqual(config.httpReadTimeout,30)
+            self.assertEqual(config.deadline,600)
+            self.assertEqual(config.lfxApiBaseURL,"http://localhost:8080")
+            self.assertFalse(config.incrementalSync)
+            self.assertEqual(config.tacAgendaProjectClient,"graphql")
+            self.assertEqual(config.syncMergePrecedence,{'*': ['lfx','landscape']})
+            self.assertEqual(config.syncLoadMode,'asyncio')
+            self.assertTrue(config.hostedLogosContentAddressed)
+            self.assertTrue(config.hostedLogosGC)
+
+        os.unlink(tmpfilename.name)
+
     def testLoadConfigMissingCsvFileLandscapeFile(self):
         testconfigfilecontents = """
 project: a09410000182dD2AAI # Academy Software Foundation
@@ -106,6 +156,8 @@ slug: aswf
             self.assertEqual(config.landscapefile,'landscape.yml')
             self.assertEqual(config.missingcsvfile,'missing.csv')
             self.assertEqual(config.hostedLogosDir,'hosted_logos')
+            self.assertFalse(config.hostedLogosContentAddressed)
+            self.assertFalse(config.hostedLogosGC)
             self.assertEqual(config.memberSuffix,'')
             self.assertEqual(config.project,"a09410000182dD2AAI")
 
@@ -253,5 +305,62 @@ slug: aswf
 
         os.unlink(tmpfilename.name)
 
+    @responses.activate
+    def testLoadConfigFullySpecifiedNoLookup(self):
+        testconfigfilecontents = """
+project: a09410000182dD2AAI # Academy Software Foundation
+slug: aswf
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir,'config.yml'),'w') as fp:
+                fp.write(testconfigfilecontents)
+
+            with open(os.path.join(tmpdir,'config.yml')) as fp:
+                config = Config(fp)
+
+                self.assertEqual(config.slug,'aswf')
+                self.assertEqual(config.project,"a09410000182dD2AAI")
+                self.assertEqual(len(responses.calls),0)
+                self.assertFalse(os.path.exists(os.path.join(tmpdir,Config.stateDir)))
+
+    @responses.activate
+    def testLookupProjectSavedForNextRun(self):
+        lookup = responses.add(
+            method=responses.GET,
+            url='https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?$filter=projectId%20eq%20a09410000182dD2AAI',
+            json={
+                "Data": [
+                    {
+                        "Name": "Academy Software Foundation (ASWF)",
+                        "ProjectID": "a09410000182dD2AAI",
+                        "Slug": "aswf"
+                    }
+                ],
+                "Metadata": {
+                    "Offset": 0,
+                    "PageSize": 100,
+                    "TotalSize": 1
+                }
+            })
+        testconfigfilecontents = """
+project: a09410000182dD2AAI # Academy Software Foundation
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir,'config.yml'),'w') as fp:
+                fp.write(testconfigfilecontents)
+
+            with open(os.path.join(tmpdir,'config.yml')) as fp:
+                config = Config(fp)
+                self.assertEqual(len(responses.calls),0)
+                with HTTPSession.shared().cache_disabled():
+                    self.assertEqual(config.slug,'aswf')
+            self.assertEqual(lookup.call_count,1)
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir,Config.stateDir,'project.yml')))
+
+            with open(os.path.join(tmpdir,'config.yml')) as fp:
+                config = Config(fp)
+                self.assertEqual(config.slug,'aswf')
+            self.assertEqual(lookup.call_count,1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import logging
+
+from lfx_landscape_tools.deadline import Deadline
+
+class TestDeadline(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    def testNoDeadline(self):
+        deadline = Deadline()
+        self.assertIsNone(deadline.remaining())
+        self.assertFalse(deadline.nearing())
+        self.assertTrue(deadline.allows('logos','foo.svg'))
+        self.assertIsNone(deadline.summary())
+
+    def testDeadlineNotNearing(self):
+        deadline = Deadline(3600)
+        self.assertGreater(deadline.remaining(),3500)
+        self.assertTrue(deadline.allows('logos','foo.svg'))
+        self.assertEqual(deadline.skipped,{})
+
+    def testDeadlineNearingSkipsOptionalWork(self):
+        deadline = Deadline(1,reserve=2)
+        self.assertTrue(deadline.nearing())
+        self.assertFalse(deadline.allows('logos','foo.svg'))
+        self.assertFalse(deadline.allows('logos','bar.svg'))
+        self.assertFalse(deadline.allows('GitHub org resolution','Foo'))
+        self.assertEqual(deadline.skipped,{'logos': ['foo.svg','bar.svg'], 'GitHub org resolution': ['Foo']})
+        self.assertEqual(deadline.summary(),"Skipped to meet the 1 second deadline: logos (2) - foo.svg, bar.svg; GitHub org resolution (1) - Foo")
+
+    def testAvailable(self):
+        self.assertIsNone(Deadline().available())
+        self.assertGreater(Deadline(3600,reserve=0.5).available(),1700)
+        self.assertLessEqual(Deadline(3600,reserve=0.5).available(),1800)
+        self.assertEqual(Deadline(1,reserve=2).available(),0)
+
+    def testConfigureShared(self):
+        Deadline.configure(60)
+        self.assertEqual(Deadline.shared().seconds,60)
+        Deadline.configure()
+        self.assertIsNone(Deadline.shared().seconds)
+
+if __name__ == '__main__':
+    unittest.main()
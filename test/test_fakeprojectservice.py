@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import requests
+import logging
+
+from lfx_landscape_tools.fakeprojectservice import FakeProjectService
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.projectdirectory import ProjectDirectory
+
+class TestFakeProjectService(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.service = FakeProjectService(projects=120,members=300)
+        self.baseURL = self.service.start()
+        self.session = HTTPSession(backend='memory',lfxApiBaseURL=self.baseURL)
+        self._shared = HTTPSession._shared
+        HTTPSession._shared = self.session
+
+    def tearDown(self):
+        HTTPSession._shared = self._shared
+        self.session.close()
+        self.service.stop()
+
+    def testPagedProjectListing(self):
+        client = LFXAPIClient(pageSize=50)
+        records = list(client.records(ProjectDirectory.listingEndpointURL))
+        self.assertEqual(len(records),121)
+        self.assertEqual(len({record['Slug'] for record in records}),121)
+        for call in self.session.cache.responses.values():
+            self.assertTrue(call.url.startswith(self.baseURL))
+
+    def testProjectDirectory(self):
+        directory = ProjectDirectory(pageSize=50)
+        self.assertEqual(directory.bySlug('fake-foundation')['ProjectID'],'fake00000000000000')
+        self.assertEqual(directory.byProjectID('fake00000000000042')['Slug'],'project-42')
+        self.assertIsNone(directory.bySlug('not-a-project'))
+
+    def testMembers(self):
+        members = list(LFXAPIClient().stream(HTTPSession.lfxApiDefaultBaseURL + '/v1/public/projects/fake00000000000000/members?orderBy=name&status=Active,At Risk'))
+        self.assertEqual(len(members),300)
+        autojoin = list(LFXAPIClient().records(HTTPSession.lfxApiDefaultBaseURL + '/v1/public/projects?autoJoinEnabled=true'))
+        self.assertEqual(len(autojoin),2)
+        otherMembers = self.session.get(HTTPSession.lfxApiDefaultBaseURL + '/v1/public/projects/project-50/members').json()
+        self.assertEqual(len(otherMembers),150)
+        self.assertEqual(otherMembers[0]['ProjectName'],'Project 50')
+
+    def testCommitteeMembers(self):
+        response = self.session.get(HTTPSession.lfxApiDefaultBaseURL + '/v2/public/projects/fake00000000000001/committees/abc/members?$filter=role%20ne%20None&orderBy=Role')
+        self.assertEqual([record['Role'] for record in response.json()['Data']],['Chair','Vice Chair','TAC/TOC Representative'])
+
+    def testLogo(self):
+        record = self.session.get(HTTPSession.lfxApiDefaultBaseURL + '/v1/public/projects?slug=project-7').json()['Data'][0]
+        response = self.session.get(record['ProjectLogo'])
+        self.assertEqual(response.headers['Content-Type'],'image/svg+xml')
+        self.assertTrue(response.text.startswith('<svg'))
+
+    def testNotModified(self):
+        status, headers, body = self.service.handle('/v1/public/projects?slug=project-7')
+        self.assertEqual(status,200)
+        self.assertEqual(self.service.handle('/v1/public/projects?slug=project-7',{'If-None-Match': headers['ETag']})[0],304)
+
+    def testNotFound(self):
+        self.assertEqual(self.service.handle('/v1/public/other')[0],404)
+        self.assertEqual(self.service.handle('/v1/public/projects/not-a-project/members')[0],404)
+
+    def testErrorInjection(self):
+        service = FakeProjectService(projects=10,members=10,errorRate=1)
+        baseURL = service.start()
+        try:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                list(LFXAPIClient(session=HTTPSession(backend='memory',lfxApiBaseURL=baseURL)).records(ProjectDirectory.listingEndpointURL))
+            self.assertGreater(service.errorsInjected,0)
+        finally:
+            service.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import responses
+import requests
+import json
+import logging
+
+from lfx_landscape_tools.githubprojects import GitHubProjectsClient
+from lfx_landscape_tools.httpsession import HTTPSession
+
+class TestGitHubProjectsClient(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.session = HTTPSession(backend='memory')
+
+    def _page(self, nodes, hasNextPage = False, endCursor = None):
+        return {"data": {"organization": {"projectV2": {"items": {"pageInfo": {"hasNextPage": hasNextPage, "endCursor": endCursor}, "nodes": nodes}}}}}
+
+    @responses.activate
+    def testItems(self):
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,json=self._page([
+            {
+                "content": {"title": "D&I Working Group", "url": "https://github.com/AcademySoftwareFoundation/tac/issues/473", "labels": {"nodes": [{"name": "2-annual-review"}]}},
+                "field0": {"date": "2024-12-11"},
+                "field1": {"text": "https://projectadmin.lfx.linuxfoundation.org/project/a092M00001KWjDZQA1/collaboration/committees/ac9cbe7f-0dc8-4be0-b404-cb7b9b0bb22f"},
+                "field2": {"name": "Rendering"},
+                "field3": None
+            }
+        ],hasNextPage=True,endCursor="abc"))
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,json=self._page([
+            {"content": {"title": "Draft"}}
+        ]))
+
+        client = GitHubProjectsClient(fields=['Scheduled Date','PCC TSC Committee URL','SIG','Accepted'],token='secret',pageSize=1,session=self.session)
+        items = list(client.items('AcademySoftwareFoundation','19'))
+        self.assertEqual(items[0],{
+            'content': {'title': 'D&I Working Group', 'url': 'https://github.com/AcademySoftwareFoundation/tac/issues/473'},
+            'labels': ['2-annual-review'],
+            'scheduled Date': '2024-12-11',
+            'pCC TSC Committee URL': 'https://projectadmin.lfx.linuxfoundation.org/project/a092M00001KWjDZQA1/collaboration/committees/ac9cbe7f-0dc8-4be0-b404-cb7b9b0bb22f',
+            'sIG': 'Rendering'
+            })
+        self.assertEqual(items[1],{'content': {'title': 'Draft', 'url': None}, 'labels': []})
+
+        self.assertEqual(len(responses.calls),2)
+        self.assertEqual(responses.calls[0].request.headers['Authorization'],'bearer secret')
+        body = json.loads(responses.calls[0].request.body)
+        self.assertEqual(body['variables'],{'org': 'AcademySoftwareFoundation', 'number': 19, 'pageSize': 1, 'cursor': None})
+        self.assertIn('fieldValueByName(name: "PCC TSC Committee URL")',body['query'])
+        self.assertEqual(json.loads(responses.calls[1].request.body)['variables']['cursor'],'abc')
+
+    @responses.activate
+    def testItemsErrors(self):
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,json={"errors": [{"message": "Could not resolve to an Organization with the login of 'foo'."}]})
+        with self.assertRaises(ValueError):
+            list(GitHubProjectsClient(session=self.session).items('foo',1))
+
+    @responses.activate
+    def testItemsProjectNotFound(self):
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,json={"data": {"organization": {"projectV2": None}}})
+        with self.assertRaises(ValueError):
+            list(GitHubProjectsClient(session=self.session).items('foo',1))
+
+    @responses.activate
+    def testItemsHTTPError(self):
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,status=401,json={"message": "Bad credentials"})
+        with self.assertRaises(requests.exceptions.HTTPError):
+            list(GitHubProjectsClient(session=self.session).items('foo',1))
+
+if __name__ == '__main__':
+    unittest.main()
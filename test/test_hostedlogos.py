@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import logging
+import tempfile
+import os
+
+from lfx_landscape_tools.hostedlogos import HostedLogos
+from lfx_landscape_tools.logomanifest import LogoManifest
+from lfx_landscape_tools.outputfiles import OutputFiles
+from lfx_landscape_tools.svglogo import SVGLogo
+
+class TestHostedLogos(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    def testSave(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir,'hosted_logos')
+            files = OutputFiles()
+            logos = HostedLogos(path,files=files,workers=4)
+            for i in range(20):
+                self.assertEqual(logos.add('Project {}'.format(i),SVGLogo(contents='<svg>{}</svg>'.format(i))),'project_{}.svg'.format(i))
+            logos.save()
+            self.assertEqual(len(os.listdir(path)),20)
+            with open(os.path.join(path,'project_7.svg')) as fp:
+                self.assertEqual(fp.read(),'<svg>7</svg>')
+            self.assertEqual(files.written,20)
+            self.assertEqual(len(logos),0)
+
+            os.utime(os.path.join(path,'project_7.svg'),(0,0))
+            logos.add('Project 7',SVGLogo(contents='<svg>7</svg>'))
+            logos.save()
+            self.assertEqual(os.path.getmtime(os.path.join(path,'project_7.svg')),0)
+            self.assertEqual(files.skipped,1)
+
+    def testSaveDuplicates(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            files = OutputFiles()
+            logos = HostedLogos(tempdir,files=files)
+            logos.add('Foo Bar',SVGLogo(contents='<svg>foo</svg>'))
+            logos.add('Foo Bar',SVGLogo(contents='<svg>foo</svg>'))
+            self.assertEqual(logos.collisions,0)
+            with self.assertLogs(level='WARNING') as logs:
+                logos.add('Foo-Bar',SVGLogo(contents='<svg>bar</svg>'))
+            self.assertEqual(logs.output,["WARNING:root:Hosted logo 'foo_bar.svg' for 'Foo-Bar' collides with the one for 'Foo Bar'; using the logo for 'Foo-Bar'"])
+            self.assertEqual(logos.collisions,1)
+            logos.save()
+            self.assertEqual(files.written,1)
+            with open(os.path.join(tempdir,'foo_bar.svg')) as fp:
+                self.assertEqual(fp.read(),'<svg>bar</svg>')
+
+    def testSaveContentAddressed(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            files = OutputFiles()
+            manifest = LogoManifest(os.path.join(tempdir,'hostedlogos.json'))
+            logos = HostedLogos(os.path.join(tempdir,'hosted_logos'),files=files,contentAddressed=True,manifest=manifest)
+            digest = LogoManifest.digest('<svg>foo</svg>')
+            self.assertEqual(logos.add('Foo Bar',SVGLogo(contents='<svg>foo</svg>')),'{}.svg'.format(digest))
+            self.assertEqual(logos.add('Other Foo',SVGLogo(contents='<svg>foo</svg>')),'{}.svg'.format(digest))
+            logos.add('Foo-Bar',SVGLogo(contents='<svg>bar</svg>'))
+            self.assertEqual(logos.collisions,0)
+            logos.save()
+            self.assertEqual(files.written,2)
+            self.assertEqual(sorted(os.listdir(os.path.join(tempdir,'hosted_logos'))),sorted(['{}.svg'.format(digest),'{}.svg'.format(LogoManifest.digest('<svg>bar</svg>'))]))
+            entry = manifest.get('{}.svg'.format(digest))
+            self.assertEqual(entry['owners'],['Foo Bar','Other Foo'])
+            self.assertEqual(entry['hash'],digest)
+            self.assertEqual(entry['size'],len('<svg>foo</svg>'))
+            self.assertEqual(entry['lastRun'],1)
+            self.assertEqual(len(manifest),2)
+
+    def testSaveUnreadLogo(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with open(os.path.join(tempdir,'foo.svg'),'w') as fp:
+                fp.write('<svg>foo</svg>')
+            files = OutputFiles()
+            logos = HostedLogos(tempdir,files=files)
+            logo = SVGLogo(filename=os.path.join(tempdir,'foo.svg'),digest=LogoManifest.digest('<svg>foo</svg>'))
+            self.assertEqual(logos.add('Foo',logo),'foo.svg')
+            logos.save()
+            self.assertEqual(files.skipped,1)
+            self.assertEqual(files.written,0)
+            self.assertIsNotNone(logo.pendingFile)
+
+            # written under another name, it has to be read
+            logos.add('Bar',SVGLogo(filename=os.path.join(tempdir,'foo.svg'),digest=LogoManifest.digest('<svg>foo</svg>')))
+            logos.add('Baz',SVGLogo(contents='<svg>baz</svg>'))
+            logos.save()
+            self.assertEqual(files.written,1)
+            self.assertEqual(files.skipped,2)
+
+    def testRemoveUnreferenced(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            manifest = LogoManifest(os.path.join(tempdir,'hostedlogos.json'))
+            logos = HostedLogos(os.path.join(tempdir,'hosted_logos'),manifest=manifest)
+            self.assertEqual(logos.removeUnreferenced(set()),0)
+            for name in ['Foo','Bar']:
+                logos.add(name,SVGLogo(contents='<svg>{}</svg>'.format(name)))
+            logos.save()
+            for filename in ['.foo.svg.tmp','notes.txt']:
+                with open(os.path.join(tempdir,'hosted_logos',filename),'w') as fp:
+                    fp.write('')
+            os.mkdir(os.path.join(tempdir,'hosted_logos','old.svg'))
+
+            self.assertEqual(logos.removeUnreferenced({'foo.svg'}),1)
+            self.assertEqual(sorted(os.listdir(os.path.join(tempdir,'hosted_logos'))),['.foo.svg.tmp','foo.svg','notes.txt','old.svg'])
+            self.assertIsNone(manifest.get('bar.svg'))
+            self.assertIsNotNone(manifest.get('foo.svg'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import tempfile
+import os
+import requests
+import responses
+from responses import matchers
+import logging
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.httpsession import HTTPSession, LimitedHTTPAdapter
+
+class TestHTTPSession(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    url = 'https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?slug=aswf'
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    @responses.activate
+    def testRevalidateNotModified(self):
+        responses.add(method=responses.GET,url=self.url,body='{"Data": []}',headers={'ETag': '"abc"'})
+        session = HTTPSession(backend='memory')
+        self.assertEqual(session.get(self.url).text,'{"Data": []}')
+        self.assertTrue(session.get(self.url).from_cache)
+        self.assertEqual(session.requestsSent,1)
+        self.assertEqual(session.cacheHits,1)
+
+        # a new run against the same cache revalidates once, then uses the cache
+        responses.reset()
+        notModified = responses.add(method=responses.GET,url=self.url,status=304,match=[matchers.header_matcher({'If-None-Match': '"abc"'})])
+        session = HTTPSession(backend=session.cache)
+        response = session.get(self.url)
+        self.assertEqual(response.text,'{"Data": []}')
+        self.assertTrue(response.revalidated)
+        session.get(self.url)
+        self.assertEqual(notModified.call_count,1)
+        self.assertEqual(session.requestsSent,0)
+        self.assertEqual(session.notModified,1)
+        self.assertEqual(session.bytesSaved,24)
+
+    @responses.activate
+    def testRevalidateWithoutValidatorRefetches(self):
+        responses.add(method=responses.GET,url=self.url,body='old')
+        session = HTTPSession(backend='memory')
+        session.get(self.url)
+
+        responses.reset()
+        responses.add(method=responses.GET,url=self.url,body='new')
+        session = HTTPSession(backend=session.cache)
+        self.assertEqual(session.get(self.url).text,'new')
+        self.assertEqual(session.get(self.url).text,'new')
+        self.assertEqual(session.requestsSent,1)
+
+    @responses.activate
+    def testNoRevalidateOtherURLs(self):
+        url = 'https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml'
+        responses.add(method=responses.GET,url=url,body='old',headers={'ETag': '"abc"'})
+        session = HTTPSession(backend='memory')
+        session.get(url)
+
+        session = HTTPSession(backend=session.cache)
+        self.assertEqual(session.get(url).text,'old')
+        self.assertEqual(session.cacheHits,1)
+        self.assertEqual(len(responses.calls),1)
+
+    @responses.activate
+    def testRevalidateRequested(self):
+        url = 'https://someurl.com/logo.svg'
+        responses.add(method=responses.GET,url=url,body='old')
+        session = HTTPSession(backend='memory')
+        self.assertEqual(session.get(url,revalidate=True).text,'old')
+
+        responses.reset()
+        responses.add(method=responses.GET,url=url,body='new')
+        session = HTTPSession(backend=session.cache)
+        self.assertEqual(session.get(url,revalidate=True).text,'new')
+        self.assertEqual(session.get(url,revalidate=True).text,'new')
+        self.assertEqual(len(responses.calls),1)
+
+    @responses.activate
+    def testStaleWhileRevalidate(self):
+        responses.add(method=responses.GET,url=self.url,body='old')
+        session = HTTPSession(backend='memory')
+        session.get(self.url)
+
+        # a new run returns the cached response straight away and refreshes it in the background
+        responses.reset()
+        responses.add(method=responses.GET,url=self.url,body='new')
+        session = HTTPSession(backend=session.cache,staleWhileRevalidate=True)
+        self.assertEqual(session.get(self.url).text,'old')
+        self.assertEqual(session.staleServed,1)
+        session._refreshExecutor.shutdown(wait=True)
+        self.assertFalse(session.isStale(self.url))
+        self.assertEqual(session.refreshedURLs(),[self.url])
+        self.assertEqual(session.get(self.url).text,'new')
+        self.assertEqual(session.requestsSent,1)
+
+    @responses.activate
+    def testWaitForRefreshes(self):
+        responses.add(method=responses.GET,url=self.url,body='old')
+        session = HTTPSession(backend='memory')
+        self.assertTrue(session.waitForRefreshes(0))
+        session.get(self.url)
+
+        responses.reset()
+        responses.add(method=responses.GET,url=self.url,body='new')
+        session = HTTPSession(backend=session.cache,staleWhileRevalidate=True)
+        self.assertEqual(session.get(self.url).text,'old')
+        self.assertTrue(session.waitForRefreshes(10))
+        self.assertEqual(session.refreshedURLs(),[self.url])
+
+    @responses.activate
+    def testStaleWhileRevalidateNotModified(self):
+        responses.add(method=responses.GET,url=self.url,body='old',headers={'ETag': '"abc"'})
+        session = HTTPSession(backend='memory')
+        session.get(self.url)
+
+        responses.reset()
+        responses.add(method=responses.GET,url=self.url,status=304,match=[matchers.header_matcher({'If-None-Match': '"abc"'})])
+        session = HTTPSession(backend=session.cache,staleWhileRevalidate=True)
+        self.assertEqual(session.get(self.url).text,'old')
+        session._refreshExecutor.shutdown(wait=True)
+        self.assertEqual(session.refreshedURLs(),[])
+        self.assertEqual(session.get(self.url).text,'old')
+
+    @responses.activate
+    def testDefaultTimeout(self):
+        responses.add(method=responses.GET,url='https://foo.com/bar',body='bar')
+        responses.add(method=responses.GET,url='https://foo.com/baz',body='baz')
+        session = HTTPSession(backend='memory',timeout=(1, 2))
+        session.get('https://foo.com/bar')
+        session.get('https://foo.com/baz',timeout=5)
+        self.assertEqual(responses.calls[0].request.req_kwargs['timeout'],(1, 2))
+        self.assertEqual(responses.calls[1].request.req_kwargs['timeout'],5)
+
+    def testHostSemaphore(self):
+        adapter = LimitedHTTPAdapter(maxPerHost=2)
+        self.assertIs(adapter._hostSemaphore('foo.com'),adapter._hostSemaphore('foo.com'))
+        self.assertIsNot(adapter._hostSemaphore('foo.com'),adapter._hostSemaphore('bar.com'))
+        self.assertIsNone(LimitedHTTPAdapter()._hostSemaphore('foo.com'))
+
+    def testCreateKeyNormalizesURL(self):
+        key = HTTPSession.createKey(requests.Request('GET','https://API-GW.platform.linuxfoundation.org:443/project-service/v1/public/projects/?slug=aswf&orderBy=name#top'))
+        self.assertEqual(key,HTTPSession.createKey(requests.Request('GET','https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?orderBy=name&slug=aswf')))
+        self.assertNotEqual(key,HTTPSession.createKey(requests.Request('GET','https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?orderBy=name&slug=aswf2')))
+
+    @responses.activate
+    def testLFXApiBaseURL(self):
+        responses.add(method=responses.GET,url='http://localhost:8080/v1/public/projects?slug=aswf',json={"Data": []})
+        responses.add(method=responses.GET,url='https://foo.com/bar',body='bar')
+        session = HTTPSession(backend='memory',lfxApiBaseURL='http://localhost:8080/')
+        self.assertEqual(session.get('https://api-gw.platform.linuxfoundation.org/project-service/v1/public/projects?slug=aswf').url,'http://localhost:8080/v1/public/projects?slug=aswf')
+        self.assertEqual(session.get('https://foo.com/bar').url,'https://foo.com/bar')
+        self.assertEqual(HTTPSession(backend='memory').rewriteURL('https://api-gw.platform.linuxfoundation.org/project-service/v1'),'https://api-gw.platform.linuxfoundation.org/project-service/v1')
+
+    @responses.activate
+    def testPruneEvictsLeastRecentlyUsed(self):
+        urls = ['https://foo.com/{}'.format(i) for i in range(3)]
+        for url in urls:
+            responses.add(method=responses.GET,url=url,body='x' * 100)
+        session = HTTPSession(backend='memory')
+        for url in urls:
+            session.get(url)
+        self.assertIsNone(session.prune())
+        size = session.prune(maxSize=1000000)
+        self.assertEqual(len(session.cache.responses),3)
+
+        session.get(urls[0])
+        self.assertLess(session.prune(maxSize=size - 1),size)
+        self.assertEqual(len(session.cache.responses),2)
+        self.assertTrue(session.cache.contains(url=urls[0]))
+        self.assertFalse(session.cache.contains(url=urls[1]))
+
+    def testFromConfig(self):
+        config = Config()
+        config.httpCacheBackend = 'memory'
+        config.httpCacheExpireAfter = {'foo.com/bar': 60}
+        config.httpCacheMaxSize = 1000
+        session = HTTPSession.fromConfig(config)
+        self.assertEqual(session.settings.urls_expire_after,{'foo.com/bar': 60})
+        self.assertEqual(session.maxSize,1000)
+
+        config.httpCacheBackend = 'foo'
+        with self.assertRaises(ValueError):
+            HTTPSession.fromConfig(config)
+
+    def testFromConfigSQLiteSavesAccessTimes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config()
+            config.httpCacheLocation = os.path.join(tmpdir,'http_cache')
+            session = HTTPSession.fromConfig(config)
+            session.prune()
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir,'http_cache.sqlite')))
+            self.assertTrue(os.path.isfile(os.path.join(tmpdir,'http_cache.lru.json')))
+            session.close()
+
+if __name__ == '__main__':
+    unittest.main()
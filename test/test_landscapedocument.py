@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import unittest.mock
+import logging
+import tempfile
+import os
+
+import ruamel.yaml
+import ruamel.yaml.comments
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.landscapedocument import LandscapeDocument
+from lfx_landscape_tools.landscapemembers import LandscapeMembers
+from lfx_landscape_tools.landscapeoutput import LandscapeOutput
+
+class TestLandscapeDocument(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    testlandscape = """
+landscape:
+  - category:
+    name: test me
+    subcategories:
+      - subcategory:
+        name: Good
+        items:
+          - item:
+            crunchbase: https://www.crunchbase.com/organization/here-technologies
+            homepage_url: https://here.com/
+            logo: here_global_b_v.svg
+            name: HERE Global B.V.
+            twitter: https://twitter.com/here
+  - category:
+    name: other
+    subcategories: []
+"""
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        LandscapeDocument.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.landscapefile = os.path.join(self.tmpdir.name,'landscape.yml')
+        with open(self.landscapefile, 'w') as fp:
+            fp.write(self.testlandscape)
+
+    def tearDown(self):
+        LandscapeDocument.clear()
+        self.tmpdir.cleanup()
+
+    def testLoadOnce(self):
+        landscape = LandscapeDocument.load(self.landscapefile)
+        self.assertEqual(landscape['landscape'][0]['name'],'test me')
+        self.assertIs(LandscapeDocument.load(self.landscapefile),landscape)
+        self.assertIs(LandscapeDocument.load(os.path.join(self.tmpdir.name,'.','landscape.yml')),landscape)
+
+    def testLoadChangedFile(self):
+        landscape = LandscapeDocument.load(self.landscapefile)
+        with open(self.landscapefile, 'w') as fp:
+            fp.write(self.testlandscape.replace('test me','changed'))
+        reloaded = LandscapeDocument.load(self.landscapefile)
+        self.assertIsNot(reloaded,landscape)
+        self.assertEqual(reloaded['landscape'][0]['name'],'changed')
+
+    def testForget(self):
+        landscape = LandscapeDocument.load(self.landscapefile)
+        LandscapeDocument.forget(self.landscapefile)
+        self.assertIsNot(LandscapeDocument.load(self.landscapefile),landscape)
+
+    def testLoadMissingFile(self):
+        with self.assertRaises(OSError):
+            LandscapeDocument.load(os.path.join(self.tmpdir.name,'missing.yml'))
+
+    def testLoadReadOnly(self):
+        landscape = LandscapeDocument.load(self.landscapefile,roundTrip=False)
+        self.assertIs(type(landscape),dict)
+        self.assertIs(type(landscape['landscape'][0]['subcategories'][0]['items'][0]),dict)
+        self.assertIs(LandscapeDocument.load(self.landscapefile,roundTrip=False),landscape)
+        self.assertIsNot(LandscapeDocument.load(self.landscapefile),landscape)
+        self.assertIsInstance(LandscapeDocument.load(self.landscapefile),ruamel.yaml.comments.CommentedMap)
+
+    def testLoadReadOnlyReusesRoundTrip(self):
+        landscape = LandscapeDocument.load(self.landscapefile)
+        self.assertIs(LandscapeDocument.load(self.landscapefile,roundTrip=False),landscape)
+
+    def testLoadAndSaveLoaders(self):
+        config = Config()
+        config.basedir = self.tmpdir.name
+        config.landscapefile = 'landscape.yml'
+        config.landscapeMembersCategory = 'test me'
+        config.landscapeMembersSubcategories = [
+            {"name": "Good Membership", "category": "Good"},
+        ]
+        with unittest.mock.patch.object(ruamel.yaml.YAML,'load',autospec=True,side_effect=ruamel.yaml.YAML.load) as mock_load:
+            landscapemembers = LandscapeMembers(config=config)
+            landscapeoutput = LandscapeOutput(config=config)
+            landscapeoutput.save()
+            # the read uses the safe loader, and only the save uses the round-trip loader
+            self.assertEqual([call.args[0].typ for call in mock_load.call_args_list if getattr(call.args[1],'name',None) == self.landscapefile],[['safe'],['rt']])
+        self.assertEqual(landscapemembers.members[0].name,'HERE Global B.V.')
+
+        with open(self.landscapefile) as fp:
+            saved = fp.read()
+        self.assertIn('name: other',saved)
+        self.assertNotIn('HERE Global B.V.',saved)
+
+if __name__ == '__main__':
+    unittest.main()
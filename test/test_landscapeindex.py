@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import unittest.mock
+import logging
+import tempfile
+import os
+
+from lfx_landscape_tools.landscapeindex import LandscapeIndex
+
+class TestLandscapeIndex(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    testlandscape = """# the landscape
+landscape:
+  - category:
+    name: Members
+    subcategories:
+      - subcategory:
+        name: Premier
+        items:
+          - item:
+            name: Foo
+
+  # projects go here
+  - category:
+    name: "Projects"
+    color: red
+    subcategories: []
+    other: 1
+otherkey: 1
+"""
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.landscapefile = os.path.join(self.tmpdir.name,'landscape.yml')
+        self.indexfile = os.path.join(self.tmpdir.name,'state','landscapeindex.json')
+        with open(self.landscapefile,'w') as fp:
+            fp.write(self.testlandscape)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _range(self, start, end):
+        with open(self.landscapefile,'rb') as fp:
+            return fp.read()[start:end].decode('utf-8')
+
+    def testScan(self):
+        index = LandscapeIndex(self.landscapefile)
+        members = index.category('Members')
+        self.assertEqual(self._range(members['start'],members['end']),"""  - category:
+    name: Members
+    subcategories:
+      - subcategory:
+        name: Premier
+        items:
+          - item:
+            name: Foo
+""")
+        self.assertEqual(self._range(members['subcategoriesStart'],members['subcategoriesEnd']),"""    subcategories:
+      - subcategory:
+        name: Premier
+        items:
+          - item:
+            name: Foo
+""")
+        self.assertEqual(members['keyIndent'],4)
+        projects = index.category('Projects')
+        self.assertEqual(self._range(projects['subcategoriesStart'],projects['subcategoriesEnd']),"    subcategories: []\n")
+        self.assertEqual(self._range(projects['start'],projects['end']).splitlines()[-1],"    other: 1")
+        self.assertIsNone(index.category('Missing'))
+
+    def testScanSequenceAtKeyIndent(self):
+        with open(self.landscapefile,'w') as fp:
+            fp.write("""categories:
+- category:
+  name: Members
+  subcategories:
+  - subcategory:
+    name: Premier
+    items: []
+""")
+        members = LandscapeIndex(self.landscapefile).category('Members')
+        self.assertEqual(members['keyIndent'],2)
+        self.assertEqual(self._range(members['subcategoriesStart'],members['subcategoriesEnd']),"""  subcategories:
+  - subcategory:
+    name: Premier
+    items: []
+""")
+
+    def testSavedIndexReused(self):
+        index = LandscapeIndex(self.landscapefile,self.indexfile)
+        index.category('Members')
+        index.save()
+        with unittest.mock.patch.object(LandscapeIndex,'scan') as mock_scan:
+            self.assertEqual(LandscapeIndex(self.landscapefile,self.indexfile).category('Members'),index.category('Members'))
+            mock_scan.assert_not_called()
+
+    def testSavedIndexInvalid(self):
+        index = LandscapeIndex(self.landscapefile,self.indexfile)
+        index.category('Members')
+        index.save()
+        with open(self.landscapefile,'w') as fp:
+            fp.write("\n" + self.testlandscape)
+        members = LandscapeIndex(self.landscapefile,self.indexfile).category('Members')
+        self.assertEqual(self._range(members['start'],members['end']).splitlines()[0],"  - category:")
+
+    def testUpdate(self):
+        index = LandscapeIndex(self.landscapefile)
+        members = dict(index.category('Members'))
+        with open(self.landscapefile,'rb') as fp:
+            data = fp.read()
+        with open(self.landscapefile,'wb') as fp:
+            fp.write(data[:members['subcategoriesStart']] + b"    subcategories: []\n" + data[members['subcategoriesEnd']:])
+        index.update('Members',b"    subcategories: []\n")
+        scanned = LandscapeIndex(self.landscapefile).scan()['categories']
+        with unittest.mock.patch.object(LandscapeIndex,'scan') as mock_scan:
+            self.assertEqual(index.category('Members'),scanned['Members'])
+            self.assertEqual(index.category('Projects'),scanned['Projects'])
+            mock_scan.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,7 @@ from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.lfxmembers import LFXMembers
 from lfx_landscape_tools.landscapemembers import LandscapeMembers
 from lfx_landscape_tools.landscapeoutput import LandscapeOutput
+from lfx_landscape_tools.logomanifest import LogoManifest
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
@@ -81,5 +82,51 @@ landscape:
             self.assertEqual(members.members[1].name,"Blender Foundation")
             self.assertEqual(members.members[1].membership,"Associate Membership")
 
+    def testLoadDataUnchangedLogos(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            config.landscapeMembersCategory = 'ASWF Members'
+            config.landscapeMembersSubcategories = [
+                {"name": "Premier Membership", "category": "Premier"},
+            ]
+            with open(os.path.join(tempdir,config.landscapefile),'w') as fp:
+                fp.write("""
+landscape:
+  - category:
+    name: ASWF Members
+    subcategories:
+      - subcategory:
+        name: Premier
+        items:
+          - item:
+            name: Foo
+            homepage_url: https://foo.org/
+            logo: foo.svg
+          - item:
+            name: Bar
+            homepage_url: https://bar.org/
+            logo: bar.svg
+""")
+            os.makedirs(os.path.join(tempdir,config.hostedLogosDir))
+            for name in ['foo','bar']:
+                with open(os.path.join(tempdir,config.hostedLogosDir,'{}.svg'.format(name)),'w') as fp:
+                    fp.write('<svg>{}</svg>'.format(name))
+            manifest = LogoManifest(os.path.join(tempdir,config.stateDir,'hostedlogos.json'))
+            for name in ['foo','bar']:
+                manifest.reference('{}.svg'.format(name),name.title(),LogoManifest.digest('<svg>{}</svg>'.format(name)))
+                manifest.stat('{}.svg'.format(name),os.path.join(tempdir,config.hostedLogosDir,'{}.svg'.format(name)))
+            manifest.save()
+            with open(os.path.join(tempdir,config.hostedLogosDir,'bar.svg'),'w') as fp:
+                fp.write('<svg>changed bar</svg>')
+
+            members = LandscapeMembers(config=config)
+            self.assertEqual(members.members[0].logo.pendingFile,os.path.join(tempdir,config.hostedLogosDir,'foo.svg'))
+            self.assertEqual(members.members[0].logo.digest,LogoManifest.digest('<svg>foo</svg>'))
+            self.assertIsNone(members.members[1].logo.pendingFile)
+            self.assertEqual(str(members.members[1].logo),'<svg>changed bar</svg>')
+            self.assertEqual(str(members.members[0].logo),'<svg>foo</svg>')
+            self.assertEqual(members.members[0].toLandscapeItemAttributes()['logo'],'foo.svg')
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,9 +19,11 @@ from lfx_landscape_tools.members import Members
 from lfx_landscape_tools.lfxmembers import LFXMembers
 from lfx_landscape_tools.landscapemembers import LandscapeMembers
 from lfx_landscape_tools.landscapeoutput import LandscapeOutput
+from lfx_landscape_tools.logomanifest import LogoManifest
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.httpsession import HTTPSession
 
 class TestLandscapeOutput(unittest.TestCase):
     
@@ -160,7 +162,7 @@ landscape:
 
             landscape = LandscapeOutput(config=config)
             landscapemembers = LandscapeMembers(config=config,loadData=False)
-            with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+            with HTTPSession.shared().cache_disabled():
                 landscapemembers.loadData()    
             with unittest.mock.patch('lfx_landscape_tools.svglogo.SVGLogo.save') as mock_svglogo_save:
                 mock_svglogo_save.return_value = 'here_global_b_v.svg'
@@ -187,6 +189,184 @@ landscape:
         items: []
 """)
 
+    def testSaveNullOutsideEntryStart(self):
+        testlandscape = """landscape:
+  - category:
+    name: test me
+    subcategories:
+      - subcategory:
+        name: Good
+        items:
+          - item:
+            name: HERE Global B.V.
+            homepage_url: https://here.com/
+            logo: here.svg
+            extra:
+              category: null
+              item: null
+"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            config.landscapeMembersCategory = 'Members'
+            landscapefile = os.path.join(tempdir,config.landscapefile)
+            with open(landscapefile,'w') as fp:
+                fp.write(testlandscape)
+
+            LandscapeOutput(config=config).save()
+
+            with open(landscapefile) as fp:
+                self.assertIn(testlandscape.replace('landscape:\n',''),fp.read())
+
+    def testSaveUnchangedLandscape(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            config.landscapeMembersCategory = 'test me'
+
+            landscape = LandscapeOutput(config=config)
+            landscape.save()
+            landscapefile = os.path.join(tempdir,config.landscapefile)
+            os.utime(landscapefile,(0,0))
+            self.assertEqual(landscape.filesWritten,1)
+
+            landscape = LandscapeOutput(config=config)
+            landscape.save()
+            self.assertEqual(os.path.getmtime(landscapefile),0)
+            self.assertEqual(landscape.filesWritten,0)
+            self.assertEqual(landscape.filesSkipped,1)
+
+    def testSaveLandscapeError(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            landscapefile = os.path.join(tempdir,config.landscapefile)
+            with open(landscapefile,'w') as fp:
+                fp.write("landscape: []\n")
+
+            def crash(data, stream, **kwargs):
+                stream.write("landscape:\n")
+                raise RuntimeError('crashed mid dump')
+            with unittest.mock.patch('ruamel.yaml.YAML.dump',side_effect=crash):
+                with self.assertRaises(RuntimeError):
+                    LandscapeOutput(config=config).save()
+
+            with open(landscapefile) as fp:
+                self.assertEqual(fp.read(),"landscape: []\n")
+            self.assertEqual(os.listdir(tempdir),[config.landscapefile])
+
+    @responses.activate
+    def testSaveLandscapeSplice(self):
+        testlandscape = """# the landscape
+landscape:
+- category:
+  name: Other
+  subcategories:
+      - subcategory:
+        name: Good
+        items:
+          - item:
+            name: 'Quoted'   # a comment
+- category:
+  name: test me
+  subcategories:
+  - subcategory:
+    name: Good
+    items: []
+  # a comment after
+- category:
+  name: Last
+  subcategories: []
+"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            config.landscapeMembersCategory = 'test me'
+            config.landscapeMembersSubcategories = [
+                {"name": "Good Membership", "category": "Good"},
+                {"name": "Bad Membership", "category": "Bad"}
+                ]
+            config.landscapeSaveMode = 'splice'
+            landscapefile = os.path.join(tempdir,config.landscapefile)
+            with open(landscapefile,'w') as fp:
+                fp.write(testlandscape)
+
+            member = Member()
+            member.name = 'test'
+            member.homepage_url = 'https://foo.com'
+            member.membership = 'Good Membership'
+            member.crunchbase = 'https://www.crunchbase.com/organization/visual-effects-society'
+            with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file:
+                member.logo = 'test.svg'
+            members = LFXMembers(loadData=False,config=config)
+            members.members.append(member)
+            landscape = LandscapeOutput(config=config)
+            with unittest.mock.patch('lfx_landscape_tools.svglogo.SVGLogo.save') as mock_svglogo_save:
+                mock_svglogo_save.return_value = 'test.svg'
+                landscape.load(members=members)
+            with unittest.mock.patch('lfx_landscape_tools.landscapedocument.LandscapeDocument.load') as mock_load:
+                landscape.save()
+                mock_load.assert_not_called()
+
+            with open(landscapefile) as fp:
+                self.maxDiff = None
+                self.assertEqual(fp.read(),testlandscape.replace("""  subcategories:
+  - subcategory:
+    name: Good
+    items: []
+""","""  subcategories:
+    - subcategory:
+      name: Good
+      items:
+        - item:
+          name: test
+          homepage_url: https://foo.com/
+          logo: test.svg
+          crunchbase: https://www.crunchbase.com/organization/visual-effects-society
+    - subcategory:
+      name: Bad
+      items: []
+"""))
+            self.assertTrue(os.path.isfile(os.path.join(tempdir,config.stateDir,'landscapeindex.json')))
+
+            # a category not in the file falls back to rewriting the whole file
+            config.landscapeMembersCategory = 'new category'
+            landscape = LandscapeOutput(config=config)
+            landscape.save()
+            with open(landscapefile) as fp:
+                saved = fp.read()
+            self.assertIn("name: new category",saved)
+            self.assertIn("  - category:\n    name: Other\n",saved)
+
+    @responses.activate
+    def testUnknownMembershipSummary(self):
+        members = LFXMembers(loadData=False,config=Config())
+        for name, membership in [('test','Gold Membership'),('test2','Silver Membership'),('test3','Gold Membership')]:
+            member = Member()
+            member.name = name
+            member.membership = membership
+            members.members.append(member)
+
+        landscape = LandscapeOutput(config=Config())
+        with self.assertLogs(level='ERROR') as logs:
+            landscape.load(members)
+        self.assertEqual(logs.output,["ERROR:root:Not adding 3 items to Landscape - SubCategory not found for 'Gold Membership' (test, test3); 'Silver Membership' (test2)"])
+        self.assertEqual(3,landscape.itemsErrors)
+        self.assertEqual(0,landscape.itemsProcessed)
+
+    def testSubcategoryRouting(self):
+        config = Config()
+        config.landscapeMembersSubcategories = [
+            {"name": "Premier Membership", "category": "Premier"},
+            {"name": "Strategic Membership", "category": "Premier"},
+            {"name": "General Membership", "category": "General"},
+            {"name": "General Membership", "category": "Associate"},
+        ]
+        landscape = LandscapeOutput(config=config)
+        self.assertEqual([subcategory['name'] for subcategory in landscape.landscapeItems],['Premier','General','Associate'])
+        self.assertIs(landscape._subcategoriesByMembership['Strategic Membership'],landscape.landscapeItems[0])
+        self.assertIs(landscape._subcategoriesByMembership['General Membership'],landscape.landscapeItems[1])
+
     def testAddItemToLandscape(self):
         members = LFXMembers(loadData=False,config=Config())
         
@@ -233,6 +413,101 @@ landscape:
         self.assertEqual(1,landscape.itemsProcessed)
         self.assertEqual(2,landscape.itemsErrors)
 
+    @responses.activate
+    def testLoadContentAddressedLogos(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            config.hostedLogosContentAddressed = True
+            members = LFXMembers(loadData=False,config=config)
+            for name in ['test','test2']:
+                member = Member()
+                member.name = name
+                member.homepage_url = 'https://foo.com'
+                member.membership = 'Premier Membership'
+                member.crunchbase = 'https://www.crunchbase.com/organization/visual-effects-society'
+                member.logo = SVGLogo(contents='<svg>same</svg>')
+                members.members.append(member)
+
+            landscape = LandscapeOutput(config=config)
+            landscape.load(members)
+            landscape.saveState()
+
+            filename = '{}.svg'.format(LogoManifest.digest('<svg>same</svg>'))
+            self.assertEqual([item['logo'] for item in landscape.landscapeItems[0]['items']],[filename,filename])
+            self.assertEqual(os.listdir(os.path.join(tempdir,config.hostedLogosDir)),[filename])
+            self.assertEqual(LogoManifest(os.path.join(tempdir,config.stateDir,'hostedlogos.json')).get(filename)['owners'],['test','test2'])
+
+    @responses.activate
+    def testRemoveUnreferencedLogos(self):
+        testlandscape = """
+landscape:
+  - category:
+    name: Other
+    subcategories:
+      - subcategory:
+        name: Good
+        items:
+          - item:
+            name: Other
+            logo: other.svg
+  - category:
+    name: Members
+    subcategories: []
+"""
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            with open(os.path.join(tempdir,config.landscapefile),'w') as fp:
+                fp.write(testlandscape)
+            os.makedirs(os.path.join(tempdir,config.hostedLogosDir))
+            for filename in ['other.svg','left.svg']:
+                with open(os.path.join(tempdir,config.hostedLogosDir,filename),'w') as fp:
+                    fp.write('<svg></svg>')
+
+            landscape = LandscapeOutput(config=config)
+            with self.assertLogs(level='WARNING'):
+                self.assertEqual(landscape.removeUnreferencedLogos(),0)
+
+            members = LFXMembers(loadData=False,config=config)
+            member = Member()
+            member.name = 'test'
+            member.homepage_url = 'https://foo.com'
+            member.membership = 'Premier Membership'
+            member.crunchbase = 'https://www.crunchbase.com/organization/visual-effects-society'
+            member.logo = SVGLogo(contents='<svg>test</svg>')
+            members.members.append(member)
+            landscape.load(members)
+            landscape.save()
+            self.assertEqual(landscape.removeUnreferencedLogos(),1)
+            self.assertEqual(sorted(os.listdir(os.path.join(tempdir,config.hostedLogosDir))),['other.svg','test.svg'])
+
+    def testRemoveUnreferencedLogosAfterReset(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            config = Config()
+            config.basedir = tempdir
+            with open(os.path.join(tempdir,config.landscapefile),'w') as fp:
+                fp.write('landscape: [')
+            os.makedirs(os.path.join(tempdir,config.hostedLogosDir))
+            with open(os.path.join(tempdir,config.hostedLogosDir,'other.svg'),'w') as fp:
+                fp.write('<svg></svg>')
+
+            landscape = LandscapeOutput(config=config)
+            members = LFXMembers(loadData=False,config=config)
+            member = Member()
+            member.name = 'test'
+            member.homepage_url = 'https://foo.com'
+            member.membership = 'Premier Membership'
+            member.crunchbase = 'https://www.crunchbase.com/organization/visual-effects-society'
+            member.logo = SVGLogo(contents='<svg>test</svg>')
+            members.members.append(member)
+            landscape.load(members)
+            with self.assertLogs(level='ERROR'):
+                landscape.save()
+            with self.assertLogs(level='WARNING'):
+                self.assertEqual(landscape.removeUnreferencedLogos(),0)
+            self.assertEqual(sorted(os.listdir(os.path.join(tempdir,config.hostedLogosDir))),['other.svg','test.svg'])
+
     def testSyncItemInLandscape(self):
         members = LFXProjects(loadData=False,config=Config())
         
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import responses
+import requests
+import logging
+import json
+
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient, JSONRecordStream
+
+class TestLFXAPIClient(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    def testPageURL(self):
+        client = LFXAPIClient(pageSize=100)
+        self.assertEqual(client.pageURL('https://foo.com/projects?orderBy=name',200),'https://foo.com/projects?orderBy=name&pageSize=100&offset=200')
+        self.assertEqual(client.pageURL('https://foo.com/projects'),'https://foo.com/projects?pageSize=100&offset=0')
+
+    def testJSONRecordStreamEnvelope(self):
+        body = json.dumps({"Data": [{"Name": "foo \"]}"},{"Name": "bar", "Count": 12345}],"Metadata": {"Offset": 0,"PageSize": 100,"TotalSize": 2}}).encode('utf-8')
+        for chunksize in [1,3,7,len(body)]:
+            stream = JSONRecordStream([body[i:i+chunksize] for i in range(0,len(body),chunksize)])
+            self.assertEqual(list(stream),[{"Name": "foo \"]}"},{"Name": "bar", "Count": 12345}])
+            self.assertEqual(stream.envelope['Metadata']['TotalSize'],2)
+
+    def testJSONRecordStreamArray(self):
+        stream = JSONRecordStream([b'[{"Name": "f', b'\xc3', b'\xa9"}, 12', b'3]'])
+        self.assertEqual(list(stream),[{"Name": "fé"},123])
+
+    @responses.activate
+    def testRecordsFollowsPaging(self):
+        client = LFXAPIClient(pageSize=2,prefetch=2,session=requests.Session())
+        url = 'https://foo.com/projects?orderBy=name'
+        records = [{"Slug": "project{}".format(i)} for i in range(5)]
+        for offset in range(0,5,2):
+            responses.add(
+                method=responses.GET,
+                url=client.pageURL(url,offset),
+                json={
+                    "Data": records[offset:offset+2],
+                    "Metadata": {
+                        "Offset": offset,
+                        "PageSize": 2,
+                        "TotalSize": 5
+                    }
+                })
+
+        self.assertEqual(list(client.records(url)),records)
+
+    @responses.activate
+    def testRecordsNoMetadata(self):
+        client = LFXAPIClient(pageSize=2,session=requests.Session())
+        url = 'https://foo.com/projects'
+        responses.add(method=responses.GET,url=client.pageURL(url,0),json={"Data": [{"Slug": "a"},{"Slug": "b"}]})
+        responses.add(method=responses.GET,url=client.pageURL(url,2),json={"Data": [{"Slug": "c"}]})
+
+        self.assertEqual([record['Slug'] for record in client.records(url)],['a','b','c'])
+
+    @responses.activate
+    def testStream(self):
+        client = LFXAPIClient(session=requests.Session())
+        responses.add(method=responses.GET,url='https://foo.com/members',body='[{"Name": "a"},{"Name": "b"}]')
+
+        self.assertEqual([record['Name'] for record in client.stream('https://foo.com/members')],['a','b'])
+
+if __name__ == '__main__':
+    unittest.main()
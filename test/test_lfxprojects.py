@@ -10,6 +10,8 @@ import responses
 import requests
 import logging
 import os
+import tempfile
+import json
 
 from lfx_landscape_tools.config import Config
 from lfx_landscape_tools.cli import Cli
@@ -21,6 +23,8 @@ from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.httpsession import HTTPSession
 
 class TestLFXProjects(unittest.TestCase):
     
@@ -39,7 +43,7 @@ class TestLFXProjects(unittest.TestCase):
         with open("{}/github_openassetio_response.html".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
             responses.get("https://github.com/OpenAssetIO",body=fileobject.read())
         with open("{}/github_openassetio_search_repo.json".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
-            responses.get("https://api.github.com:443/search/repositories?sort=stars&order=desc&q=org%3AOpenAssetIO&per_page=1000",body=fileobject.read())
+            responses.get("https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",body=fileobject.read())
        
         
     @responses.activate
@@ -103,7 +107,7 @@ class TestLFXProjects(unittest.TestCase):
             })
         responses.add(
             method=responses.GET,
-            url=members.endpointURL.format(members.project),
+            url=LFXAPIClient().pageURL(members.endpointURL.format(members.project)),
             json={
                 "Data": [
                     {
@@ -752,7 +756,7 @@ class TestLFXProjects(unittest.TestCase):
                 }
             )
           
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             members.loadData()
         self.assertEqual(members.members[0].name,"OpenCue")
         self.assertEqual(members.members[0].crunchbase,"https://www.crunchbase.com/organization/linux-foundation")
@@ -799,7 +803,7 @@ class TestLFXProjects(unittest.TestCase):
         members = LFXProjects(config=config,loadData=False)
         responses.add(
             method=responses.GET,
-            url=members.endpointURL.format(members.project),
+            url=LFXAPIClient().pageURL(members.endpointURL.format(members.project)),
             json={
                 "Data": [
                     {
@@ -879,9 +883,112 @@ class TestLFXProjects(unittest.TestCase):
                 }
             })
         
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             members.loadData()
         self.assertEqual(members.members,[])
 
+    @responses.activate
+    def testLoadDataReusesUnchangedRecords(self):
+        record = {
+            "Description": "OpenCue is an open source render management system.",
+            "DisplayOnWebsite": True,
+            "Name": "OpenCue",
+            "ParentSlug": "aswf",
+            "ProjectID": "a092M00001IV3znQAD",
+            "ProjectLogo": "https://lf-master-project-logos-prod.s3.us-east-2.amazonaws.com/opencue.svg",
+            "Slug": "opencue",
+            "Status": "Active",
+            "TestRecord": False,
+            "Website": "https://opencue.io"
+        }
+        logo = responses.get("https://lf-master-project-logos-prod.s3.us-east-2.amazonaws.com/opencue.svg",body='<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config()
+            config.view = 'projects'
+            config.basedir = tmpdir
+            config.slug = 'aswf'
+            listing = responses.get(LFXAPIClient().pageURL(LFXProjects.endpointURL.format('aswf')),json={"Data": [record], "Metadata": {"Offset": 0, "PageSize": 2000, "TotalSize": 1}})
+
+            def build():
+                members = LFXProjects(config=config)
+                landscapeoutput = LandscapeOutput(config=config)
+                landscapeoutput.load(members=members)
+                landscapeoutput.save()
+                landscapeoutput.saveState()
+                members.saveState()
+                with open(os.path.join(tmpdir,config.landscapefile)) as fp:
+                    return members, fp.read()
+
+            def handEdit():
+                # a hand edit to a field LFX owns, which the next build replaces
+                with open(os.path.join(tmpdir,config.landscapefile)) as fp:
+                    landscape = fp.read()
+                with open(os.path.join(tmpdir,config.landscapefile),'w') as fp:
+                    fp.write(landscape.replace("OpenCue is an open source render management system.","Edited by hand"))
+
+            with HTTPSession.shared().cache_disabled():
+                members, built = build()
+                self.assertEqual(members.members[0].description,"OpenCue is an open source render management system.")
+                self.assertTrue(os.path.isfile(os.path.join(tmpdir,'.lfx_landscape_tools','lfxprojects.json')))
+                self.assertEqual(logo.call_count,1)
+
+                handEdit()
+                members, incremental = build()
+                self.assertEqual(len(members.members),1)
+                self.assertEqual(members.members[0].description,"OpenCue is an open source render management system.")
+                # reused, so the logo wasn't fetched again
+                self.assertEqual(logo.call_count,1)
+
+                handEdit()
+                config.incrementalSync = False
+                members, full = build()
+                self.assertEqual(logo.call_count,2)
+                self.assertEqual(incremental,full)
+                self.assertEqual(incremental,built)
+
+                config.incrementalSync = True
+                members, built = build()
+                record["Description"] = "OpenCue is a render management system."
+                listing.body = json.dumps({"Data": [record], "Metadata": {"Offset": 0, "PageSize": 2000, "TotalSize": 1}})
+                members = LFXProjects(config=config)
+                self.assertEqual(members.members[0].description,"OpenCue is a render management system.")
+
+    @responses.activate
+    def testRefreshRebuildsChangedRecords(self):
+        records = [
+            {
+                "DisplayOnWebsite": True,
+                "Name": name,
+                "ParentSlug": "aswf",
+                "ProjectLogo": "https://lf-master-project-logos-prod.s3.us-east-2.amazonaws.com/{}.svg".format(name.lower()),
+                "Slug": name.lower(),
+                "Status": "Active",
+                "TestRecord": False,
+                "Website": "https://{}.io".format(name.lower())
+            } for name in ['OpenCue','OpenEXR']
+        ]
+        for record in records:
+            responses.get(record['ProjectLogo'],body='<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config()
+            config.view = 'projects'
+            config.basedir = tmpdir
+            config.slug = 'aswf'
+            listing = responses.get(LFXAPIClient().pageURL(LFXProjects.endpointURL.format('aswf')),json={"Data": records, "Metadata": {"Offset": 0, "PageSize": 2000, "TotalSize": 2}})
+
+            with HTTPSession.shared().cache_disabled():
+                members = LFXProjects(config=config)
+                opencue, openexr = members.members
+
+                records[1]["Description"] = "Refreshed"
+                listing.body = json.dumps({"Data": records, "Metadata": {"Offset": 0, "PageSize": 2000, "TotalSize": 2}})
+                self.assertIs(members.refresh(),members)
+            self.assertEqual(len(members.members),2)
+            self.assertIs(members.members[0],opencue)
+            self.assertIsNot(members.members[1],openexr)
+            self.assertEqual(members.members[1].description,"Refreshed")
+
 if __name__ == '__main__':
     unittest.main()
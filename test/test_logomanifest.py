@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import logging
+import tempfile
+import os
+
+from lfx_landscape_tools.logomanifest import LogoManifest
+
+class TestLogoManifest(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    def testSaveAndLoad(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'state','hostedlogos.json')
+            logofile = os.path.join(tempdir,'foo.svg')
+            with open(logofile,'w') as fp:
+                fp.write('<svg>foo</svg>')
+            manifest = LogoManifest(filename)
+            self.assertEqual(manifest.run,1)
+            self.assertEqual(len(manifest),0)
+            self.assertIsNone(manifest.get('foo.svg'))
+            manifest.reference('foo.svg','Foo','abc')
+            manifest.reference('foo.svg','Other Foo','abc')
+            manifest.stat('foo.svg',logofile)
+            manifest.save()
+
+            manifest = LogoManifest(filename)
+            self.assertEqual(manifest.run,2)
+            self.assertEqual(len(manifest),1)
+            self.assertEqual(manifest.get('foo.svg'),{'owners': ['Foo','Other Foo'], 'hash': 'abc', 'size': 14, 'mtime': os.stat(logofile).st_mtime_ns, 'lastRun': 1})
+
+            # owners are the ones that referenced it in this run
+            manifest.reference('foo.svg','Foo','abc')
+            self.assertEqual(manifest.get('foo.svg')['owners'],['Foo'])
+            self.assertEqual(manifest.get('foo.svg')['lastRun'],2)
+
+    def testUnchanged(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            logofile = os.path.join(tempdir,'foo.svg')
+            with open(logofile,'w') as fp:
+                fp.write('<svg>foo</svg>')
+            manifest = LogoManifest(os.path.join(tempdir,'hostedlogos.json'))
+            self.assertIsNone(manifest.unchanged('foo.svg',logofile))
+            manifest.reference('foo.svg','Foo','abc')
+            self.assertIsNone(manifest.unchanged('foo.svg',logofile))
+            manifest.stat('foo.svg',logofile)
+            self.assertEqual(manifest.unchanged('foo.svg',logofile),'abc')
+
+            os.utime(logofile,ns=(0,0))
+            self.assertIsNone(manifest.unchanged('foo.svg',logofile))
+            manifest.stat('foo.svg',logofile)
+            self.assertEqual(manifest.unchanged('foo.svg',logofile),'abc')
+
+            # a new hash means the file is to be rewritten
+            manifest.reference('foo.svg','Foo','def')
+            self.assertIsNone(manifest.unchanged('foo.svg',logofile))
+
+            manifest.remove('foo.svg')
+            self.assertIsNone(manifest.get('foo.svg'))
+
+    def testOwned(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'hostedlogos.json')
+            manifest = LogoManifest(filename)
+            self.assertIsNone(manifest.owned('Foo'))
+            manifest.reference('abc.svg','Foo','abc')
+            manifest.reference('abc.svg','Bar','abc')
+            self.assertEqual(manifest.owned('Foo'),'abc.svg')
+            manifest.save()
+
+            # the file referenced in the latest run wins, even though the old entry still lists the item
+            manifest = LogoManifest(filename)
+            self.assertEqual(manifest.owned('Foo'),'abc.svg')
+            manifest.reference('def.svg','Foo','def')
+            manifest.save()
+            manifest = LogoManifest(filename)
+            self.assertEqual(manifest.get('abc.svg')['owners'],['Foo','Bar'])
+            self.assertEqual(manifest.owned('Foo'),'def.svg')
+            self.assertEqual(manifest.owned('Bar'),'abc.svg')
+
+            manifest.remove('abc.svg')
+            self.assertIsNone(manifest.owned('Bar'))
+            self.assertEqual(manifest.owned('Foo'),'def.svg')
+
+    def testFind(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            with open(os.path.join(tempdir,'foo.svg'),'w') as fp:
+                fp.write('<svg>foo</svg>')
+            manifest = LogoManifest(os.path.join(tempdir,'hostedlogos.json'))
+            manifest.reference('foo.svg','Foo','abc')
+            manifest.stat('foo.svg',os.path.join(tempdir,'foo.svg'))
+            self.assertEqual(manifest.find('Foo','abc',tempdir),os.path.join(tempdir,'foo.svg'))
+            self.assertIsNone(manifest.find('Foo','def',tempdir))
+            self.assertIsNone(manifest.find('Bar','abc',tempdir))
+
+            with open(os.path.join(tempdir,'foo.svg'),'w') as fp:
+                fp.write('<svg>changed foo</svg>')
+            self.assertIsNone(manifest.find('Foo','abc',tempdir))
+
+    def testLoadInvalid(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'hostedlogos.json')
+            with open(filename,'w') as fp:
+                fp.write('not json')
+            with self.assertLogs(level='WARNING'):
+                manifest = LogoManifest(filename)
+            self.assertEqual(len(manifest),0)
+            self.assertEqual(manifest.run,1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ import responses
 import requests
 import requests_cache
 import logging
+import time
 
 from lfx_landscape_tools.config import Config
 from lfx_landscape_tools.cli import Cli
@@ -23,6 +24,8 @@ from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.deadline import Deadline
 
 class TestMember(unittest.TestCase):
     
@@ -42,7 +45,7 @@ class TestMember(unittest.TestCase):
         with open("{}/github_openassetio_response.html".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
             responses.get("https://github.com/OpenAssetIO",body=fileobject.read())
         with open("{}/github_openassetio_search_repo.json".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
-            responses.get("https://api.github.com:443/search/repositories?sort=stars&order=desc&q=org%3AOpenAssetIO&per_page=1000",body=fileobject.read())
+            responses.get("https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",body=fileobject.read())
 
     def testLinkedInValid(self):
         validLinkedInURLs = [
@@ -107,7 +110,7 @@ class TestMember(unittest.TestCase):
 
     @responses.activate
     def testSetRepoGitHubOrgWithPins(self):
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             member = Member()
             member.name = 'test'
             member.repo_url = 'https://github.com/OpenAssetIO'
@@ -123,7 +126,7 @@ class TestMember(unittest.TestCase):
 
     @responses.activate
     def testSetRepoGitHubOrgWithoutPins(self):
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             responses.replace(responses.GET,"https://github.com/OpenAssetIO",body="")
             member = Member()
             member.name = 'test'
@@ -134,6 +137,64 @@ class TestMember(unittest.TestCase):
             self.assertEqual(attributes['extra']['annotations']['project_org'],'https://github.com/OpenAssetIO')
             self.assertEqual(attributes['additional_repos'],[])
 
+    @responses.activate
+    def testSetRepoGitHubOrgSearchCached(self):
+        responses.replace(responses.GET,"https://github.com/OpenAssetIO",body="")
+        session = HTTPSession(backend='memory')
+        with unittest.mock.patch.object(HTTPSession,'shared',return_value=session):
+            for attempt in range(2):
+                member = Member()
+                member.name = 'test'
+                member.repo_url = 'https://github.com/OpenAssetIO'
+                self.assertEqual(member.repo_url,'https://github.com/OpenAssetIO/OpenAssetIO')
+        self.assertEqual(len([call for call in responses.calls if call.request.url.startswith(Member.githubSearchURL)]),1)
+        # the search doesn't install a cache for every other requests.Session in the process
+        self.assertIs(requests.Session,requests.sessions.Session)
+
+    @responses.activate
+    def testSetRepoGitHubOrgRateLimitPastDeadline(self):
+        responses.replace(responses.GET,"https://github.com/OpenAssetIO",body="")
+        responses.replace(responses.GET,"https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",status=403,headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 3600)},json={"message": "API rate limit exceeded"})
+        Deadline.configure(600)
+        try:
+            with HTTPSession.shared().cache_disabled(), unittest.mock.patch('lfx_landscape_tools.member.time.sleep') as sleep:
+                member = Member()
+                member.name = 'test'
+                member.repo_url = 'https://github.com/OpenAssetIO'
+            sleep.assert_not_called()
+            self.assertIsNone(member.repo_url)
+            self.assertIsNone(member.project_org)
+            self.assertEqual(Deadline.shared().skipped,{'GitHub org resolution': ['test']})
+        finally:
+            Deadline.configure()
+
+    @responses.activate
+    def testSetRepoGitHubOrgRateLimitRetried(self):
+        responses.replace(responses.GET,"https://github.com/OpenAssetIO",body="")
+        with open("{}/github_openassetio_search_repo.json".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+            found = fileobject.read()
+        responses.remove(responses.GET,"https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1")
+        responses.get("https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",status=403,headers={'Retry-After': '2'},json={"message": "You have exceeded a secondary rate limit"})
+        responses.get("https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",body=found)
+        with HTTPSession.shared().cache_disabled(), unittest.mock.patch('lfx_landscape_tools.member.time.sleep') as sleep:
+            member = Member()
+            member.name = 'test'
+            member.repo_url = 'https://github.com/OpenAssetIO'
+        sleep.assert_called_once_with(2)
+        self.assertEqual(member.repo_url,'https://github.com/OpenAssetIO/OpenAssetIO')
+
+    @responses.activate
+    def testSetRepoGitHubOrgServerErrors(self):
+        responses.replace(responses.GET,"https://github.com/OpenAssetIO",body="")
+        search = responses.replace(responses.GET,"https://api.github.com/search/repositories?q=org%3AOpenAssetIO&sort=stars&order=desc&per_page=1",status=502)
+        with HTTPSession.shared().cache_disabled():
+            member = Member()
+            member.name = 'test'
+            with self.assertLogs(level='WARNING'):
+                member.repo_url = 'https://github.com/OpenAssetIO'
+        self.assertEqual(search.call_count,Member.githubAttempts)
+        self.assertIsNone(member.repo_url)
+
     def testSetCrunchbaseNotValid(self):
         invalidCrunchbaseURLs = [
             'https://yahoo.com',
@@ -564,19 +625,6 @@ class TestMember(unittest.TestCase):
         with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file:
             membertooverlay.overlay(member)
 
-    @responses.activate
-    def testHostLogo(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            tmpfilename = tempfile.NamedTemporaryFile(dir=tempdir,mode='w',delete=False,suffix='.svg')
-            tmpfilename.write('this is a file')
-            tmpfilename.close()
-
-            member = Member()
-            member.name = 'dog'
-            member.logo = SVGLogo(name='dog')
-            member.hostLogo(tempdir)
-            self.assertTrue(os.path.exists(os.path.join(tempdir,'dog.svg')))
-
     def testExtra(self):
         member = Member()
         member.extra = {
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import responses
+import logging
+import os
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.member import Member
+from lfx_landscape_tools.members import Members
+from lfx_landscape_tools.mergepipeline import MergePipeline
+from lfx_landscape_tools.sourceregistry import SourceRegistry
+
+class TestSource(Members):
+
+    items = []
+
+    def processConfig(self, config):
+        pass
+
+    def loadData(self):
+        for item in self.items:
+            member = Member()
+            for key, value in item.items():
+                setattr(member, key, value)
+            self.members.append(member)
+
+class TestLFXSource(TestSource):
+    items = [
+        {
+            'name': 'OpenCue',
+            'homepage_url': 'https://opencue.io',
+            'description': 'From LFX',
+            'second_path': ['PMO Managed / All'],
+            'extra': {'lfx_slug': 'opencue', 'accepted': '2020-01-01', 'other_links': [{'name': 'Calendar', 'url': 'https://zoom-lfx.platform.linuxfoundation.org/meetings/opencue'}]},
+        },
+        {
+            'name': 'OpenEXR',
+            'homepage_url': 'https://openexr.com',
+            'description': 'From LFX',
+            'extra': {'lfx_slug': 'openexr'},
+        },
+    ]
+
+class TestTACSource(TestSource):
+    items = [
+        {
+            'name': 'OpenCue',
+            'second_path': ['SIG / Rendering'],
+            'extra': {'lfx_slug': 'opencue', 'accepted': '2019-06-01', 'annual_review_date': '2024-01-01', 'other_links': [{'name': 'Review', 'url': 'https://github.com/AcademySoftwareFoundation/tac/issues/1'}], 'annotations': {'chair': 'Jane Doe'}},
+        },
+    ]
+
+class TestLandscapeSource(TestSource):
+    items = [
+        {
+            'name': 'OpenCue',
+            'homepage_url': 'https://www.opencue.io',
+            'description': 'From the landscape',
+            'twitter': 'https://twitter.com/opencue',
+            'second_path': ['Industry / Motion Pictures', 'SIG / Rendering'],
+            'extra': {'lfx_slug': 'opencue', 'accepted': '2018-01-01', 'incubating': '2019-01-01', 'annotations': {'chair': 'John Doe', 'TAC_representative': 'Jim Doe'}},
+        },
+        {
+            'name': 'OpenEXR',
+            'homepage_url': 'https://openexr.com',
+            'description': 'From the landscape',
+        },
+    ]
+
+class TestRenamedLFXSource(TestSource):
+    items = [
+        {
+            'name': 'OpenVDB',
+            'homepage_url': 'https://openvdb.org',
+            'description': 'From LFX',
+        },
+    ]
+
+class TestRenamedTACSource(TestSource):
+    items = [
+        {
+            'name': 'Open VDB',
+            'homepage_url': 'https://www.openvdb.org',
+            'twitter': 'https://twitter.com/openvdb',
+        },
+    ]
+
+class TestRenamedLandscapeSource(TestSource):
+    items = [
+        {
+            'name': 'OpenVDB',
+            'homepage_url': 'https://www.openvdb.org',
+            'description': 'From the landscape',
+        },
+    ]
+
+class TestStaleLFXSource(TestLFXSource):
+
+    loads = 0
+
+    def loadData(self):
+        # stale the first time it's loaded, then refreshed
+        TestStaleLFXSource.loads += 1
+        super().loadData()
+        for member in self.members:
+            member.stale = TestStaleLFXSource.loads == 1
+            member.description = 'Load {}'.format(TestStaleLFXSource.loads)
+
+class TestCountedTACSource(TestTACSource):
+
+    loads = 0
+
+    def loadData(self):
+        TestCountedTACSource.loads += 1
+        super().loadData()
+
+class TestMergePipeline(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    sourceTypes = {'lfx': TestLFXSource, 'tac': TestTACSource, 'landscape': TestLandscapeSource}
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        with open("{}/data.yml".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+            responses.get('https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml', body=fileobject.read())
+
+    def _fields(self, members):
+        return [{key: getattr(member,key,None) for key in dir(member)} for member in members.members]
+
+    @responses.activate
+    def testMergeMatchesSequentialOverlays(self):
+        config = Config()
+        items = TestLFXSource(config=config)
+        items.overlay(memberstooverlay=TestLandscapeSource(config=config))
+        items.overlay(memberstooverlay=TestTACSource(config=config))
+        items.overlay(memberstooverlay=TestLFXSource(config=config))
+        items.overlay(memberstooverlay=TestTACSource(config=config),onlykeys=['extra'])
+
+        merged = MergePipeline(config=config,sources=SourceRegistry(config),sourceTypes=self.sourceTypes).merge()
+        self.assertEqual(self._fields(merged),self._fields(items))
+        self.assertEqual(merged.members[0].description,'From LFX')
+        self.assertEqual(merged.members[0].twitter,'https://twitter.com/opencue')
+        self.assertEqual(merged.members[0].extra['accepted'],'2019-06-01')
+        self.assertEqual(merged.members[0].extra['annotations']['chair'],'Jane Doe')
+
+    @responses.activate
+    def testMergeMatchesSequentialOverlaysWithLandscapeHomepage(self):
+        config = Config()
+        items = TestRenamedLFXSource(config=config)
+        items.overlay(memberstooverlay=TestRenamedLandscapeSource(config=config))
+        items.overlay(memberstooverlay=TestRenamedTACSource(config=config))
+        items.overlay(memberstooverlay=TestRenamedLFXSource(config=config))
+        items.overlay(memberstooverlay=TestRenamedTACSource(config=config),onlykeys=['extra'])
+
+        merged = MergePipeline(config=config,sources=SourceRegistry(config),sourceTypes={'lfx': TestRenamedLFXSource, 'tac': TestRenamedTACSource, 'landscape': TestRenamedLandscapeSource}).merge()
+        self.assertEqual(self._fields(merged),self._fields(items))
+        # only matched by the homepage_url the landscape has
+        self.assertEqual(merged.members[0].twitter,'https://twitter.com/openvdb')
+
+    @responses.activate
+    def testMergeFieldPrecedence(self):
+        config = Config()
+        config.syncMergePrecedence = {'*': ['landscape','lfx'], 'extra.*': ['lfx','landscape']}
+        merged = MergePipeline(config=config,sourceTypes=self.sourceTypes).merge()
+        self.assertEqual(merged.members[0].description,'From the landscape')
+        self.assertEqual(merged.members[0].second_path,['Industry / Motion Pictures', 'SIG / Rendering', 'PMO Managed / All'])
+        self.assertEqual(merged.members[0].extra['accepted'],'2020-01-01')
+        self.assertEqual(merged.members[0].extra['annotations']['chair'],'John Doe')
+        self.assertNotIn('annual_review_date',merged.members[0].extra)
+
+    @responses.activate
+    def testRefreshOnlyStaleSources(self):
+        TestStaleLFXSource.loads = 0
+        TestCountedTACSource.loads = 0
+        pipeline = MergePipeline(config=Config(),sources=SourceRegistry(Config()),sourceTypes={'lfx': TestStaleLFXSource, 'tac': TestCountedTACSource, 'landscape': TestLandscapeSource})
+        merged = pipeline.merge()
+        self.assertTrue(merged.members[0].stale)
+        self.assertEqual(merged.members[0].description,'Load 1')
+
+        merged = pipeline.refresh()
+        self.assertFalse(merged.members[0].stale)
+        self.assertEqual(merged.members[0].description,'Load 2')
+        self.assertEqual(merged.members[0].extra['annotations']['chair'],'Jane Doe')
+        self.assertEqual(TestStaleLFXSource.loads,2)
+        self.assertEqual(TestCountedTACSource.loads,1)
+
+    def testFieldPrecedence(self):
+        pipeline = MergePipeline(config=Config())
+        self.assertEqual(pipeline.fieldPrecedence('extra'),['tac','lfx','landscape'])
+        self.assertEqual(pipeline.fieldPrecedence('description'),['lfx','tac','landscape'])
+
+    def testMatchOrder(self):
+        pipeline = MergePipeline(config=Config())
+        self.assertEqual(pipeline.matchOrder(['tac','lfx','landscape']),['landscape','tac','lfx'])
+        self.assertEqual(pipeline.matchOrder(['tac','landscape']),['landscape','tac'])
+
+    def testInvalidSource(self):
+        config = Config()
+        config.syncMergePrecedence = {'*': ['lfx','crunchbase']}
+        with self.assertRaises(ValueError):
+            MergePipeline(config=config)
+        with self.assertRaises(ValueError):
+            MergePipeline(config=Config(),base='crunchbase')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import logging
+import tempfile
+import os
+
+from lfx_landscape_tools.outputfiles import OutputFiles
+
+class TestOutputFiles(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    def testWrite(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'landscape.yml')
+            files = OutputFiles()
+            self.assertTrue(files.write(filename,'name: test\n'))
+            os.utime(filename,(0,0))
+            self.assertFalse(files.write(filename,'name: test\n'))
+            self.assertEqual(os.path.getmtime(filename),0)
+            # same size, different contents
+            self.assertTrue(files.write(filename,'name: tset\n'))
+            with open(filename) as fp:
+                self.assertEqual(fp.read(),'name: tset\n')
+            self.assertEqual(files.written,2)
+            self.assertEqual(files.skipped,1)
+
+    def testWriteEncodingErrors(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'landscape.yml')
+            files = OutputFiles()
+            self.assertTrue(files.write(filename,'name: t\udc80est\n',errors='ignore'))
+            self.assertFalse(files.write(filename,'name: test\n'))
+
+    def testStream(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'landscape.yml')
+            with open(filename,'w') as fp:
+                fp.write('name: test\n')
+            os.chmod(filename,0o640)
+            files = OutputFiles()
+            with files.stream(filename,encoding='utf8') as fileobject:
+                fileobject.write('name: ')
+                fileobject.write('changed\n')
+            with open(filename) as fp:
+                self.assertEqual(fp.read(),'name: changed\n')
+            self.assertEqual(os.stat(filename).st_mode & 0o777,0o640)
+            self.assertEqual(os.listdir(tempdir),['landscape.yml'])
+
+            os.utime(filename,(0,0))
+            with files.stream(filename,encoding='utf8') as fileobject:
+                fileobject.write('name: changed\n')
+            self.assertEqual(os.path.getmtime(filename),0)
+            self.assertEqual(os.listdir(tempdir),['landscape.yml'])
+            self.assertEqual(files.written,1)
+            self.assertEqual(files.skipped,1)
+
+    def testStreamNewFile(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'dog.svg')
+            umask = os.umask(0o022)
+            try:
+                OutputFiles().write(filename,'<svg/>')
+            finally:
+                os.umask(umask)
+            self.assertEqual(os.stat(filename).st_mode & 0o777,0o644)
+            self.assertEqual(os.listdir(tempdir),['dog.svg'])
+
+    def testStreamNewFileKeepsUmask(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            umask = os.umask(0o027)
+            try:
+                OutputFiles().write(os.path.join(tempdir,'dog.svg'),'<svg/>')
+                self.assertEqual(os.umask(0o027),0o027)
+            finally:
+                os.umask(umask)
+            self.assertEqual(os.stat(os.path.join(tempdir,'dog.svg')).st_mode & 0o777,0o640)
+
+    def testStreamError(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'landscape.yml')
+            with open(filename,'w') as fp:
+                fp.write('name: test\n')
+            files = OutputFiles()
+            with self.assertRaises(RuntimeError):
+                with files.stream(filename,encoding='utf8') as fileobject:
+                    fileobject.write('name: ')
+                    raise RuntimeError('crashed mid write')
+            with open(filename) as fp:
+                self.assertEqual(fp.read(),'name: test\n')
+            self.assertEqual(os.listdir(tempdir),['landscape.yml'])
+            self.assertEqual(files.written,0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import responses
+import requests
+import logging
+
+from lfx_landscape_tools.lfxapiclient import LFXAPIClient
+from lfx_landscape_tools.projectdirectory import ProjectDirectory
+from lfx_landscape_tools.httpsession import HTTPSession
+
+class TestProjectDirectory(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+
+    @responses.activate
+    def testLookupFromBulkListing(self):
+        listing = responses.add(
+            method=responses.GET,
+            url=LFXAPIClient().pageURL(ProjectDirectory.listingEndpointURL),
+            json={
+                "Data": [
+                    {"Name": "Academy Software Foundation (ASWF)", "ProjectID": "a09410000182dD2AAI", "Slug": "aswf"},
+                    {"Name": "OpenCue", "ProjectID": "a092M00001IV4RfQAL", "Slug": "opencue"}
+                ],
+                "Metadata": {
+                    "Offset": 0,
+                    "PageSize": 2000,
+                    "TotalSize": 2
+                }
+            })
+
+        with HTTPSession.shared().cache_disabled():
+            directory = ProjectDirectory()
+            self.assertEqual(directory.bySlug('aswf').get('ProjectID'),'a09410000182dD2AAI')
+            self.assertEqual(directory.byProjectID('a092M00001IV4RfQAL').get('Slug'),'opencue')
+            self.assertEqual(len(directory),2)
+        self.assertEqual(listing.call_count,1)
+
+    @responses.activate
+    def testLookupFallbackOnMiss(self):
+        responses.add(
+            method=responses.GET,
+            url=LFXAPIClient().pageURL(ProjectDirectory.listingEndpointURL),
+            json={
+                "Data": [],
+                "Metadata": {
+                    "Offset": 0,
+                    "PageSize": 2000,
+                    "TotalSize": 0
+                }
+            })
+        single = responses.add(
+            method=responses.GET,
+            url=ProjectDirectory.singleSlugEndpointURL.format('aswf'),
+            json={
+                "Data": [
+                    {"Name": "Academy Software Foundation (ASWF)", "ProjectID": "a09410000182dD2AAI", "Slug": "aswf"}
+                ],
+                "Metadata": {
+                    "Offset": 0,
+                    "PageSize": 100,
+                    "TotalSize": 1
+                }
+            })
+        missing = responses.add(
+            method=responses.GET,
+            url=ProjectDirectory.singleSlugEndpointURL.format('nope'),
+            json={
+                "Data": [],
+                "Metadata": {
+                    "Offset": 0,
+                    "PageSize": 100,
+                    "TotalSize": 0
+                }
+            })
+
+        with HTTPSession.shared().cache_disabled():
+            directory = ProjectDirectory()
+            self.assertEqual(directory.bySlug('aswf').get('ProjectID'),'a09410000182dD2AAI')
+            self.assertEqual(directory.byProjectID('a09410000182dD2AAI').get('Slug'),'aswf')
+            self.assertIsNone(directory.bySlug('nope'))
+            self.assertIsNone(directory.bySlug('nope'))
+        self.assertEqual(single.call_count,1)
+        self.assertEqual(missing.call_count,1)
+
+    @responses.activate
+    def testLookupBulkListingFails(self):
+        responses.add(
+            method=responses.GET,
+            url=ProjectDirectory.singleProjectEndpointURL.format('a09410000182dD2AAI'),
+            json={
+                "Data": [
+                    {"Name": "Academy Software Foundation (ASWF)", "ProjectID": "a09410000182dD2AAI", "Slug": "aswf"}
+                ]
+            })
+
+        with HTTPSession.shared().cache_disabled():
+            directory = ProjectDirectory()
+            self.assertEqual(directory.byProjectID('a09410000182dD2AAI').get('Slug'),'aswf')
+            self.assertIsNone(directory.bySlug(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import tempfile
+import os
+import logging
+
+from lfx_landscape_tools.recordstate import RecordState
+
+class TestRecordState(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name,'state','lfxprojects.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testUnchanged(self):
+        state = RecordState(self.filename,context=['aswf'])
+        self.assertFalse(state.unchanged('opencue',{'Name': 'OpenCue', 'Status': 'Active'}))
+        state.save()
+
+        state = RecordState(self.filename,context=['aswf'])
+        self.assertEqual(len(state),1)
+        self.assertTrue(state.unchanged('opencue',{'Status': 'Active', 'Name': 'OpenCue'}))
+        self.assertFalse(state.unchanged('opencue',{'Name': 'OpenCue', 'Status': 'Archived'}))
+        self.assertFalse(state.unchanged('openexr',{'Name': 'OpenEXR'}))
+
+    def testContextChanged(self):
+        state = RecordState(self.filename,context=['aswf'])
+        state.unchanged('opencue',{'Name': 'OpenCue'},context='ASWF')
+        state.save()
+
+        self.assertFalse(RecordState(self.filename,context=['aswf', True]).unchanged('opencue',{'Name': 'OpenCue'},context='ASWF'))
+        self.assertFalse(RecordState(self.filename,context=['aswf']).unchanged('opencue',{'Name': 'OpenCue'},context='Parent'))
+        self.assertTrue(RecordState(self.filename,context=['aswf']).unchanged('opencue',{'Name': 'OpenCue'},context='ASWF'))
+
+    def testSaveOnlyKeepsRecordsSeen(self):
+        state = RecordState(self.filename)
+        state.unchanged('opencue',{'Name': 'OpenCue'})
+        state.unchanged('openexr',{'Name': 'OpenEXR'})
+        state.save()
+
+        state = RecordState(self.filename)
+        state.unchanged('opencue',{'Name': 'OpenCue'})
+        state.save()
+        self.assertEqual(len(RecordState(self.filename)),1)
+
+    def testKeepItems(self):
+        state = RecordState(self.filename)
+        state.unchanged('opencue',{'Name': 'OpenCue'})
+        state.keep('opencue',{'item': {'name': 'OpenCue'}})
+        state.keep('openexr',{'item': {'name': 'OpenEXR'}})
+        self.assertIsNone(state.item('opencue'))
+        state.save()
+
+        # only kept for the records seen
+        state = RecordState(self.filename)
+        self.assertEqual(state.item('opencue'),{'item': {'name': 'OpenCue'}})
+        self.assertIsNone(state.item('openexr'))
+
+    def testStateFileWithoutItems(self):
+        os.makedirs(os.path.dirname(self.filename))
+        with open(self.filename,'w') as fp:
+            fp.write('{"opencue": "abc"}')
+        self.assertEqual(len(RecordState(self.filename)),0)
+
+    def testInvalidStateFile(self):
+        os.makedirs(os.path.dirname(self.filename))
+        with open(self.filename,'w') as fp:
+            fp.write('not json')
+        self.assertEqual(len(RecordState(self.filename)),0)
+
+if __name__ == '__main__':
+    unittest.main()
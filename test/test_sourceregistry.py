@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#
+# Copyright this project and it's contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# encoding=utf8
+
+import unittest
+import responses
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lfx_landscape_tools.config import Config
+from lfx_landscape_tools.member import Member
+from lfx_landscape_tools.members import Members
+from lfx_landscape_tools.sourceregistry import SourceRegistry
+
+class CountingMembers(Members):
+
+    loads = 0
+
+    def processConfig(self, config):
+        pass
+
+    def loadData(self):
+        CountingMembers.loads += 1
+        member = Member()
+        member.name = 'OpenCue'
+        member.second_path = ['Project Group / ASWF']
+        member.extra = {'annotations': {'chair': 'Jane Doe'}}
+        self.members.append(member)
+
+class SlowMembers(Members):
+
+    delay = 0.3
+
+    def processConfig(self, config):
+        pass
+
+    def loadData(self):
+        time.sleep(self.delay)
+
+class OtherSlowMembers(SlowMembers):
+    pass
+
+class FailingMembers(SlowMembers):
+
+    def loadData(self):
+        raise ValueError("Cannot load")
+
+class TestSourceRegistry(unittest.TestCase):
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("debug.log",mode="w"),
+        ]
+    )
+
+    def setUp(self):
+        logging.getLogger().debug("Running {}".format(unittest.TestCase.id(self)))
+        with open("{}/data.yml".format(os.path.dirname(__file__)), 'r', encoding="utf8", errors='ignore') as fileobject:
+            responses.get('https://raw.githubusercontent.com/cncf/landscape2/refs/heads/main/docs/config/data.yml', body=fileobject.read())
+        CountingMembers.loads = 0
+
+    @responses.activate
+    def testGetLoadsOnce(self):
+        sources = SourceRegistry(Config())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            loaded = list(executor.map(lambda i: sources.get(CountingMembers),range(4)))
+        self.assertEqual(CountingMembers.loads,1)
+        for members in loaded:
+            self.assertIs(members,loaded[0])
+
+    @responses.activate
+    def testClone(self):
+        sources = SourceRegistry(Config())
+        clone = sources.clone(CountingMembers)
+        clone.members[0].name = 'OpenEXR'
+        clone.members[0].second_path.append('PMO Managed / All')
+        clone.members[0].extra['annotations']['chair'] = 'John Doe'
+
+        original = sources.get(CountingMembers)
+        self.assertEqual(CountingMembers.loads,1)
+        self.assertIsNot(clone,original)
+        self.assertEqual(original.members[0].name,'OpenCue')
+        self.assertEqual(original.members[0].second_path,['Project Group / ASWF'])
+        self.assertEqual(original.members[0].extra['annotations']['chair'],'Jane Doe')
+        self.assertIs(clone.members[0].itemschema,original.members[0].itemschema)
+
+    @responses.activate
+    def testLoadConcurrently(self):
+        for mode in ['threads','asyncio']:
+            with self.subTest(mode=mode):
+                sources = SourceRegistry(Config())
+                start = time.perf_counter()
+                loaded = sources.load([SlowMembers,OtherSlowMembers,CountingMembers],mode=mode)
+                self.assertLess(time.perf_counter() - start,0.55)
+                self.assertIsInstance(loaded[0],SlowMembers)
+                self.assertIsInstance(loaded[1],OtherSlowMembers)
+                self.assertIs(loaded[2],sources.get(CountingMembers))
+                self.assertGreaterEqual(sources.loadTimes[SlowMembers],0.3)
+                self.assertGreaterEqual(sources.loadTimes[OtherSlowMembers],0.3)
+
+    @responses.activate
+    def testLoadSerial(self):
+        sources = SourceRegistry(Config())
+        start = time.perf_counter()
+        sources.load([SlowMembers,OtherSlowMembers],mode='serial')
+        self.assertGreaterEqual(time.perf_counter() - start,0.6)
+
+    @responses.activate
+    def testLoadError(self):
+        for mode in ['threads','asyncio','serial']:
+            with self.subTest(mode=mode):
+                sources = SourceRegistry(Config())
+                with self.assertRaises(ValueError):
+                    sources.load([FailingMembers,CountingMembers],mode=mode)
+        with self.assertRaises(ValueError):
+            SourceRegistry(Config()).load([CountingMembers],mode='processes')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ import responses
 import requests
 import logging
 import json
+import os
 
 from lfx_landscape_tools.config import Config
 from lfx_landscape_tools.cli import Cli
@@ -20,6 +21,9 @@ from lfx_landscape_tools.lfxmembers import LFXMembers
 from lfx_landscape_tools.landscapemembers import LandscapeMembers
 from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.deadline import Deadline
+from lfx_landscape_tools.outputfiles import OutputFiles
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
 
@@ -51,7 +55,7 @@ class TestSVGLogo(unittest.TestCase):
             body='this is image data'
             )
 
-        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file:
+        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file, HTTPSession.shared().cache_disabled():
             self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
 
     @responses.activate
@@ -62,7 +66,7 @@ class TestSVGLogo(unittest.TestCase):
             body='this is image data'
             )
 
-        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file:
+        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file, HTTPSession.shared().cache_disabled():
             self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg").filename('privée')),'privee.svg')
     
     @responses.activate
@@ -73,7 +77,7 @@ class TestSVGLogo(unittest.TestCase):
             body=b'this is image data'
             )
 
-        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file:
+        with unittest.mock.patch("lfx_landscape_tools.svglogo.open", unittest.mock.mock_open(read_data="data")) as mock_file, HTTPSession.shared().cache_disabled():
             self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg").filename('北京数悦铭金技术有限公司')),'bei_jing_shu_yue_ming_jin_ji_zhu_you_xian_gong_si.svg')
         
     def testHostLogoContainsPNG(self):
@@ -96,7 +100,56 @@ class TestSVGLogo(unittest.TestCase):
             body=b'this is image data'
             )
 
-        self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
+        with HTTPSession.shared().cache_disabled():
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
+
+    @responses.activate(registry=responses.registries.OrderedRegistry)
+    def testHostLogoGivesUpOnRepeatedChunkedEncodingErrorException(self):
+        for attempt in range(SVGLogo.attempts):
+            responses.add(
+                method=responses.GET,
+                url='https://someurl.com/boom.svg',
+                body=requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead(55849 bytes read, 19919 more expected)")
+            )
+
+        with HTTPSession.shared().cache_disabled():
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"")
+        self.assertEqual(len(responses.calls),SVGLogo.attempts)
+
+    @responses.activate
+    def testHostLogoOnlyFromCacheNearDeadline(self):
+        responses.add(
+            method=responses.GET,
+            url='https://someurl.com/boom.svg',
+            body='this is image data'
+            )
+
+        with unittest.mock.patch.object(HTTPSession,'_shared',HTTPSession(backend='memory')), unittest.mock.patch.object(Deadline,'_shared',Deadline(1,reserve=2)):
+            logo = SVGLogo(url="https://someurl.com/boom.svg")
+            self.assertTrue(logo.skipped)
+            self.assertEqual(str(logo),"")
+            self.assertEqual(Deadline.shared().skipped,{'logos': ['https://someurl.com/boom.svg']})
+
+            Deadline.shared().reserve = 0
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
+            Deadline.shared().reserve = 2
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
+        self.assertEqual(len(responses.calls),1)
+
+    @responses.activate
+    def testHostLogoChangedAtSameURL(self):
+        responses.add(method=responses.GET,url='https://someurl.com/boom.svg',body='this is image data')
+        session = HTTPSession(backend='memory')
+        with unittest.mock.patch.object(HTTPSession,'_shared',session):
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is image data")
+
+        # a later run picks up the new logo published at the same URL
+        responses.reset()
+        responses.add(method=responses.GET,url='https://someurl.com/boom.svg',body='this is new image data')
+        with unittest.mock.patch.object(HTTPSession,'_shared',HTTPSession(backend=session.cache)):
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is new image data")
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"this is new image data")
+        self.assertEqual(len(responses.calls),1)
 
     def testHostLogoLogoisNone(self):
         self.assertEqual(str(SVGLogo()),'')
@@ -109,7 +162,8 @@ class TestSVGLogo(unittest.TestCase):
             body=UnicodeDecodeError('funnycodec', b'\x00\x00', 1, 2, 'This is just a fake reason!')
             )
         
-        self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.jpg")),"")
+        with HTTPSession.shared().cache_disabled():
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.jpg")),"")
 
     @responses.activate
     def testHostLogo404(self):
@@ -119,13 +173,42 @@ class TestSVGLogo(unittest.TestCase):
             body='{"error": "not found"}', status=404,
         )
 
-        self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"")
+        with HTTPSession.shared().cache_disabled():
+            self.assertEqual(str(SVGLogo(url="https://someurl.com/boom.svg")),"")
 
     @responses.activate
     def testSaveLogo(self):
         with tempfile.TemporaryDirectory() as tempdir:
             self.assertEqual(SVGLogo(contents="this is a file").save('dog',tempdir),'dog.svg')
+
+    @responses.activate
+    def testSaveLogoUnchanged(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            files = OutputFiles()
+            SVGLogo(contents="this is a file").save('dog',tempdir,files=files)
+            os.utime(os.path.join(tempdir,'dog.svg'),(0,0))
+            SVGLogo(contents="this is a file").save('dog',tempdir,files=files)
+            self.assertEqual(os.path.getmtime(os.path.join(tempdir,'dog.svg')),0)
+            SVGLogo(contents="this is a dog").save('dog',tempdir,files=files)
+            self.assertNotEqual(os.path.getmtime(os.path.join(tempdir,'dog.svg')),0)
+            with open(os.path.join(tempdir,'dog.svg')) as fp:
+                self.assertEqual(fp.read(),"this is a dog")
+            self.assertEqual(files.written,2)
+            self.assertEqual(files.skipped,1)
     
+    def testUnreadLogo(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir,'dog.svg')
+            with open(filename,'w') as fp:
+                fp.write("this is a dog")
+            logo = SVGLogo(filename=filename,digest='abc')
+            self.assertEqual(logo.pendingFile,filename)
+            self.assertEqual(logo.digest,'abc')
+            self.assertTrue(logo.isValid())
+            self.assertEqual(logo.filename('other'),'dog.svg')
+            self.assertEqual(str(logo),"this is a dog")
+            self.assertIsNone(logo.pendingFile)
+
     @responses.activate
     def testAutocropLogo(self):
         responses.add(
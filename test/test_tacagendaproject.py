@@ -10,6 +10,10 @@ import responses
 import requests
 import logging
 import os
+import json
+import re
+import time
+from urllib.parse import urlparse
 
 from lfx_landscape_tools.config import Config
 from lfx_landscape_tools.cli import Cli
@@ -21,6 +25,8 @@ from lfx_landscape_tools.landscapeoutput import LandscapeOutput
 from lfx_landscape_tools.svglogo import SVGLogo
 from lfx_landscape_tools.lfxprojects import LFXProjects
 from lfx_landscape_tools.tacagendaproject import TACAgendaProject
+from lfx_landscape_tools.httpsession import HTTPSession
+from lfx_landscape_tools.githubprojects import GitHubProjectsClient
 
 class TestTACAgendaProjects(unittest.TestCase):
     
@@ -200,7 +206,7 @@ class TestTACAgendaProjects(unittest.TestCase):
         config.artworkRepoUrl = "https://artwork.aswf.io/projects/{slug}"
         config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
         members = TACAgendaProject(config=config,loadData=False)
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             members.loadData()
         self.assertEqual(members.members[0].name,"D&I Working Group")
         self.assertEqual(members.members[0].extra.get('annotations',[]).get('chair'),'Carol Payne, Rachel Rose')
@@ -224,7 +230,7 @@ class TestTACAgendaProjects(unittest.TestCase):
         config.artworkRepoUrl = "https://artwork.aswf.io/projects/{slug}"
         config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
         members = TACAgendaProject(config=config,loadData=False)
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             members.loadData()
         self.assertEqual(members.members[0].name,"D&I Working Group")
         self.assertEqual(members.members[0].second_path,['SIG / dog'])
@@ -246,7 +252,7 @@ class TestTACAgendaProjects(unittest.TestCase):
         config.artworkRepoUrl = "https://artwork.aswf.io/projects/{slug}"
         config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
         members = TACAgendaProject(config=config,loadData=False)
-        with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+        with HTTPSession.shared().cache_disabled():
             members.loadData()
         self.assertEqual(members.members[0].name,"D&I Working Group")
         self.assertEqual(len(members.members),1)
@@ -266,7 +272,7 @@ class TestTACAgendaProjects(unittest.TestCase):
         config.artworkRepoUrl = "https://artwork.aswf.io/projects/{slug}"
         members = TACAgendaProject(config=config,loadData=False)
         with self.assertLogs(level='ERROR') as cm:
-            with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+            with HTTPSession.shared().cache_disabled():
                 members.loadData()
         self.assertEqual(cm.output, ['ERROR:root:Cannot find GitHub Project - ID: Org:'])        
         self.assertEqual(members.members,[])
@@ -288,11 +294,85 @@ class TestTACAgendaProjects(unittest.TestCase):
         config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
         members = TACAgendaProject(config=config,loadData=False)
         with self.assertLogs(level='ERROR') as cm:
-            with unittest.mock.patch('requests_cache.CachedSession', requests.Session):
+            with HTTPSession.shared().cache_disabled():
                 members.loadData()
         self.assertEqual(cm.output, ["ERROR:root:Invalid response from gh client: 'foo'"])
         self.assertEqual(members.members,[])
 
+    @responses.activate
+    def testLoadDataGraphQL(self):
+        responses.add(
+            method=responses.POST,
+            url=GitHubProjectsClient.graphqlURL,
+            json={"data": {"organization": {"projectV2": {"items": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [
+                {"content": {"title": "Some Other Item", "url": "https://github.com/AcademySoftwareFoundation/tac/issues/1", "labels": {"nodes": [{"name": "foo"}]}}},
+                {
+                    "content": {"title": "D&I Working Group", "url": "https://github.com/AcademySoftwareFoundation/tac/issues/473", "labels": {"nodes": [{"name": "2-annual-review"}]}},
+                    "field5": {"date": "2024-12-11"},
+                    "field6": {"text": "https://projectadmin.lfx.linuxfoundation.org/project/a092M00001KWjDZQA1/collaboration/committees/ac9cbe7f-0dc8-4be0-b404-cb7b9b0bb22f"},
+                    "field7": {"name": "dog"}
+                }
+            ]}}}}})
+
+        config = Config()
+        config.slug = 'aswf'
+        config.projectsAssignSIGs = True
+        config.tacAgendaProjectClient = 'graphql'
+        config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
+        members = TACAgendaProject(config=config,loadData=False)
+        with HTTPSession.shared().cache_disabled():
+            members.loadData()
+        self.assertEqual(members.members[0].name,"D&I Working Group")
+        self.assertEqual(members.members[0].second_path,['SIG / dog'])
+        self.assertEqual(members.members[0].extra.get('annotations',[]).get('chair'),'Carol Payne, Rachel Rose')
+        self.assertEqual(members.members[0].extra.get('annotations',[]).get('next_annual_review_date'),'2024-12-11')
+        self.assertEqual(len(members.members),1)
+
+    @responses.activate
+    def testLoadDataGraphQLError(self):
+        responses.add(method=responses.POST,url=GitHubProjectsClient.graphqlURL,json={"errors": [{"message": "Bad credentials"}]})
+
+        config = Config()
+        config.slug = 'aswf'
+        config.tacAgendaProjectClient = 'graphql'
+        config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
+        members = TACAgendaProject(config=config,loadData=False)
+        with self.assertLogs(level='ERROR') as cm:
+            with HTTPSession.shared().cache_disabled():
+                members.loadData()
+        self.assertEqual(cm.output, ["ERROR:root:Invalid response from GitHub GraphQL API: 'Bad credentials'"])
+        self.assertEqual(members.members,[])
+
+    @responses.activate
+    @unittest.mock.patch('subprocess.run')
+    def testLoadDataConcurrentLookups(self, mock_run):
+        items = []
+        for i in range(10):
+            items.append({"content": {"title": "Project {}".format(i), "url": "https://github.com/AcademySoftwareFoundation/tac/issues/{}".format(i)}, "labels": ["2-annual-review"], "pCC TSC Committee URL": "https://projectadmin.lfx.linuxfoundation.org/project/a092M00001KWjDZQA1/collaboration/committees/committee{}".format(i)})
+        mock_result = unittest.mock.Mock()
+        mock_result.stdout = json.dumps({"items": items})
+        mock_run.return_value = mock_result
+
+        def committeeMembers(request):
+            time.sleep(0.2)
+            committee = urlparse(request.url).path.split('/')[7]
+            return (200, {}, json.dumps({"Data": [{"FirstName": committee, "LastName": "chair", "Role": "Chair"}]}))
+        responses.add_callback(
+            method=responses.GET,
+            url=re.compile(r'https://api-gw.platform.linuxfoundation.org/project-service/v2/public/projects/a092M00001KWjDZQA1/committees/.*'),
+            callback=committeeMembers)
+
+        config = Config()
+        config.slug = 'aswf'
+        config.tacAgendaProjectUrl = "https://github.com/orgs/AcademySoftwareFoundation/projects/19/views/1" 
+        members = TACAgendaProject(config=config,loadData=False)
+        started = time.monotonic()
+        with HTTPSession.shared().cache_disabled():
+            members.loadData()
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertEqual([member.name for member in members.members],["Project {}".format(i) for i in range(10)])
+        self.assertEqual([member.extra.get('annotations',{}).get('chair') for member in members.members],["Committee{} Chair".format(i) for i in range(10)])
+
     def testProcessConfigTACAgendaProjectUrlInvalid(self):
         config = Config()
         config.slug = 'foobar'